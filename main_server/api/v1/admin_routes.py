@@ -1,9 +1,16 @@
-from typing import List
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from pydantic import BaseModel
 
 from main_server.domains.robots.robot import Robot
+from main_server.domains.tasks.task import TaskStatus
+from main_server.domains.zones.map_zone import MapZone
 from main_server.core_layer.fleet_management.fleet_manager import FleetManager
+from main_server.core_layer.task_management.task_manager import TaskManager
 from main_server.container import container
+from main_server.infrastructure.database.connection import Database
+from main_server.api.v1.streaming import ndjson_response, parse_task_cursor
 
 # FastAPI 라우터 생성
 router = APIRouter(
@@ -21,6 +28,182 @@ async def get_all_robots_status(
     all_robots_status = await fleet_manager.get_all_robot_status()
     return all_robots_status
 
+class ZoneActiveRequest(BaseModel):
+    active: bool
+
+@router.get("/zones", response_model=List[MapZone])
+async def get_map_zones():
+    """
+    지도 구역(금지 구역, 감속 구역 등) 목록을 조회합니다. (SR-014)
+    """
+    return await container.zone_repo.get_all()
+
+@router.patch("/zones/{zone_id}", response_model=MapZone)
+async def set_map_zone_active(zone_id: int, request: ZoneActiveRequest = Body(...)):
+    """
+    구역을 활성화/비활성화합니다. (SR-014)
+    변경은 목적지 간 이동 비용 표(영향을 받는 경로만 다시 계산)와 구역 진입/이탈 판정에 바로 반영됩니다.
+    """
+    if not await container.zone_repo.set_active(zone_id, request.active):
+        raise HTTPException(status_code=404, detail=f"Zone {zone_id} not found.")
+    await container.travel_costs.set_zone_active(zone_id, request.active)
+    container.fleet_manager.set_zone_active(zone_id, request.active)
+    return await container.zone_repo.get_by_id(zone_id)
+
+@router.get("/tasks/history")
+async def stream_task_history(
+    requester_id: Optional[int] = None,
+    status: Optional[TaskStatus] = None,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    task_manager: TaskManager = Depends(lambda: container.task_manager)
+):
+    """
+    전체 작업 이력을 최신순으로 NDJSON 스트림으로 조회합니다. (요청자, 상태로 필터링 가능)
+    limit을 생략하면 조건에 맞는 모든 작업을 서버 측 커서로 끝까지 내보냅니다.
+    """
+    before = parse_task_cursor(before_created_at, before_id)
+    return ndjson_response(task_manager.stream_task_history(
+        requester_id=requester_id, status=status, before=before, limit=limit
+    ))
+
+@router.get("/metrics/telemetry")
+async def get_telemetry_writer_stats():
+    """
+    로봇 텔레메트리 일괄 기록기의 통계를 조회합니다.
+    (coalesced: 합쳐져서 기록되지 않은 보고 수, written: 실제 기록된 행 수, retried: 실패 후 다음 배치에 합쳐 다시 기록한 행 수)
+    """
+    return container.telemetry_writer.stats
+
+@router.get("/metrics/websocket")
+async def get_websocket_stats():
+    """
+    관리자 WebSocket 클라이언트별 송신 통계를 조회합니다.
+    (sent: 전송, dropped: 큐 초과로 버림, replaced: 최신 값으로 교체됨)
+    """
+    return container.connection_manager.get_stats()
+
+@router.get("/metrics/fleet-stream")
+async def get_fleet_stream_stats():
+    """
+    관리자 대시보드 로봇 상태 스트림의 통계를 조회합니다.
+    (published: 상태 변경 수, frames: 전송된 델타 프레임 수, snapshots: 전송된 스냅샷 수)
+    """
+    return container.fleet_stream.stats
+
+@router.get("/metrics/ros-ingest")
+async def get_ros_ingest_stats():
+    """
+    ROS 로봇 상태 수신 큐의 통계를 조회합니다.
+    (dropped: 큐 초과로 버린 메시지 수, lag_ms_*: 수신부터 상태 반영까지의 지연)
+    """
+    return container.ros_bridge.get_stats()
+
+@router.get("/metrics/database")
+async def get_database_stats():
+    """
+    DB 연결 풀 상태와 지연 시간 통계를 조회합니다.
+    (pool: 사용 중/유휴 연결 수, acquire_wait: 연결 대기 시간, queries: 리포지토리 메서드별 지연 시간)
+    """
+    return Database.get_stats()
+
+@router.get("/metrics/sql-cache")
+async def get_sql_cache_stats():
+    """
+    리포지토리별 SQL 문 캐시의 적중(hits)/미스(misses) 횟수를 조회합니다.
+    """
+    return {
+        "robots": container.robot_repo.get_statement_stats(),
+        "tasks": container.task_repo.repository.get_statement_stats(),
+    }
+
+@router.get("/metrics/task-cache")
+async def get_task_cache_stats():
+    """
+    작업 ID 조회 캐시의 통계를 조회합니다.
+    (hits/misses: 적중/미스, evictions: 크기 제한으로 내보냄, expirations: TTL 만료)
+    """
+    return container.task_repo.get_stats()
+
+@router.get("/metrics/task-events")
+async def get_task_event_stats():
+    """
+    작업 상태 구독(SSE / long-poll) 허브의 통계를 조회합니다.
+    (subscribers: 현재 구독자 수, delivered: 전달한 이벤트 수, dropped: 큐 초과로 버린 이벤트 수)
+    """
+    return container.task_events.get_stats()
+
+@router.get("/metrics/action-plans")
+async def get_action_plan_stats():
+    """
+    Action Sequence 계획 캐시와 직렬화된 명령 페이로드 캐시의 통계를 조회합니다.
+    (locations: 적재된 목적지 수, plans / commands: 캐시 적중/미스 횟수)
+    """
+    return {
+        **container.action_planner.get_stats(),
+        "commands": container.robot_communicator.get_command_cache_stats(),
+    }
+
+@router.get("/metrics/travel-costs")
+async def get_travel_cost_stats():
+    """
+    목적지 간 이동 비용 표의 통계를 조회합니다.
+    (builds: Floyd–Warshall 전체 계산 수, cache_hits: 캐시 파일 사용 수, rows_recomputed: 구역 변경으로 다시 계산한 행 수)
+    """
+    return container.travel_costs.get_stats()
+
+@router.get("/metrics/zones")
+async def get_zone_engine_stats():
+    """
+    구역 엔진의 통계를 조회합니다.
+    (batches / poses: 판정한 텔레메트리 배치·위치 수, candidate_pairs: 경계 상자를 통과한 (로봇, 구역) 쌍 수,
+    enter / exit: 구역 진입·이탈 이벤트 수, check_ms_avg: 배치당 평균 판정 시간)
+    """
+    return container.zone_engine.get_stats()
+
+@router.get("/metrics/ai-inference")
+async def get_ai_inference_stats():
+    """
+    AI 추론 클라이언트의 통계를 조회합니다.
+    (channels: 채널 풀 크기, detect_batches: 객체 인식 배치 수 / 평균·최대 배치 크기 / 배치 안에서 합쳐진 요청 수)
+    """
+    return container.ai_service.get_stats()
+
+@router.get("/metrics/face-recognition")
+async def get_face_recognition_stats():
+    """
+    얼굴 인식 결과 캐시와 중복 요청 제거 통계를 조회합니다.
+    (hit_rate: 캐시 적중률, saved_rpcs: 캐시 적중 또는 진행 중인 호출 공유로 생략한 RPC 수, evictions: 크기 초과로 내보낸 항목 수,
+    by_employee: 인식된 직원 ID별 캐시의 적중/미스/내보냄 횟수)
+    """
+    return container.ai_service.get_face_cache_stats()
+
+@router.get("/metrics/ai-stream")
+async def get_ai_stream_stats():
+    """
+    AI 추론 결과 스트림의 통계를 조회합니다.
+    (dropped: 큐가 가득 차 버린 결과 수, missed: 재연결 중 서버가 다시 보내지 못한 결과 수,
+    server_restarts: 스트림 epoch가 바뀌어 순번을 초기화한 횟수, server_lag_ms: 서버 생성 → 수신 지연, queue_lag_ms: 수신 → 처리 지연, handlers: 결과 종류별 처리 수)
+    """
+    return {
+        **container.fleet_manager.ai_stream.get_stats(),
+        "handlers": container.fleet_manager.ai_handlers.get_stats(),
+    }
+
+@router.get("/metrics/video")
+async def get_video_stream_stats():
+    """
+    로봇 영상 수신 및 프레임 샘플링 통계를 조회합니다.
+    (receiver.listening: UDP 수신 중 여부 (VIDEO_STREAM_ENABLED가 꺼져 있거나 바인딩에 실패하면 false),
+    receiver.robots: 로봇별 완성/버림(dropped)/누락(missed)/늦은 패킷(late) 수와 drop_rate,
+    sampler: 객체 인식으로 보낸 프레임 비율(forward_rate)과 로봇별 주기(periodic)/장면 변화(scene_change)/건너뜀 수)
+    """
+    return {
+        "receiver": container.video_receiver.get_stats(),
+        "sampler": container.frame_sampler.get_stats(),
+    }
+
 @router.get('/logs')
 def get_system_logs():
     """
@@ -1,9 +1,15 @@
+import json
+from datetime import datetime
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, Body, HTTPException
+from fastapi import APIRouter, Depends, Body, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
-from main_server.domains.tasks.task import Task, TaskType
+from main_server import config
+from main_server.domains.tasks.task import Task, TaskType, TaskStatus
+from main_server.common.exceptions import InvalidDestinationException
 from main_server.core_layer.task_management.task_manager import TaskManager
 from main_server.container import container
+from main_server.api.v1.streaming import ndjson_response, parse_task_cursor
 
 # --- 요청 본문 모델 ---
 from pydantic import BaseModel
@@ -13,20 +19,34 @@ class CreateTaskRequest(BaseModel):
     requester_id: int
     details: Dict[str, Any] = {}
 
+class BulkCreateTaskResponse(BaseModel):
+    task_ids: List[int]
+
 # --- FastAPI 라우터 생성 ---
 router = APIRouter(
     prefix="/api/v1/employee",
     tags=["Employee"],
 )
 
-@router.post("/tasks", response_model=Task, status_code=201)
+@router.post(
+    "/tasks",
+    response_model=Task,
+    status_code=201,
+    responses={202: {"model": Task, "description": "작업이 저장되어 PENDING 상태로 배차를 기다림 "
+                                                   "(async 모드, 또는 sync 모드에서 가용 로봇이 없거나 대기 시간 초과)"}},
+)
 async def create_new_task(
+    response: Response,
     task_request: CreateTaskRequest = Body(...),
     task_manager: TaskManager = Depends(lambda: container.task_manager)
 ):
     """
     새로운 작업을 요청합니다. (간식, 배달 등) (SR-009)
-    TaskManager를 호출하여 작업을 생성하고 로봇 할당을 시도합니다.
+    TaskManager를 호출하여 작업을 저장하고 배차 대기열에 넣습니다.
+    - TASK_DISPATCH_MODE=sync: 디스패처의 배차 결과를 기다려 배정된(ASSIGNED) 작업을 201로 반환합니다.
+      가용 로봇이 없거나 TASK_SYNC_DISPATCH_TIMEOUT이 지나 아직 PENDING이면 202로 반환합니다.
+    - TASK_DISPATCH_MODE=async: 배차를 기다리지 않고 PENDING 작업을 202로 반환합니다.
+    202로 받은 작업의 배차 결과는 /tasks/{task_id}/events 또는 /tasks/{task_id}/wait로 확인합니다.
     """
     if not task_manager:
         raise HTTPException(status_code=503, detail="Task service is not available.")
@@ -37,11 +57,54 @@ async def create_new_task(
             requester_id=task_request.requester_id,
             details=task_request.details
         )
+        if created_task.status == TaskStatus.PENDING:
+            response.status_code = 202
         return created_task
+    except InvalidDestinationException as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         # 실제 운영 환경에서는 에러 로깅이 필요합니다.
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
+@router.post("/tasks/bulk", response_model=BulkCreateTaskResponse, status_code=202)
+async def create_tasks_in_bulk(
+    task_requests: List[CreateTaskRequest] = Body(..., min_length=1, max_length=config.TASK_BULK_MAX_SIZE),
+    task_manager: TaskManager = Depends(lambda: container.task_manager)
+):
+    """
+    여러 작업을 한 번에 요청합니다. (정기 간식 배달, 물품 이동 일괄 등록 등)
+    작업은 하나의 트랜잭션으로 생성되어 ID가 즉시 반환되며, 배차는 한 번에 묶어 비동기로 진행됩니다.
+    각 작업의 진행 상황은 /tasks/{task_id}/events 또는 /tasks/{task_id}/wait로 확인합니다.
+    """
+    if not task_manager:
+        raise HTTPException(status_code=503, detail="Task service is not available.")
+
+    try:
+        created_tasks = await task_manager.create_tasks([request.model_dump() for request in task_requests])
+        return BulkCreateTaskResponse(task_ids=[task.id for task in created_tasks])
+    except InvalidDestinationException as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+
+@router.get("/tasks/history")
+async def stream_my_task_history(
+    requester_id: int,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=10000),
+    task_manager: TaskManager = Depends(lambda: container.task_manager)
+):
+    """
+    요청자의 작업 이력을 최신순으로 NDJSON 스트림으로 조회합니다.
+    다음 페이지는 마지막 작업의 created_at, id를 before_created_at, before_id로 넘깁니다.
+    """
+    if not task_manager:
+        raise HTTPException(status_code=503, detail="Task service is not available.")
+
+    before = parse_task_cursor(before_created_at, before_id)
+    return ndjson_response(task_manager.stream_task_history(requester_id=requester_id, before=before, limit=limit))
+
 @router.get("/tasks/{task_id}", response_model=Optional[Task])
 async def get_task_status(
     task_id: int,
@@ -56,4 +119,48 @@ async def get_task_status(
     task = await task_manager.get_task_by_id(task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found.")
-    return task
\ No newline at end of file
+    return task
+
+@router.get("/tasks/{task_id}/wait", response_model=Task)
+async def wait_for_task_status_change(
+    task_id: int,
+    known_status: TaskStatus,
+    timeout: float = Query(30.0, gt=0, le=config.TASK_WATCH_TIMEOUT),
+    task_manager: TaskManager = Depends(lambda: container.task_manager)
+):
+    """
+    작업 상태가 known_status에서 바뀔 때까지 요청을 붙잡아 두었다가 작업을 반환합니다. (long-poll)
+    timeout초 안에 바뀌지 않으면 현재 작업을 그대로 반환하며, 클라이언트는 다시 요청합니다.
+    """
+    if not task_manager:
+        raise HTTPException(status_code=503, detail="Task service is not available.")
+
+    task = await task_manager.wait_for_task_change(task_id, known_status, timeout)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found.")
+    return task
+
+@router.get("/tasks/{task_id}/events")
+async def stream_task_events(
+    task_id: int,
+    task_manager: TaskManager = Depends(lambda: container.task_manager)
+):
+    """
+    작업 상태를 Server-Sent Events로 구독합니다.
+    연결 직후 현재 상태(status 이벤트)를 보내고, 이후 상태 전이(status)와 담당 로봇의 상태 변경(robot)마다
+    이벤트를 하나씩 push합니다. 작업이 종료 상태가 되면 스트림을 닫습니다.
+    """
+    if not task_manager:
+        raise HTTPException(status_code=503, detail="Task service is not available.")
+    if not await task_manager.get_task_by_id(task_id):
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found.")
+
+    async def body():
+        async for event in task_manager.watch_task(task_id):
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            data = event.data.model_dump_json() if event.kind == "status" else json.dumps(event.data)
+            yield f"event: {event.kind}\ndata: {data}\n\n"
+
+    return StreamingResponse(body(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
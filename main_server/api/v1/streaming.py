@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from main_server.domains.tasks.task_repository import TaskCursor
+
+
+def parse_task_cursor(before_created_at: Optional[datetime], before_id: Optional[int]) -> Optional[TaskCursor]:
+    """쿼리 파라미터로 받은 keyset 커서를 (created_at, id) 튜플로 변환합니다."""
+    if before_created_at is None and before_id is None:
+        return None
+    if before_created_at is None or before_id is None:
+        raise HTTPException(status_code=400, detail="before_created_at and before_id must be given together.")
+    return (before_created_at, before_id)
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """
+    모델을 한 줄에 하나씩 JSON으로 내보내는 NDJSON 스트리밍 응답을 만듭니다.
+    다음 페이지는 마지막 줄의 created_at, id를 before_created_at, before_id로 넘겨 이어서 조회합니다.
+    """
+    async def body():
+        async for item in items:
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
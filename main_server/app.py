@@ -7,7 +7,6 @@ from fastapi.staticfiles import StaticFiles
 from main_server.container import container
 from main_server.infrastructure.database.connection import Database
 from main_server.web.connection_manager import manager as connection_manager
-from main_server.infrastructure.communication.ros_bridge import ROSBridge
 
 # 전역 변수로 백그라운드 태스크 저장
 background_tasks = set()
@@ -23,14 +22,37 @@ async def startup_event():
     container.services()
     print("DI container and services initialized.")
 
-    # 3. 통신 서버(ROS 브리지)를 백그라운드 태스크로 시작
-    ros_bridge = ROSBridge(host=config.ROS_BRIDGE_HOST, port=config.ROS_BRIDGE_PORT, fleet_manager=container.fleet_manager)
-    bridge_task = asyncio.create_task(ros_bridge.start())
+    # 3. 목적지 테이블 / 로봇 상태 테이블 적재, 텔레메트리 일괄 기록기 및 관리자 상태 스트림 시작
+    await container.locations.load()
+    await container.travel_costs.load() # 목적지 간 이동 비용 표 (캐시 파일이 유효하면 재계산하지 않음)
+    await container.zone_engine.load() # 구역 진입/이탈 판정용 다각형 배열
+    await container.fleet_manager.load_fleet_state()
+    telemetry_task = asyncio.create_task(container.telemetry_writer.run())
+    background_tasks.add(telemetry_task)
+    fleet_stream_task = asyncio.create_task(container.fleet_stream.run())
+    background_tasks.add(fleet_stream_task)
+
+    # 4. 대기 작업 큐 적재 및 이벤트 기반 배차 디스패처 시작
+    await container.task_manager.load_pending_tasks()
+    dispatcher_task = asyncio.create_task(container.task_manager.run_dispatcher())
+    background_tasks.add(dispatcher_task)
+    container.task_manager.request_dispatch() # 시작 시점의 대기 작업 배차
+
+    # 5. 통신 서버(ROS 브리지)를 백그라운드 태스크로 시작
+    bridge_task = asyncio.create_task(container.ros_bridge.start())
     background_tasks.add(bridge_task)
 
-    # 4. AI 실시간 추론 결과 구독 시작
+    # 6. AI 실시간 추론 결과 구독 시작
     ai_stream_task = asyncio.create_task(container.fleet_manager.start_ai_stream())
     background_tasks.add(ai_stream_task)
+
+    # 7. 로봇 영상(UDP) 수신 및 프레임 샘플링 시작 (VIDEO_STREAM_ENABLED일 때만)
+    # 포트를 열지 못해도 영상 수신만 빠지고 나머지 서비스는 계속 시작합니다.
+    if config.VIDEO_STREAM_ENABLED:
+        try:
+            await container.video_receiver.start()
+        except OSError as e:
+            print(f"영상 스트림 수신을 시작하지 못했습니다 (UDP {config.VIDEO_STREAM_HOST}:{config.VIDEO_STREAM_PORT}): {e}")
     
     print("ROS Bridge server and AI Stream subscriber started.")
 
@@ -42,6 +64,13 @@ async def shutdown_event():
     
     await asyncio.gather(*background_tasks, return_exceptions=True)
     print("Background servers stopped.")
+
+    container.video_receiver.close()
+    await container.frame_sampler.close()
+    print("Video stream receiver closed.")
+
+    await container.ai_service.close()
+    print("AI inference channels closed.")
     
     await Database.close()
     print("Database pool closed.")
@@ -70,13 +99,19 @@ app.include_router(web_router.router) # 웹 UI 라우터 추가
 # --- WebSocket 엔드포인트 ---
 @app.websocket("/ws/admin/status")
 async def websocket_endpoint(websocket: WebSocket):
-    """관리자 페이지의 실시간 상태 업데이트를 위한 WebSocket 엔드포인트"""
+    """
+    관리자 페이지의 실시간 상태 업데이트를 위한 WebSocket 엔드포인트.
+    접속 시 전체 스냅샷을 보낸 뒤, 바뀐 필드만 담은 델타 프레임을 push합니다. (FleetStatusStream 참고)
+    """
     await connection_manager.connect(websocket)
+    container.fleet_stream.send_snapshot(websocket)
     try:
         while True:
-            # 현재는 클라이언트로부터 메시지를 받지 않고, 서버 푸시만 사용합니다.
             # receive_text()는 연결 유지를 위해 필요하며, 클라이언트가 연결을 닫으면 예외를 발생시킵니다.
-            await websocket.receive_text()
+            # 클라이언트가 프레임 누락(seq 불연속)을 감지하면 "snapshot"을 보내 전체 상태를 다시 받습니다.
+            message = await websocket.receive_text()
+            if message == "snapshot":
+                container.fleet_stream.send_snapshot(websocket)
     except WebSocketDisconnect:
         connection_manager.disconnect(websocket)
 
@@ -25,3 +25,9 @@ class TaskAssignmentException(ApplicationException):
     @property
     def message(self):
         return "Failed to assign the task."
+
+class InvalidDestinationException(ApplicationException):
+    """작업의 목적지를 좌표로 해석할 수 없을 때 발생하는 예외"""
+    @property
+    def message(self):
+        return "The task destination could not be resolved."
@@ -0,0 +1,44 @@
+"""
+같은 key에 대한 동시 요청이 하나의 실행 결과를 함께 기다리게 하는 in-flight 중복 제거기.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[V]):
+    """
+    key별로 진행 중인 실행(future)을 하나만 두고, 그 사이에 들어온 같은 key의 요청은 그 결과를 함께 받습니다.
+    - 실행이 끝나면(성공/실패 모두) key는 바로 제거되며, 결과를 보관하지는 않습니다. (보관은 TTLCache 등과 함께 사용)
+    - 기다리던 요청 하나가 취소되어도 공유 중인 실행은 취소되지 않습니다.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.stats: Dict[str, int] = {"calls": 0, "shared": 0}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[V]]) -> V:
+        """key에 대해 진행 중인 실행이 있으면 그 결과를, 없으면 func()를 실행한 결과를 반환합니다."""
+        future = self._calls.get(key)
+        if future is not None:
+            self.stats["shared"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(func())
+        self._calls[key] = future
+        self.stats["calls"] += 1
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 '처리되지 않음'으로 기록되지 않게 합니다.
+        if not future.cancelled():
+            future.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._calls), **self.stats}
@@ -0,0 +1,66 @@
+"""
+크기 제한(LRU)과 만료 시간(TTL)을 가진 인메모리 캐시.
+"""
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    최대 maxsize개의 항목을 보관하는 LRU 캐시. 각 항목은 ttl초가 지나면 만료됩니다. (ttl=None이면 만료되지 않음)
+    - 가득 찬 상태에서 새 항목을 넣으면 가장 오래 사용되지 않은 항목을 내보냅니다. (evictions)
+    - 만료된 항목은 조회 시점에 제거되며 미스로 집계됩니다. (expirations)
+    """
+    def __init__(self, maxsize: int, ttl: Optional[float], clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # 통계(JSON)에는 None으로 내보내고, 만료 시각 계산에는 무한대를 씁니다.
+        self._lifetime = math.inf if ttl is None else ttl
+        self._clock = clock
+        # key -> (만료 시각, 값). 뒤쪽일수록 최근에 사용된 항목입니다.
+        self._items: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        item = self._items.get(key)
+        if item is None:
+            self.stats["misses"] += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._items[key]
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    def set(self, key: Hashable, value: V):
+        """값을 캐시에 넣습니다. 이미 있는 키면 값과 만료 시각을 갱신합니다."""
+        if key in self._items:
+            self._items.move_to_end(key)
+        elif len(self._items) >= self.maxsize:
+            self._items.popitem(last=False)
+            self.stats["evictions"] += 1
+        self._items[key] = (self._clock() + self._lifetime, value)
+
+    def invalidate(self, key: Hashable):
+        """항목을 캐시에서 제거합니다."""
+        self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"size": len(self._items), "maxsize": self.maxsize, "ttl": self.ttl, **self.stats}
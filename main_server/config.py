@@ -14,6 +14,25 @@ DB_USER = os.getenv("DB_USER", "root")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
 DB_NAME = os.getenv("DB_NAME", "office_robot_db")
 DB_PORT = int(os.getenv("DB_PORT", 3306))
+# DB 연결 풀 크기 및 연결 재사용 주기 (초, -1이면 재생성하지 않음)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 5))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 20))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 3600))
+# 리포지토리별로 캐시할 SQL 문의 최대 개수
+SQL_STATEMENT_CACHE_SIZE = int(os.getenv("SQL_STATEMENT_CACHE_SIZE", 256))
+# 일괄 생성 시 다중 행 INSERT 한 문장에 넣을 최대 행 수
+SQL_INSERT_CHUNK_SIZE = int(os.getenv("SQL_INSERT_CHUNK_SIZE", 100))
+# 작업 이력 스트리밍 시 서버 측 커서에서 한 번에 읽어올 행 수
+TASK_STREAM_FETCH_SIZE = int(os.getenv("TASK_STREAM_FETCH_SIZE", 500))
+# ID 기준 작업 조회 캐시의 최대 항목 수와 만료 시간 (초)
+TASK_CACHE_MAX_SIZE = int(os.getenv("TASK_CACHE_MAX_SIZE", 1000))
+TASK_CACHE_TTL = float(os.getenv("TASK_CACHE_TTL", 30))
+# 일괄 작업 요청 한 번에 받을 수 있는 최대 작업 수
+TASK_BULK_MAX_SIZE = int(os.getenv("TASK_BULK_MAX_SIZE", 500))
+# 작업 상태 구독(SSE / long-poll): 구독자별 이벤트 큐 크기, 최대 대기 시간(초), SSE keepalive 주기(초)
+TASK_EVENT_QUEUE_SIZE = int(os.getenv("TASK_EVENT_QUEUE_SIZE", 16))
+TASK_WATCH_TIMEOUT = float(os.getenv("TASK_WATCH_TIMEOUT", 300))
+TASK_WATCH_KEEPALIVE = float(os.getenv("TASK_WATCH_KEEPALIVE", 15))
 
 # Database URL (SQLAlchemy 등에서 필요할 경우 사용)
 DATABASE_URL = f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
@@ -21,20 +40,116 @@ DATABASE_URL = f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PO
 # ROS Bridge configuration
 ROS_BRIDGE_HOST = os.getenv("ROS_BRIDGE_HOST", "localhost")
 ROS_BRIDGE_PORT = int(os.getenv("ROS_BRIDGE_PORT", 9090))
+# 토픽 구성: shared(/robot/commands, /robot/status, 기존 로봇 호환) 또는 per_robot(/<robot_name>/commands, /<robot_name>/status)
+ROS_TOPIC_LAYOUT = os.getenv("ROS_TOPIC_LAYOUT", "shared")
+# per_robot 구성에서 DB에 새로 등록된 로봇을 찾아 상태 토픽을 구독하는 주기 (초)
+ROS_ROBOT_SYNC_INTERVAL = float(os.getenv("ROS_ROBOT_SYNC_INTERVAL", 30))
+# 명령 메시지 인코딩: json, msgpack, cbor (상태 메시지는 항상 json)
+# rosbridge가 바이너리를 base64로 감싸므로 작은 상태 보고는 json 94 bytes -> msgpack/cbor 143 bytes로 커짐.
+# 액션 6개 명령 기준(scripts.bench_ros_codec): msgpack은 인코딩 20 -> 5 us, 본문 695 -> 607 bytes로 이득이고,
+# cbor는 본문은 615 bytes로 줄지만 인코딩이 json보다 느림(약 24 us)
+ROS_MESSAGE_ENCODING = os.getenv("ROS_MESSAGE_ENCODING", "json")
+# 로봇 상태 수신 큐의 최대 길이 (초과 시 가장 오래된 메시지를 버림) 및 한 번에 반영할 최대 메시지 수
+ROS_STATUS_QUEUE_DEPTH = int(os.getenv("ROS_STATUS_QUEUE_DEPTH", 2000))
+ROS_STATUS_MAX_BATCH_SIZE = int(os.getenv("ROS_STATUS_MAX_BATCH_SIZE", 100))
+# 경로(Action 계획) 단위로 캐시할 직렬화된 명령 페이로드의 최대 개수
+ROS_COMMAND_CACHE_SIZE = int(os.getenv("ROS_COMMAND_CACHE_SIZE", 256))
+
+# Robot telemetry write-behind configuration
+# 같은 로봇의 상태 보고를 합쳐서 DB(robots 테이블)에 기록하는 주기 (초)
+TELEMETRY_FLUSH_INTERVAL = float(os.getenv("TELEMETRY_FLUSH_INTERVAL", 1.0))
+# 한 번에 기록할 최대 로봇 수
+TELEMETRY_MAX_BATCH_SIZE = int(os.getenv("TELEMETRY_MAX_BATCH_SIZE", 200))
+# 기록 대기 큐의 최대 길이 (가득 차면 새 보고는 버려지고 다음 보고 때 기록됨)
+TELEMETRY_QUEUE_DEPTH = int(os.getenv("TELEMETRY_QUEUE_DEPTH", 5000))
+
+# Dispatch configuration
+# 배차 대상이 되기 위한 최소 배터리 잔량 (%)
+DISPATCH_MIN_BATTERY = float(os.getenv("DISPATCH_MIN_BATTERY", 20))
+# 로봇 위치 공간 인덱스(균일 격자)의 칸 크기 (맵 좌표 단위, m)
+SPATIAL_GRID_CELL_SIZE = float(os.getenv("SPATIAL_GRID_CELL_SIZE", 2.0))
+# 대기 작업을 로봇×작업 비용 행렬로 한 번에 배정할지 여부 (false면 작업별 탐욕 배정)
+DISPATCH_BATCH_MODE = os.getenv("DISPATCH_BATCH_MODE", "true").lower() == "true"
+# 일괄 배정 비용 가중치 (거리 1m와 같은 비용으로 환산한 값)
+DISPATCH_BATTERY_WEIGHT = float(os.getenv("DISPATCH_BATTERY_WEIGHT", 5.0))
+DISPATCH_PRIORITY_WEIGHT = float(os.getenv("DISPATCH_PRIORITY_WEIGHT", 20.0))
+# 작업 생성 응답 방식: sync(디스패처의 배차 결과를 기다려 201) 또는 async(저장 후 바로 PENDING 작업으로 202)
+TASK_DISPATCH_MODE = os.getenv("TASK_DISPATCH_MODE", "sync").lower()
+# sync 모드에서 작업 생성 요청이 배차 결과를 기다리는 최대 시간(초). 넘으면 PENDING 작업으로 202 응답
+TASK_SYNC_DISPATCH_TIMEOUT = float(os.getenv("TASK_SYNC_DISPATCH_TIMEOUT", 5))
+# 이동 비용 표를 사용할 때, 직선 거리로 먼저 고른 뒤 이동 비용으로 다시 비교할 후보 로봇 수
+DISPATCH_TRAVEL_CANDIDATES = int(os.getenv("DISPATCH_TRAVEL_CANDIDATES", 8))
+# 일괄 배정에서 도달할 수 없는 (로봇, 작업) 쌍에 매기는 비용 (이 비용의 배정은 반영하지 않음)
+DISPATCH_UNREACHABLE_COST = float(os.getenv("DISPATCH_UNREACHABLE_COST", 1e6))
+# 같은 경로의 Action Sequence 계획을 캐시할 최대 개수
+ACTION_PLAN_CACHE_SIZE = int(os.getenv("ACTION_PLAN_CACHE_SIZE", 256))
+
+# 목적지 간 이동 비용 표: 캐시 파일 경로, 감속 구역 통과 시 비용 배율, 간선 최대 길이 (0이면 제한 없음)
+NAV_COST_CACHE_PATH = os.getenv("NAV_COST_CACHE_PATH", "main_server/data/travel_costs.npz")
+NAV_SLOW_ZONE_FACTOR = float(os.getenv("NAV_SLOW_ZONE_FACTOR", 2.0))
+NAV_MAX_EDGE_LENGTH = float(os.getenv("NAV_MAX_EDGE_LENGTH", 0))
 
 # AI Inference service configuration
 AI_INFERENCE_GRPC_HOST = os.getenv("AI_INFERENCE_GRPC_HOST", "localhost")
 AI_INFERENCE_GRPC_PORT = int(os.getenv("AI_INFERENCE_GRPC_PORT", 50051))
+# gRPC 채널 풀 크기 (채널마다 별도의 HTTP/2 연결을 사용)
+AI_GRPC_CHANNEL_POOL_SIZE = int(os.getenv("AI_GRPC_CHANNEL_POOL_SIZE", 2))
+# keepalive ping 주기 / 응답 대기 시간 (ms). 유휴 연결이 중간 장비에서 끊기는 것을 막고 끊긴 연결을 빨리 감지함
+AI_GRPC_KEEPALIVE_TIME_MS = int(os.getenv("AI_GRPC_KEEPALIVE_TIME_MS", 30000))
+AI_GRPC_KEEPALIVE_TIMEOUT_MS = int(os.getenv("AI_GRPC_KEEPALIVE_TIMEOUT_MS", 10000))
+# 단건/배치 추론 호출의 제한 시간 (초)
+AI_GRPC_DEADLINE = float(os.getenv("AI_GRPC_DEADLINE", 2.0))
+# UNAVAILABLE 응답 시 재시도를 포함한 최대 시도 횟수 (gRPC service config retryPolicy)
+AI_GRPC_MAX_ATTEMPTS = int(os.getenv("AI_GRPC_MAX_ATTEMPTS", 3))
+# 동시에 들어온 객체 인식 요청을 모으는 시간 (ms)과 배치 최대 크기. 대기 시간이 0이면 배치 없이 단건 호출함
+AI_DETECT_BATCH_WINDOW_MS = float(os.getenv("AI_DETECT_BATCH_WINDOW_MS", 5))
+AI_DETECT_BATCH_MAX_SIZE = int(os.getenv("AI_DETECT_BATCH_MAX_SIZE", 32))
+# 얼굴 인식 결과 캐시: 유효 시간 (초, 0이면 캐시하지 않음)과 최대 개수 (이미지 ID별 / 직원 ID별 각각)
+AI_FACE_CACHE_TTL = float(os.getenv("AI_FACE_CACHE_TTL", 5.0))
+AI_FACE_CACHE_SIZE = int(os.getenv("AI_FACE_CACHE_SIZE", 512))
+# 추론 결과 스트림: 처리 대기 큐 크기와 큐가 가득 찼을 때의 정책 (drop_oldest / drop_newest / block)
+AI_STREAM_QUEUE_SIZE = int(os.getenv("AI_STREAM_QUEUE_SIZE", 256))
+AI_STREAM_OVERFLOW_POLICY = os.getenv("AI_STREAM_OVERFLOW_POLICY", "drop_oldest").lower()
+# 스트림 재연결 대기 시간의 시작값과 상한 (초). 실패할 때마다 두 배로 늘리고 0 ~ 상한 사이에서 무작위로 고름
+AI_STREAM_RECONNECT_INITIAL = float(os.getenv("AI_STREAM_RECONNECT_INITIAL", 0.5))
+AI_STREAM_RECONNECT_MAX = float(os.getenv("AI_STREAM_RECONNECT_MAX", 30.0))
+# 스트림으로 받은 추론 결과를 하나하나 로그로 출력할지 여부 (카메라가 많으면 출력 비용이 커지므로 기본값은 끔)
+AI_STREAM_LOG_RESULTS = os.getenv("AI_STREAM_LOG_RESULTS", "false").lower() in ("1", "true", "yes")
 
 # Video Stream configuration
+# 로봇 영상 UDP 수신 사용 여부 (켜면 시작 시 VIDEO_STREAM_HOST:VIDEO_STREAM_PORT에 바인딩)
+VIDEO_STREAM_ENABLED = os.getenv("VIDEO_STREAM_ENABLED", "false").lower() in ("1", "true", "yes")
 VIDEO_STREAM_HOST = os.getenv("VIDEO_STREAM_HOST", "0.0.0.0")
 VIDEO_STREAM_PORT = int(os.getenv("VIDEO_STREAM_PORT", 54321))
+# UDP 수신 소켓의 커널 수신 버퍼 크기 (bytes). 이벤트 루프가 잠시 바쁠 때 커널에서 패킷이 버려지는 것을 줄임
+VIDEO_SOCKET_RCVBUF = int(os.getenv("VIDEO_SOCKET_RCVBUF", 4 * 1024 * 1024))
+# 로봇별 프레임 재조립 ring buffer: 슬롯 수와 프레임(JPEG) 최대 크기 (bytes). 로봇당 슬롯 수 × 최대 크기만큼 미리 할당함
+VIDEO_RING_SLOTS = int(os.getenv("VIDEO_RING_SLOTS", 4))
+VIDEO_MAX_FRAME_BYTES = int(os.getenv("VIDEO_MAX_FRAME_BYTES", 256 * 1024))
+# 프레임 하나의 최대 조각(UDP 패킷) 수와 영상을 받을 최대 로봇 수 (알 수 없는 robot_id로 메모리가 계속 할당되는 것을 막음)
+VIDEO_MAX_CHUNKS = int(os.getenv("VIDEO_MAX_CHUNKS", 256))
+VIDEO_MAX_ROBOTS = int(os.getenv("VIDEO_MAX_ROBOTS", 64))
+# 프레임 샘플링: 로봇별로 N번째 프레임마다 하나를 객체 인식으로 보냄 (0이면 영상 수신만 하고 보내지 않음)
+VIDEO_SAMPLE_EVERY_N = int(os.getenv("VIDEO_SAMPLE_EVERY_N", 15))
+# 직전에 보낸 프레임보다 JPEG 크기가 이 비율 이상 달라지면 장면이 바뀐 것으로 보고 바로 보냄 (0이면 사용 안 함)
+VIDEO_SCENE_CHANGE_RATIO = float(os.getenv("VIDEO_SCENE_CHANGE_RATIO", 0.25))
+# 동시에 진행할 수 있는 프레임 객체 인식 요청 수. 가득 차면 보낼 차례의 프레임도 건너뜀
+VIDEO_MAX_INFERENCE_IN_FLIGHT = int(os.getenv("VIDEO_MAX_INFERENCE_IN_FLIGHT", 8))
 
 # FastAPI Application Metadata
 APP_TITLE = "Office Robot Service API"
 APP_DESCRIPTION = "[v3.0] UI와 API가 통합된 오피스 로봇 서비스"
 APP_VERSION = "3.0.0"
 
+# WebSocket configurations
+# 클라이언트별 송신 대기 메시지 수 (초과 시 가장 오래된 메시지를 버림)
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", 100))
+# 메시지 하나의 전송 제한 시간 (초). 초과하면 느린 클라이언트로 보고 연결을 정리함
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", 5.0))
+
+# 관리자 대시보드 로봇 상태 스트림의 최대 프레임 전송 빈도 (Hz)
+ADMIN_STREAM_MAX_RATE_HZ = float(os.getenv("ADMIN_STREAM_MAX_RATE_HZ", 10))
+
 # Web configurations
 STATIC_FILES_DIR = "main_server/web/static"
 ADMIN_DASHBOARD_PATH = "/web/admin"
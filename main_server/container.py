@@ -4,6 +4,7 @@
 """
 from main_server.infrastructure.database.connection import Database
 from main_server.web.connection_manager import manager as connection_manager
+from main_server.web.fleet_stream import FleetStatusStream
 
 # --- Repository Instances ---
 from main_server.domains.robots.robot_repository import IRobotRepository
@@ -11,16 +12,29 @@ from main_server.infrastructure.database.repositories.mysql_robot_repository imp
 
 from main_server.domains.tasks.task_repository import ITaskRepository
 from main_server.infrastructure.database.repositories.mysql_task_repository import MySQLTaskRepository
+from main_server.infrastructure.database.repositories.cached_task_repository import CachedTaskRepository
+from main_server.infrastructure.database.telemetry_writer import TelemetryWriter
+
+from main_server.domains.locations.location_repository import ILocationRepository
+from main_server.infrastructure.database.repositories.mysql_location_repository import MySQLLocationRepository
+from main_server.domains.zones.zone_repository import IMapZoneRepository
+from main_server.infrastructure.database.repositories.mysql_map_zone_repository import MySQLMapZoneRepository
 
 # --- Communication Instances ---
 from main_server.infrastructure.communication.protocols import IRobotCommunicator
-from main_server.infrastructure.communication.ros_bridge import ROSBridgeCommunicator
+from main_server.infrastructure.communication.ros_bridge import ROSBridge, ROSBridgeCommunicator
+from main_server.infrastructure.communication.video_stream_receiver import VideoStreamReceiver
 
 # --- Core Service Instances ---
 from main_server.core_layer.ai_inference.grpc_inference_client import AIInferenceService
+from main_server.core_layer.ai_inference.frame_sampler import FrameSampler
 from main_server.core_layer.office_iot.iot_controller import IoTController
+from main_server.core_layer.fleet_management.action_planner import ActionPlanner, LocationTable
 from main_server.core_layer.fleet_management.fleet_manager import FleetManager
+from main_server.core_layer.navigation.travel_cost import TravelCostMatrix
+from main_server.core_layer.navigation.zone_engine import ZoneEngine
 from main_server.core_layer.task_management.task_manager import TaskManager
+from main_server.core_layer.task_management.task_events import TaskEventHub
 
 
 class Container:
@@ -33,12 +47,24 @@ class Container:
         # 이 변수들은 services()가 호출될 때 채워집니다.
         self.robot_repo = None
         self.task_repo = None
+        self.location_repo = None
+        self.locations = None
+        self.action_planner = None
+        self.zone_repo = None
+        self.travel_costs = None
+        self.zone_engine = None
+        self.telemetry_writer = None
         self.robot_communicator = None
         self.ai_service = None
         self.iot_controller = None
         self.fleet_manager = None
         self.task_manager = None
+        self.ros_bridge = None
         self.connection_manager = None
+        self.fleet_stream = None
+        self.task_events = None
+        self.frame_sampler = None
+        self.video_receiver = None
 
     def services(self):
         """
@@ -52,25 +78,53 @@ class Container:
         
         # 1. Infrastructure Layer
         self.robot_repo: IRobotRepository = MySQLRobotRepository()
-        self.task_repo: ITaskRepository = MySQLTaskRepository()
+        self.task_repo: ITaskRepository = CachedTaskRepository(MySQLTaskRepository()) # ID 조회 캐시
+        self.location_repo: ILocationRepository = MySQLLocationRepository()
+        self.zone_repo: IMapZoneRepository = MySQLMapZoneRepository()
+        self.telemetry_writer = TelemetryWriter(self.robot_repo) # 로봇 텔레메트리 일괄 기록기
         self.robot_communicator: IRobotCommunicator = ROSBridgeCommunicator()
         self.connection_manager = connection_manager # WebSocket 관리자
+        self.fleet_stream = FleetStatusStream(self.connection_manager) # 관리자 대시보드 상태 스트림
 
         # 2. Core Layer
+        self.task_events = TaskEventHub() # 작업 상태 변경 pub/sub 허브
         self.ai_service = AIInferenceService()
         self.iot_controller = IoTController()
+        self.locations = LocationTable(self.location_repo) # 시작 시 적재되는 목적지 좌표 테이블
+        self.action_planner = ActionPlanner(self.locations) # 작업 유형별 Action Sequence 템플릿
+        self.travel_costs = TravelCostMatrix(self.locations, self.zone_repo) # 목적지 간 최단 이동 비용 표
+        self.zone_engine = ZoneEngine(self.zone_repo) # 로봇 위치의 구역 진입/이탈 판정기
         
         self.fleet_manager = FleetManager(
             robot_repo=self.robot_repo,
             robot_communicator=self.robot_communicator,
             ai_service=self.ai_service,
-            connection_manager=self.connection_manager
+            status_stream=self.fleet_stream,
+            telemetry_writer=self.telemetry_writer,
+            task_events=self.task_events,
+            action_planner=self.action_planner,
+            travel_costs=self.travel_costs,
+            zone_engine=self.zone_engine
         )
         self.task_manager = TaskManager(
             task_repo=self.task_repo,
+            fleet_manager=self.fleet_manager,
+            task_events=self.task_events,
+            locations=self.locations
+        )
+        # 명령 전송과 상태 수신이 같은 ROS Bridge 연결을 사용합니다.
+        self.ros_bridge = ROSBridge(
+            communicator=self.robot_communicator,
             fleet_manager=self.fleet_manager
         )
 
+        # 로봇 영상 수신 -> 프레임 샘플링 -> 객체 인식 -> FleetManager 추론 결과 처리기
+        self.frame_sampler = FrameSampler(
+            detect=lambda image_id, image: self.ai_service.request_object_detection(image_id, image_data=image),
+            on_result=self.fleet_manager.handle_frame_detection
+        )
+        self.video_receiver = VideoStreamReceiver(on_frame=self.frame_sampler.on_frame)
+
         print("모든 서비스가 성공적으로 초기화되었습니다.")
         return self
 
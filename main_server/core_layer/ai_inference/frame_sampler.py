@@ -0,0 +1,88 @@
+"""
+메인 서버가 수신한 로봇 영상 프레임 중 일부만 골라 AI 서버의 객체 인식으로 보내는 샘플러.
+- 로봇별로 every_n 번째 프레임마다 하나를 보냅니다. (처음 받은 프레임은 바로 보냅니다)
+- 그 사이라도 장면이 크게 바뀐 프레임은 바로 보냅니다. MJPEG를 복호화하지 않고, 직전에 보낸 프레임과
+  JPEG 크기(압축 후 크기는 장면의 복잡도를 따라 변함)가 scene_change_ratio 이상 달라졌는지로 판단합니다.
+- 진행 중인 추론이 max_in_flight개면 보낼 차례의 프레임도 건너뛰어(busy) AI 서버에 요청이 쌓이지 않게 합니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from main_server import config
+
+# (이미지 ID, JPEG) -> 객체 인식 결과
+DetectFunc = Callable[[str, bytes], Awaitable[Dict[str, Any]]]
+# (robot_id, frame_id, 객체 인식 결과) -> None
+ResultHandler = Callable[[int, int, Dict[str, Any]], Awaitable[None]]
+
+
+class FrameSampler:
+    """VideoStreamReceiver의 on_frame으로 등록하여 완성된 프레임을 받습니다."""
+    def __init__(self, detect: DetectFunc, on_result: Optional[ResultHandler] = None,
+                 every_n: int = config.VIDEO_SAMPLE_EVERY_N,
+                 scene_change_ratio: float = config.VIDEO_SCENE_CHANGE_RATIO,
+                 max_in_flight: int = config.VIDEO_MAX_INFERENCE_IN_FLIGHT):
+        self.detect = detect
+        self.on_result = on_result
+        self.every_n = every_n
+        self.scene_change_ratio = scene_change_ratio
+        self.max_in_flight = max(1, max_in_flight)
+        # robot_id -> [마지막으로 보낸 뒤 받은 프레임 수, 마지막으로 보낸 프레임 크기]
+        self._robots: Dict[int, List[int]] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self.robot_stats: Dict[int, Dict[str, int]] = {}
+        self.stats: Dict[str, int] = {"errors": 0}
+
+    def on_frame(self, robot_id: int, frame_id: int, frame: memoryview):
+        """완성된 프레임 하나를 받아 객체 인식으로 보낼지 정합니다."""
+        if self.every_n <= 0:
+            return
+        state = self._robots.get(robot_id)
+        if state is None:
+            state = self._robots[robot_id] = [self.every_n - 1, 0]
+            self.robot_stats[robot_id] = {"frames": 0, "periodic": 0, "scene_change": 0, "skipped": 0, "busy": 0}
+        stats = self.robot_stats[robot_id]
+        stats["frames"] += 1
+
+        size = len(frame)
+        state[0] += 1
+        if state[0] >= self.every_n:
+            reason = "periodic"
+        elif self.scene_change_ratio > 0 and abs(size - state[1]) > self.scene_change_ratio * state[1]:
+            reason = "scene_change"
+        else:
+            stats["skipped"] += 1
+            return
+        if len(self._in_flight) >= self.max_in_flight:
+            stats["busy"] += 1
+            return
+
+        stats[reason] += 1
+        state[0], state[1] = 0, size
+        # ring buffer 슬롯은 곧 다음 프레임에 재사용되므로, 보내는 프레임만 복사합니다.
+        task = asyncio.get_running_loop().create_task(self._infer(robot_id, frame_id, bytes(frame)))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _infer(self, robot_id: int, frame_id: int, image: bytes):
+        try:
+            result = await self.detect(f"robot-{robot_id}/frame-{frame_id}", image)
+            if self.on_result is not None:
+                await self.on_result(robot_id, frame_id, result)
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"영상 프레임 객체 인식 실패 (로봇 {robot_id}, 프레임 {frame_id}): {e}")
+
+    async def close(self):
+        """진행 중인 추론 요청을 취소합니다."""
+        for task in list(self._in_flight):
+            task.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        frames = sum(s["frames"] for s in self.robot_stats.values())
+        forwarded = sum(s["periodic"] + s["scene_change"] for s in self.robot_stats.values())
+        return {"every_n": self.every_n, "scene_change_ratio": self.scene_change_ratio,
+                "in_flight": len(self._in_flight), "frames": frames, "forwarded": forwarded,
+                "forward_rate": round(forwarded / frames, 4) if frames else 0.0,
+                **self.stats, "robots": self.robot_stats}
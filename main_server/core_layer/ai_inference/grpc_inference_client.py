@@ -1,44 +1,156 @@
+import asyncio
+import itertools
+import json
 import grpc
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from main_server import config
+from main_server.common.single_flight import SingleFlight
+from main_server.common.ttl_cache import TTLCache
+from .inference_events import InferenceEvent, event_from_result
+from .request_batcher import MicroBatcher
 
 # Generated gRPC files
 from main_server.infrastructure.grpc import ai_inference_pb2
 from main_server.infrastructure.grpc import ai_inference_pb2_grpc
 
+GRPC_SERVICE_NAME = "ai_inference.AIInference"
+# 재시도 정책을 적용할 단건/배치 호출 (스트림 구독은 재연결로 처리하므로 제외)
+RETRYABLE_METHODS = ("DetectObjects", "RecognizeFaces", "DetectObjectsBatch")
+
+
+def build_channel_options(keepalive_time_ms: int = config.AI_GRPC_KEEPALIVE_TIME_MS,
+                          keepalive_timeout_ms: int = config.AI_GRPC_KEEPALIVE_TIMEOUT_MS,
+                          max_attempts: int = config.AI_GRPC_MAX_ATTEMPTS) -> List[tuple]:
+    """keepalive와 service config 재시도 정책(UNAVAILABLE만 재시도)을 담은 채널 옵션을 만듭니다."""
+    method_config: Dict[str, Any] = {"name": [{"service": GRPC_SERVICE_NAME, "method": m} for m in RETRYABLE_METHODS]}
+    if max_attempts >= 2:
+        method_config["retryPolicy"] = {
+            "maxAttempts": max_attempts,
+            "initialBackoff": "0.05s",
+            "maxBackoff": "0.5s",
+            "backoffMultiplier": 2,
+            "retryableStatusCodes": ["UNAVAILABLE"],
+        }
+    return [
+        ("grpc.keepalive_time_ms", keepalive_time_ms),
+        ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.enable_retries", 1),
+        ("grpc.service_config", json.dumps({"methodConfig": [method_config]})),
+        # 채널마다 별도의 연결을 맺도록 전역 subchannel 공유를 끕니다.
+        ("grpc.use_local_subchannel_pool", 1),
+    ]
+
+
+def _detection_to_dict(response: ai_inference_pb2.ObjectDetectionResponse) -> Dict[str, Any]:
+    return {
+        "object_name": response.object_name,
+        "confidence": response.confidence,
+        "box": {
+            "x": response.box.x,
+            "y": response.box.y,
+            "width": response.box.width,
+            "height": response.box.height
+        }
+    }
+
+
 class AIInferenceService:
     """
     gRPC를 통해 원격 AI Inference 서버와 통신하는 클라이언트 서비스.
+    - 여러 채널(연결)을 열어 두고 호출마다 돌아가며 사용합니다.
+    - 모든 채널에 keepalive와 재시도 정책을 설정하며, 단건/배치 호출에는 제한 시간(deadline)을 둡니다.
+    - 동시에 들어온 객체 인식 요청은 짧은 시간 동안 모아 DetectObjectsBatch 한 번으로 보냅니다.
+      (서버가 배치 호출을 지원하지 않으면 단건 호출로 전환합니다)
+    - 얼굴 인식은 같은 이미지에 대한 동시 요청이 RPC 하나를 함께 기다리며,
+      결과는 짧은 시간 동안 이미지 ID별 / 인식된 직원 ID별로 캐시됩니다.
     """
-    def __init__(self, host: str = config.AI_INFERENCE_GRPC_HOST, port: int = config.AI_INFERENCE_GRPC_PORT):
-        self.channel = grpc.aio.insecure_channel(f'{host}:{port}')
-        self.stub = ai_inference_pb2_grpc.AIInferenceStub(self.channel)
-        print(f"AI Inference gRPC Client 초기화 완료 (Connecting to {host}:{port}).")
+    def __init__(self, host: str = config.AI_INFERENCE_GRPC_HOST, port: int = config.AI_INFERENCE_GRPC_PORT,
+                 pool_size: int = config.AI_GRPC_CHANNEL_POOL_SIZE,
+                 deadline: float = config.AI_GRPC_DEADLINE,
+                 batch_window_ms: float = config.AI_DETECT_BATCH_WINDOW_MS,
+                 batch_max_size: int = config.AI_DETECT_BATCH_MAX_SIZE,
+                 face_cache_ttl: float = config.AI_FACE_CACHE_TTL,
+                 face_cache_size: int = config.AI_FACE_CACHE_SIZE,
+                 channel_options: Optional[List[tuple]] = None):
+        options = build_channel_options() if channel_options is None else channel_options
+        self.channels = [grpc.aio.insecure_channel(f'{host}:{port}', options=options) for _ in range(max(1, pool_size))]
+        self.stubs = [ai_inference_pb2_grpc.AIInferenceStub(channel) for channel in self.channels]
+        self._stub_cycle = itertools.cycle(self.stubs)
+        self.deadline = deadline
+        self.batch_supported = True
+        # 배치 key는 (이미지 ID, JPEG)입니다. 이미지 데이터를 key와 함께 넘기므로, 로봇 영상이 다시 시작되어
+        # 같은 이미지 ID의 다른 프레임이 배치에 함께 들어와도 서로 덮어쓰거나 하나로 합쳐지지 않습니다.
+        self._detect_batcher: Optional[MicroBatcher[Tuple[str, bytes], Dict[str, Any]]] = None
+        if batch_window_ms > 0 and batch_max_size > 1:
+            self._detect_batcher = MicroBatcher(self._detect_objects_batch, batch_window_ms / 1000, batch_max_size)
+        # 얼굴 인식: 진행 중인 요청 공유 + 이미지 ID별 / 직원 ID별 결과 캐시
+        self._face_requests: SingleFlight[Dict[str, Any]] = SingleFlight()
+        self._face_cache_enabled = face_cache_ttl > 0 and face_cache_size > 0
+        self._faces_by_image: TTLCache[Dict[str, Any]] = TTLCache(maxsize=face_cache_size, ttl=face_cache_ttl)
+        self._faces_by_employee: TTLCache[Dict[str, Any]] = TTLCache(maxsize=face_cache_size, ttl=face_cache_ttl)
+        print(f"AI Inference gRPC Client 초기화 완료 (Connecting to {host}:{port}, 채널 {len(self.channels)}개).")
 
-    async def request_object_detection(self, image_id: str) -> Dict[str, Any]:
+    def _stub(self) -> ai_inference_pb2_grpc.AIInferenceStub:
+        """채널 풀에서 다음 채널의 stub을 반환합니다."""
+        return next(self._stub_cycle)
+
+    async def request_object_detection(self, image_id: str, timeout: Optional[float] = None,
+                                       image_data: Optional[bytes] = None) -> Dict[str, Any]:
         """
         주어진 이미지 ID로 객체 인식을 요청합니다.
+        image_data(JPEG)를 주면 AI 서버가 영상을 찾지 않고 함께 보낸 이미지로 인식합니다. (메인 서버가 수신한 영상 프레임)
+        배치가 켜져 있으면 동시에 들어온 요청과 함께 DetectObjectsBatch로 보냅니다.
         """
-        request = ai_inference_pb2.ImageRequest(image_id=image_id)
-        response = await self.stub.DetectObjects(request)
-        
-        return {
-            "object_name": response.object_name,
-            "confidence": response.confidence,
-            "box": {
-                "x": response.box.x,
-                "y": response.box.y,
-                "width": response.box.width,
-                "height": response.box.height
-            }
-        }
+        timeout = self.deadline if timeout is None else timeout
+        if self._detect_batcher is not None and self.batch_supported:
+            return await self._detect_batcher.submit((image_id, image_data or b""), timeout)
+        return await self._detect_object(image_id, timeout, image_data)
+
+    async def _detect_object(self, image_id: str, timeout: float, image_data: Optional[bytes] = None) -> Dict[str, Any]:
+        request = ai_inference_pb2.ImageRequest(image_id=image_id, image_data=image_data or b"")
+        response = await self._stub().DetectObjects(request, timeout=timeout)
+        return _detection_to_dict(response)
+
+    async def _detect_objects_batch(self, keys: List[Tuple[str, bytes]], timeout: float) -> List[Any]:
+        """
+        이미지 여러 장의 객체 인식을 한 번에 요청합니다. (MicroBatcher의 배치 전송 함수, key: (이미지 ID, JPEG))
+        서버가 DetectObjectsBatch를 지원하지 않으면(UNIMPLEMENTED) 이후로는 단건 호출을 사용합니다.
+        """
+        image_ids = [image_id for image_id, _ in keys]
+        images = [image for _, image in keys]
+        if self.batch_supported:
+            request = ai_inference_pb2.ImageBatchRequest(image_ids=image_ids, image_data=images if any(images) else [])
+            try:
+                response = await self._stub().DetectObjectsBatch(request, timeout=timeout)
+                return [_detection_to_dict(result) for result in response.results]
+            except grpc.aio.AioRpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                self.batch_supported = False
+                print("AI 서버가 배치 객체 인식을 지원하지 않아 단건 호출로 전환합니다.")
+        return await asyncio.gather(*(self._detect_object(image_id, timeout, data)
+                                      for image_id, data in zip(image_ids, images)),
+                                    return_exceptions=True)
 
-    async def request_face_recognition(self, image_id: str) -> Dict[str, Any]:
+    async def request_face_recognition(self, image_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         주어진 이미지 ID로 얼굴 인식을 요청합니다. (Unary)
+        최근 face_cache_ttl초(AI_FACE_CACHE_TTL) 안에 인식한 이미지면 캐시된 결과를 반환하고,
+        같은 이미지에 대한 요청이 진행 중이면 새로 호출하지 않고 그 결과를 함께 받습니다.
+        (공유된 호출의 제한 시간은 처음 요청한 쪽의 것을 따릅니다)
         """
+        if self._face_cache_enabled:
+            cached = self._faces_by_image.get(image_id)
+            if cached is not None:
+                return dict(cached)
+        result = await self._face_requests.run(image_id, lambda: self._recognize_face(image_id, timeout))
+        return dict(result)
+
+    async def _recognize_face(self, image_id: str, timeout: Optional[float]) -> Dict[str, Any]:
         request = ai_inference_pb2.ImageRequest(image_id=image_id)
-        response = await self.stub.RecognizeFaces(request)
+        response = await self._stub().RecognizeFaces(request, timeout=self.deadline if timeout is None else timeout)
         
         result = {
             "person_type": response.person_type,
@@ -46,39 +158,69 @@ class AIInferenceService:
         }
         if response.HasField("employee_id"): 
             result["employee_id"] = response.employee_id
-            
+
+        if self._face_cache_enabled:
+            self._faces_by_image.set(image_id, result)
+        self.remember_face_recognition(result)
         return result
 
-    async def start_inference_stream(self, callback: Any):
+    def remember_face_recognition(self, result: Dict[str, Any]):
+        """인식된 직원의 얼굴 인식 결과를 직원 ID별 캐시에 기록합니다. (employee_id가 없으면 무시)"""
+        if self._face_cache_enabled and result.get("employee_id"):
+            self._faces_by_employee.set(result["employee_id"], result)
+
+    def get_recent_face_recognition(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """캐시 유효 시간 안에 인식된 직원의 마지막 얼굴 인식 결과를 반환합니다. (없으면 None)"""
+        if not self._face_cache_enabled:
+            return None
+        cached = self._faces_by_employee.get(employee_id)
+        return dict(cached) if cached is not None else None
+
+    async def stream_inference_results(self, resume_after_sequence: int = 0,
+                                       stream_epoch: int = 0) -> AsyncIterator[InferenceEvent]:
         """
         AI 서버로부터 실시간 추론 결과 스트림을 구독합니다. (Server Streaming)
-        결과가 수신될 때마다 전달된 콜백 함수를 호출합니다.
+        resume_after_sequence를 주면 서버는 보관 중인 결과 중 그 순번 이후의 것부터 보냅니다.
+        stream_epoch는 그 순번을 받은 스트림의 epoch이며, 서버가 그 사이 다시 시작되었으면 순번은 무시됩니다.
+        장시간 유지되는 구독이므로 제한 시간을 두지 않으며, 연결 상태는 keepalive로 확인합니다.
+        연결 오류는 그대로 전달되며, 재연결은 InferenceStreamConsumer가 담당합니다.
+        (재연결할 때마다 채널 풀의 다음 채널을 사용합니다)
         """
-        print("AI 추론 결과 스트림 구독 시작...")
+        request = ai_inference_pb2.StreamRequest(resume_after_sequence=resume_after_sequence, stream_epoch=stream_epoch)
+        call = self._stub().StreamInferenceResults(request)
         try:
-            async for result in self.stub.StreamInferenceResults(ai_inference_pb2.Empty()):
-                # 스트림에서 받은 데이터 처리
-                data = {
-                    "robot_id": result.robot_id,
-                }
-                
-                if result.HasField("object_detection"):
-                    data["type"] = "object_detection"
-                    data["content"] = {
-                        "object_name": result.object_detection.object_name,
-                        "confidence": result.object_detection.confidence
-                    }
-                elif result.HasField("face_recognition"):
-                    data["type"] = "face_recognition"
-                    data["content"] = {
-                        "person_type": result.face_recognition.person_type,
-                        "confidence": result.face_recognition.confidence
-                    }
-                
-                await callback(data)
-        except grpc.aio.AioRpcError as e:
-            print(f"AI 스트림 연결 오류: {e}")
-    
+            async for result in call:
+                # 메시지를 복사하지 않고 결과 종류에 맞는 이벤트로 감싸서 전달합니다.
+                yield event_from_result(result)
+        finally:
+            call.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """채널 수와 객체 인식 배치 통계를 반환합니다."""
+        return {
+            "channels": len(self.channels),
+            "batch_supported": self.batch_supported,
+            "detect_batches": self._detect_batcher.get_stats() if self._detect_batcher else None,
+        }
+
+    def get_face_cache_stats(self) -> Dict[str, Any]:
+        """
+        얼굴 인식 캐시와 in-flight 중복 제거 통계를 반환합니다.
+        (hit_rate: 이미지 ID 캐시 적중률, saved_rpcs: 캐시 적중 + 진행 중인 호출 공유로 생략한 RPC 수,
+        by_employee: 직원 ID별 캐시의 적중/미스/내보냄 횟수)
+        """
+        by_image = self._faces_by_image.get_stats()
+        in_flight = self._face_requests.get_stats()
+        lookups = by_image["hits"] + by_image["misses"]
+        return {
+            "hit_rate": round(by_image["hits"] / lookups, 4) if lookups else 0.0,
+            "saved_rpcs": by_image["hits"] + in_flight["shared"],
+            "rpcs": in_flight["calls"],
+            "in_flight": in_flight,
+            "by_image": by_image,
+            "by_employee": self._faces_by_employee.get_stats(),
+        }
+
     async def close(self):
-        """gRPC 채널을 닫습니다."""
-        await self.channel.close()
+        """gRPC 채널을 모두 닫습니다."""
+        await asyncio.gather(*(channel.close() for channel in self.channels))
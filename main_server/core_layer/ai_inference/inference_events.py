@@ -0,0 +1,157 @@
+"""
+스트림으로 받은 추론 결과(InferenceResult)의 이벤트 표현과 결과 종류별 처리기 등록부.
+- 이벤트는 protobuf 메시지를 그대로 감싸며(__slots__), 필드는 읽을 때 메시지에서 꺼냅니다.
+  중간 dict를 만들지 않으며, 결과 종류는 HasField를 반복하지 않고 WhichOneof 한 번으로 판별합니다.
+- 처리기는 결과 종류(event.type)별로 등록하며, if/elif 분기 없이 사전 조회 한 번으로 호출됩니다.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from main_server.infrastructure.grpc import ai_inference_pb2
+
+
+class InferenceEvent:
+    """추론 결과 이벤트의 공통 필드. 알 수 없는 종류(또는 결과가 비어 있는) 메시지도 이 타입으로 표현됩니다."""
+    __slots__ = ("message",)
+    type: Optional[str] = None
+
+    def __init__(self, message: ai_inference_pb2.InferenceResult):
+        self.message = message
+
+    @property
+    def robot_id(self) -> str:
+        return self.message.robot_id
+
+    @property
+    def sequence(self) -> int:
+        return self.message.sequence
+
+    @property
+    def timestamp_ms(self) -> int:
+        return self.message.timestamp_ms
+
+    @property
+    def stream_epoch(self) -> int:
+        return self.message.stream_epoch
+
+    @property
+    def content(self) -> Dict[str, Any]:
+        """결과 내용을 dict로 반환합니다. (로그 / JSON 응답용이며, 처리기에서는 속성을 직접 읽는 편이 빠릅니다)"""
+        return {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"robot_id": self.robot_id, "sequence": self.sequence, "timestamp_ms": self.timestamp_ms,
+                "type": self.type, "content": self.content}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(robot_id={self.robot_id!r}, sequence={self.sequence}, content={self.content})"
+
+
+class ObjectDetectionEvent(InferenceEvent):
+    __slots__ = ()
+    type = "object_detection"
+
+    @property
+    def object_name(self) -> str:
+        return self.message.object_detection.object_name
+
+    @property
+    def confidence(self) -> float:
+        return self.message.object_detection.confidence
+
+    @property
+    def box(self) -> ai_inference_pb2.BoundingBox:
+        return self.message.object_detection.box
+
+    @property
+    def content(self) -> Dict[str, Any]:
+        detection = self.message.object_detection
+        return {"object_name": detection.object_name, "confidence": detection.confidence}
+
+
+class FaceRecognitionEvent(InferenceEvent):
+    __slots__ = ()
+    type = "face_recognition"
+
+    @property
+    def person_type(self) -> str:
+        return self.message.face_recognition.person_type
+
+    @property
+    def confidence(self) -> float:
+        return self.message.face_recognition.confidence
+
+    @property
+    def employee_id(self) -> Optional[str]:
+        face = self.message.face_recognition
+        return face.employee_id if face.HasField("employee_id") else None
+
+    @property
+    def content(self) -> Dict[str, Any]:
+        face = self.message.face_recognition
+        return {"person_type": face.person_type, "confidence": face.confidence}
+
+
+# InferenceResult.result oneof 필드 이름 -> 이벤트 타입
+EVENT_TYPES: Dict[Optional[str], Type[InferenceEvent]] = {
+    ObjectDetectionEvent.type: ObjectDetectionEvent,
+    FaceRecognitionEvent.type: FaceRecognitionEvent,
+}
+
+
+def event_from_result(message: ai_inference_pb2.InferenceResult) -> InferenceEvent:
+    """InferenceResult 메시지를 결과 종류에 맞는 이벤트로 감쌉니다. (메시지 내용은 복사하지 않습니다)"""
+    return EVENT_TYPES.get(message.WhichOneof("result"), InferenceEvent)(message)
+
+
+def object_detection_event(robot_id: str, detection: Dict[str, Any]) -> ObjectDetectionEvent:
+    """request_object_detection 결과(dict)를 스트림 결과와 같은 이벤트로 만듭니다. (메인 서버가 샘플링해 보낸 프레임의 결과)"""
+    message = ai_inference_pb2.InferenceResult(robot_id=robot_id, object_detection=ai_inference_pb2.ObjectDetectionResponse(
+        object_name=detection["object_name"], confidence=detection["confidence"],
+        box=ai_inference_pb2.BoundingBox(**detection["box"])))
+    return ObjectDetectionEvent(message)
+
+
+EventHandler = Callable[[InferenceEvent], Awaitable[None]]
+
+
+class InferenceHandlerRegistry:
+    """
+    결과 종류별 추론 이벤트 처리기 등록부.
+    한 종류에 여러 처리기를 등록할 수 있으며, 등록된 순서대로 호출됩니다.
+    처리기가 없는 종류의 이벤트는 unhandled로 집계만 하고 넘어갑니다.
+    """
+    def __init__(self):
+        self._handlers: Dict[Optional[str], List[EventHandler]] = {}
+        # 결과 종류 -> 호출할 함수. 처리기가 하나면 그 처리기를 그대로 두어 호출 단계를 줄입니다.
+        self._dispatch_table: Dict[Optional[str], EventHandler] = {}
+        self.stats: Dict[str, int] = {"unhandled": 0}
+
+    def register(self, event_type: Optional[str], handler: EventHandler):
+        """event_type 종류의 이벤트를 처리할 처리기를 등록합니다."""
+        handlers = self._handlers.setdefault(event_type, [])
+        handlers.append(handler)
+        self._dispatch_table[event_type] = handler if len(handlers) == 1 else self._fan_out(tuple(handlers))
+
+    def on(self, event_type: Optional[str]) -> Callable[[EventHandler], EventHandler]:
+        """처리기 등록 데코레이터"""
+        def decorator(handler: EventHandler) -> EventHandler:
+            self.register(event_type, handler)
+            return handler
+        return decorator
+
+    def dispatch(self, event: InferenceEvent) -> Awaitable[None]:
+        """이벤트 종류에 등록된 처리기를 호출하고, 기다릴 수 있는 결과를 반환합니다. (await registry.dispatch(event))"""
+        return self._dispatch_table.get(event.type, self._unhandled)(event)
+
+    @staticmethod
+    def _fan_out(handlers: Tuple[EventHandler, ...]) -> EventHandler:
+        async def call_all(event: InferenceEvent):
+            for handler in handlers:
+                await handler(event)
+        return call_all
+
+    async def _unhandled(self, event: InferenceEvent):
+        self.stats["unhandled"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"handlers": {str(t): len(h) for t, h in self._handlers.items()}, **self.stats}
@@ -0,0 +1,161 @@
+"""
+AI 서버의 실시간 추론 결과 스트림을 구독하는 소비자.
+- 스트림을 읽는 작업(reader)과 결과를 처리하는 작업(worker)을 크기가 제한된 큐로 분리합니다.
+  처리가 느려도 스트림 읽기는 멈추지 않으며, 큐가 가득 차면 overflow 정책에 따라 결과를 버리거나 기다립니다.
+    - drop_oldest: 가장 오래된 결과를 버리고 새 결과를 넣습니다. (기본값, 최신 결과가 더 중요할 때)
+    - drop_newest: 새 결과를 버립니다.
+    - block     : 자리가 날 때까지 스트림 읽기를 멈춥니다. (서버까지 backpressure가 전달됨)
+- 연결이 끊기거나 스트림이 끝나면 지수 백오프(full jitter) 뒤에 다시 연결하며,
+  마지막으로 받은 순번(sequence)을 보내 그 이후의 결과부터 이어서 받습니다.
+- 순번은 AI 서버가 다시 시작되면 처음부터 새로 매겨지므로, 결과에 담긴 스트림 epoch가 바뀌면
+  마지막 순번을 초기화합니다. (그러지 않으면 재시작 이후의 결과가 모두 중복으로 버려짐)
+- 스트림 지연(서버 생성 → 수신, 수신 → 처리)과 버린/중복/누락된 결과 수를 통계로 남깁니다.
+"""
+import asyncio
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Tuple
+
+from main_server import config
+from .inference_events import InferenceEvent
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# (마지막으로 받은 순번, 그 순번의 스트림 epoch) -> 그 이후의 추론 결과 스트림
+StreamOpener = Callable[[int, int], AsyncIterator[InferenceEvent]]
+ResultHandler = Callable[[InferenceEvent], Awaitable[None]]
+
+
+class InferenceStreamConsumer:
+    """open_stream(마지막 순번, epoch)으로 연 스트림의 결과를 큐를 거쳐 handler로 전달하며, 끊기면 이어서 다시 구독합니다."""
+    def __init__(self, open_stream: StreamOpener, handler: ResultHandler,
+                 queue_size: int = config.AI_STREAM_QUEUE_SIZE,
+                 overflow_policy: str = config.AI_STREAM_OVERFLOW_POLICY,
+                 reconnect_initial: float = config.AI_STREAM_RECONNECT_INITIAL,
+                 reconnect_max: float = config.AI_STREAM_RECONNECT_MAX):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 overflow 정책입니다: {overflow_policy} (가능: {', '.join(OVERFLOW_POLICIES)})")
+        self.open_stream = open_stream
+        self.handler = handler
+        self.queue_size = max(1, queue_size)
+        self.overflow_policy = overflow_policy
+        self.reconnect_initial = reconnect_initial
+        self.reconnect_max = reconnect_max
+        self.last_sequence = 0
+        self.stream_epoch = 0
+        self.connected = False
+        self._queue: "asyncio.Queue[Tuple[float, InferenceEvent]]" = None
+        self.stats: Dict[str, Any] = {
+            "received": 0, "processed": 0, "dropped": 0, "duplicates": 0, "missed": 0,
+            "handler_errors": 0, "connects": 0, "disconnects": 0, "server_restarts": 0,
+            "server_lag_ms_avg": 0.0, "server_lag_ms_max": 0.0, "queue_lag_ms_avg": 0.0, "queue_lag_ms_max": 0.0,
+        }
+        self._server_lag_total = 0.0
+        self._server_lag_count = 0
+        self._queue_lag_total = 0.0
+
+    async def run(self):
+        """스트림 읽기와 결과 처리를 시작합니다. 취소될 때까지 끊긴 연결을 계속 다시 맺습니다."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        worker = asyncio.create_task(self._process())
+        try:
+            await self._read_forever()
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+    async def _read_forever(self):
+        attempt = 0
+        while True:
+            try:
+                print(f"AI 추론 결과 스트림 구독 시작... "
+                      f"(resume_after_sequence={self.last_sequence}, stream_epoch={self.stream_epoch})")
+                self.stats["connects"] += 1
+                self.connected = True
+                async for event in self.open_stream(self.last_sequence, self.stream_epoch):
+                    attempt = 0 # 결과를 하나라도 받았으면 연결이 회복된 것으로 봅니다.
+                    await self._receive(event)
+                print("AI 추론 결과 스트림이 서버에 의해 종료되었습니다.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"AI 스트림 연결 오류: {e}")
+            finally:
+                self.connected = False
+            self.stats["disconnects"] += 1
+
+            delay = random.uniform(0, min(self.reconnect_max, self.reconnect_initial * (2 ** attempt)))
+            attempt += 1
+            print(f"AI 스트림 재연결 대기 {delay:.2f}초 (시도 {attempt}회째)")
+            await asyncio.sleep(delay)
+
+    async def _receive(self, event: InferenceEvent):
+        """수신한 결과의 순번과 지연을 확인하고 큐에 넣습니다."""
+        epoch = event.stream_epoch
+        if epoch and epoch != self.stream_epoch:
+            if self.stream_epoch:
+                # 서버가 다시 시작되어 순번이 처음부터 새로 매겨졌습니다.
+                self.stats["server_restarts"] += 1
+                print(f"AI 서버 재시작 감지 (stream_epoch {self.stream_epoch} -> {epoch}), 순번을 초기화합니다.")
+            self.stream_epoch = epoch
+            self.last_sequence = 0
+        sequence = event.sequence
+        if sequence:
+            if sequence <= self.last_sequence:
+                # 재연결 직후 서버가 이미 받은 결과를 다시 보낸 경우
+                self.stats["duplicates"] += 1
+                return
+            if self.last_sequence and sequence > self.last_sequence + 1:
+                # 서버가 보관 범위를 넘어 다시 보내지 못한 결과
+                self.stats["missed"] += sequence - self.last_sequence - 1
+            self.last_sequence = sequence
+        self.stats["received"] += 1
+
+        timestamp_ms = event.timestamp_ms
+        if timestamp_ms:
+            lag_ms = max(time.time() * 1000 - timestamp_ms, 0.0)
+            self._server_lag_total += lag_ms
+            self._server_lag_count += 1
+            self.stats["server_lag_ms_avg"] = round(self._server_lag_total / self._server_lag_count, 3)
+            self.stats["server_lag_ms_max"] = round(max(self.stats["server_lag_ms_max"], lag_ms), 3)
+
+        item = (time.monotonic(), event)
+        if self.overflow_policy == "block":
+            await self._queue.put(item)
+            return
+        if self._queue.full():
+            self.stats["dropped"] += 1
+            if self.overflow_policy == "drop_newest":
+                return
+            self._queue.get_nowait()
+            self._queue.task_done()
+        self._queue.put_nowait(item)
+
+    async def _process(self):
+        """큐의 결과를 순서대로 처리합니다. 처리 중 오류가 나도 다음 결과로 넘어갑니다."""
+        while True:
+            enqueued_at, event = await self._queue.get()
+            lag_ms = (time.monotonic() - enqueued_at) * 1000
+            try:
+                await self.handler(event)
+            except Exception as e:
+                self.stats["handler_errors"] += 1
+                print(f"AI 추론 결과 처리 오류: {e}")
+            finally:
+                self._queue.task_done()
+            self.stats["processed"] += 1
+            self._queue_lag_total += lag_ms
+            self.stats["queue_lag_ms_avg"] = round(self._queue_lag_total / self.stats["processed"], 3)
+            self.stats["queue_lag_ms_max"] = round(max(self.stats["queue_lag_ms_max"], lag_ms), 3)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스트림 연결 상태, 큐 길이, 수신/처리/버림 수와 지연 통계를 반환합니다."""
+        return {
+            "connected": self.connected,
+            "overflow_policy": self.overflow_policy,
+            "queue": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "last_sequence": self.last_sequence,
+            "stream_epoch": self.stream_epoch,
+            **self.stats,
+        }
@@ -0,0 +1,98 @@
+"""
+동시에 들어온 추론 요청을 짧은 시간 동안 모아 한 번의 배치 호출로 보내는 micro-batcher.
+- 첫 요청이 들어오면 window 뒤에 모인 요청을 보내며, max_size만큼 모이면 바로 보냅니다.
+- 같은 key(이미지 ID와 이미지 데이터)의 요청은 배치 안에서 한 번만 보내고 결과를 함께 받습니다.
+- 요청마다 제한 시간이 있으며, 배치 호출의 제한 시간은 배치에 담긴 요청 중 가장 늦은 마감까지 남은 시간입니다.
+  제한 시간이 짧은 요청 하나 때문에 배치 전체가 실패하지 않으며, 각 호출자의 제한 시간은
+  자신의 결과를 기다릴 때 따로 적용합니다. (시간을 넘긴 호출자만 asyncio.TimeoutError를 받습니다)
+"""
+import asyncio
+import math
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+R = TypeVar("R")
+
+# (key 목록, 제한 시간(초)) -> key 순서와 같은 순서의 결과 목록. 항목별 실패는 예외 객체로 돌려줄 수 있습니다.
+BatchSender = Callable[[List[K], float], Awaitable[List[Any]]]
+
+
+class MicroBatcher(Generic[K, R]):
+    """key 단위 요청을 모아 send_batch(key 목록, 제한 시간)로 보내고, 결과를 요청별로 나눠 돌려줍니다."""
+    def __init__(self, send_batch: BatchSender, window: float, max_size: int):
+        self._send_batch = send_batch
+        self.window = window
+        self.max_size = max(1, max_size)
+        self._pending: Dict[K, List[asyncio.Future]] = {}
+        self._deadline = -math.inf
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self.stats: Dict[str, Any] = {"requests": 0, "batches": 0, "deduplicated": 0, "max_batch": 0, "failed_batches": 0}
+
+    async def submit(self, key: K, timeout: float) -> R:
+        """요청을 다음 배치에 넣고, 배치 호출이 끝나면 이 요청의 결과를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.stats["requests"] += 1
+
+        waiters = self._pending.get(key)
+        if waiters is None:
+            self._pending[key] = [future]
+        else:
+            waiters.append(future)
+            self.stats["deduplicated"] += 1
+        self._deadline = max(self._deadline, loop.time() + timeout)
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        # 시간을 넘기면 이 요청의 future만 취소되며, 배치 결과를 나눌 때 건너뜁니다.
+        return await asyncio.wait_for(future, timeout)
+
+    def _flush(self):
+        """모인 요청을 배치 하나로 떼어 내어 백그라운드에서 보냅니다."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, deadline = self._pending, self._deadline
+        self._pending, self._deadline = {}, -math.inf
+
+        task = asyncio.get_running_loop().create_task(self._send(pending, deadline))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, pending: Dict[K, List[asyncio.Future]], deadline: float):
+        keys = list(pending)
+        self.stats["batches"] += 1
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(keys))
+        timeout = max(deadline - asyncio.get_running_loop().time(), 0.001)
+        try:
+            results = await self._send_batch(keys, timeout)
+            if len(results) != len(keys):
+                raise RuntimeError(f"배치 응답 수({len(results)})가 요청 수({len(keys)})와 다릅니다.")
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            results = [e] * len(keys)
+
+        for key, result in zip(keys, results):
+            for future in pending[key]:
+                # 호출자가 이미 취소했거나 제한 시간을 넘긴 요청은 건너뜁니다.
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = self.stats["batches"]
+        unique = self.stats["requests"] - self.stats["deduplicated"]
+        return {
+            "pending": len(self._pending),
+            "in_flight": len(self._in_flight),
+            "avg_batch": round(unique / batches, 2) if batches else 0.0,
+            **self.stats,
+        }
@@ -0,0 +1,198 @@
+"""
+작업(Task)을 로봇이 수행할 Action Sequence로 변환하는 계획기.
+- 작업 유형별 템플릿은 생성 시 한 번 컴파일되며, 배정마다 분기나 dict.get 체인을 다시 평가하지 않습니다.
+- 목적지는 좌표({"x", "y", ...}) 또는 Locations 테이블의 ID / 이름으로 지정할 수 있습니다.
+  ID와 이름은 시작 시 한 번 적재한 목적지 테이블에서 조회하며, 작업마다 DB를 조회하지 않습니다.
+  좌표 dict의 다른 키(예: theta)는 GOTO 파라미터에 그대로 전달됩니다.
+- 해석할 수 없는 목적지는 unresolved_locations()로 작업 생성 전에 걸러냅니다.
+- 같은 경로(예: 간식창고 → 직원 자리)의 계획은 캐시되며, 계획의 key로 통신 계층이 직렬화된 명령을 재사용합니다.
+"""
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from main_server import config
+from main_server.common.ttl_cache import TTLCache
+from main_server.domains.locations.location import Location
+from main_server.domains.locations.location_repository import ILocationRepository
+from main_server.domains.tasks.task import Task, TaskType
+
+Point = Tuple[float, float]
+# 해석된 목적지 파라미터. 계획 key로 쓸 수 있도록 (키, 값) 쌍의 튜플로 보관하며, 앞의 두 쌍은 항상 x, y입니다.
+LocationParams = Tuple[Tuple[str, Any], ...]
+
+# 작업 유형별 Action 템플릿: (action, 파라미터 종류, details 키, 기본값)
+# 파라미터 종류 - "location": 목적지 좌표 / "item": 물품 이름 / None: 파라미터 없음
+ACTION_TEMPLATES: Dict[TaskType, Tuple[Tuple[str, Optional[str], Optional[str], Any], ...]] = {
+    TaskType.SNACK_DELIVERY: (
+        ("GOTO", "location", "pantry_location", {"x": 5, "y": 5}), # 예시: 간식창고 위치
+        ("PICKUP", "item", "item_name", None),
+        ("GOTO", "location", "destination", {"x": 0, "y": 0}),
+        ("DROPOFF", None, None, None),
+    ),
+    TaskType.ITEM_DELIVERY: (
+        ("GOTO", "location", "source", None),
+        ("PICKUP", None, None, None),
+        ("GOTO", "location", "destination", None),
+        ("DROPOFF", None, None, None),
+    ),
+    TaskType.GUIDE_GUEST: (
+        ("LEAD_GUEST", "location", "destination", None),
+    ),
+}
+
+
+class ActionPlan(NamedTuple):
+    """
+    작업 하나의 Action Sequence.
+    key는 (작업 유형, 해석된 인자)로, 같은 경로의 계획은 같은 key를 가집니다. (None이면 캐시되지 않은 계획)
+    actions는 캐시된 계획 사이에서 공유되므로 수정하면 안 됩니다.
+    """
+    key: Optional[Hashable]
+    actions: Tuple[Dict[str, Any], ...]
+
+
+class LocationTable:
+    """
+    Locations 테이블을 메모리에 적재한 목적지 좌표 테이블.
+    시작 시 load()로 한 번 적재하며, 이후 목적지 ID / 이름 해석은 DB를 조회하지 않습니다.
+    """
+    def __init__(self, location_repo: Optional[ILocationRepository] = None):
+        self.location_repo = location_repo
+        self._locations: List[Location] = []
+        self._points: Dict[int, Point] = {}
+        self._ids_by_name: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    async def load(self):
+        """리포지토리에서 전체 목적지를 읽어 테이블을 채웁니다."""
+        if self.location_repo is None:
+            return
+        self.set_locations(await self.location_repo.get_all())
+        print(f"목적지 테이블 적재 완료 ({len(self._points)}곳).")
+
+    def set_locations(self, locations: List[Location]):
+        self._locations = list(locations)
+        self._points = {location.id: (location.x, location.y) for location in locations}
+        self._ids_by_name = {location.name: location.id for location in locations}
+
+    def all(self) -> List[Location]:
+        """적재된 전체 목적지 목록을 반환합니다."""
+        return list(self._locations)
+
+    def resolve(self, value: Any) -> Optional[Point]:
+        """
+        목적지 값을 (x, y) 좌표로 변환합니다. 해석할 수 없으면 None을 반환합니다.
+        (받는 형식은 resolve_params 참고)
+        """
+        params = self.resolve_params(value)
+        return (params[0][1], params[1][1]) if params else None
+
+    def resolve_params(self, value: Any) -> Optional[LocationParams]:
+        """
+        목적지 값을 GOTO 파라미터로 변환합니다. 해석할 수 없으면 None을 반환합니다.
+        좌표 dict({"x", "y", ...}, x와 y는 필수이며 다른 키는 그대로 유지), {"location_id": ID},
+        목적지 ID(정수 또는 숫자 문자열), 목적지 이름을 받습니다.
+        """
+        if type(value) is int:
+            point = self._points.get(value)
+        elif value is None or isinstance(value, bool):
+            return None
+        elif isinstance(value, dict):
+            if "location_id" in value:
+                return self.resolve_params(value["location_id"])
+            try:
+                x, y = float(value["x"]), float(value["y"])
+            except (KeyError, TypeError, ValueError):
+                return None
+            return (("x", x), ("y", y)) + tuple(item for item in value.items() if item[0] not in ("x", "y"))
+        elif isinstance(value, str):
+            location_id = int(value) if value.isdigit() else self._ids_by_name.get(value)
+            point = self._points.get(location_id)
+        else:
+            return None
+        return (("x", point[0]), ("y", point[1])) if point else None
+
+
+def unresolved_locations(task_type: Any, details: Dict[str, Any], locations: LocationTable) -> List[str]:
+    """
+    작업 유형의 템플릿이 사용하는 목적지 중 해석할 수 없는 것의 details 키 목록을 반환합니다.
+    (details에 없고 템플릿 기본값도 없는 목적지 포함)
+    """
+    steps = ACTION_TEMPLATES.get(TaskType(task_type), ())
+    return [key for _, kind, key, default in steps
+            if kind == "location" and locations.resolve_params(details.get(key, default)) is None]
+
+
+class _CompiledTemplate:
+    """
+    템플릿 하나를 (인자 추출 함수, Action 생성 함수) 목록으로 미리 변환한 것입니다.
+    arguments()는 작업 details에서 계획 key가 될 인자를 뽑고, build()는 그 인자로 Action 목록을 만듭니다.
+    """
+    def __init__(self, steps: Tuple[Tuple[str, Optional[str], Optional[str], Any], ...], locations: LocationTable):
+        self._extractors: List[Callable[[Dict[str, Any]], Any]] = []
+        self._builders: List[Callable[[Any], Dict[str, Any]]] = []
+        for action, kind, key, default in steps:
+            self._extractors.append(self._compile_extractor(kind, key, default, locations))
+            self._builders.append(self._compile_builder(action, kind))
+
+    @staticmethod
+    def _compile_extractor(kind: Optional[str], key: Optional[str], default: Any,
+                           locations: LocationTable) -> Callable[[Dict[str, Any]], Any]:
+        if kind == "location":
+            return lambda details: locations.resolve_params(details.get(key, default))
+        if kind == "item":
+            return lambda details: details.get(key, default)
+        return lambda details: None
+
+    @staticmethod
+    def _compile_builder(action: str, kind: Optional[str]) -> Callable[[Any], Dict[str, Any]]:
+        if kind == "location":
+            return lambda params: {"action": action, "params": dict(params) if params else None}
+        if kind == "item":
+            return lambda item: {"action": action, "params": {"item": item}}
+        return lambda _: {"action": action}
+
+    def arguments(self, details: Dict[str, Any]) -> Tuple[Any, ...]:
+        return tuple([extract(details) for extract in self._extractors])
+
+    def build(self, arguments: Tuple[Any, ...]) -> Tuple[Dict[str, Any], ...]:
+        return tuple([build(argument) for build, argument in zip(self._builders, arguments)])
+
+
+class ActionPlanner:
+    """
+    작업 유형별 컴파일된 템플릿과 목적지 테이블로 Action Sequence를 만들고,
+    (작업 유형, 해석된 인자)가 같은 계획은 캐시에서 재사용합니다.
+    """
+    def __init__(self, locations: LocationTable, cache_size: int = config.ACTION_PLAN_CACHE_SIZE):
+        self.locations = locations
+        # Task 모델은 작업 유형을 문자열 값으로 보관하므로, 값으로 바로 찾을 수 있게 둡니다.
+        self._templates = {
+            task_type.value: _CompiledTemplate(steps, locations) for task_type, steps in ACTION_TEMPLATES.items()
+        }
+        # 계획은 해석된 좌표로 식별되므로 만료시키지 않고, 크기 제한(LRU)만 둡니다.
+        self._plans: TTLCache[ActionPlan] = TTLCache(maxsize=cache_size, ttl=None)
+
+    def plan(self, task: Task) -> ActionPlan:
+        """작업의 Action Sequence를 반환합니다. 알 수 없는 작업 유형이면 빈 계획을 반환합니다."""
+        task_type = task.task_type if type(task.task_type) is str else TaskType(task.task_type).value
+        template = self._templates.get(task_type)
+        if template is None:
+            return ActionPlan((task_type,), ())
+
+        arguments = template.arguments(task.details or {})
+        key = (task_type,) + arguments
+        try:
+            plan = self._plans.get(key)
+        except TypeError:
+            # 물품 정보 등이 dict/list로 들어와 key로 쓸 수 없으면 캐시하지 않습니다.
+            return ActionPlan(None, template.build(arguments))
+        if plan is None:
+            plan = ActionPlan(key, template.build(arguments))
+            self._plans.set(key, plan)
+        return plan
+
+    def get_stats(self) -> Dict[str, Any]:
+        """목적지 수와 계획 캐시 통계를 반환합니다."""
+        return {"locations": len(self.locations), "plans": self._plans.get_stats()}
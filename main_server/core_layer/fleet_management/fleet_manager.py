@@ -1,13 +1,24 @@
 import math
 import json
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from main_server import config
 from main_server.domains.robots.robot import Robot, RobotStatus
 from main_server.domains.robots.robot_repository import IRobotRepository
-from main_server.domains.tasks.task import Task, TaskType
+from main_server.domains.tasks.task import Task
 from main_server.infrastructure.communication.protocols import IRobotCommunicator
 from main_server.core_layer.ai_inference.grpc_inference_client import AIInferenceService
-from main_server.web.connection_manager import ConnectionManager
+from main_server.core_layer.ai_inference.inference_events import (
+    FaceRecognitionEvent, InferenceHandlerRegistry, ObjectDetectionEvent, object_detection_event
+)
+from main_server.core_layer.ai_inference.inference_stream import InferenceStreamConsumer
+from main_server.infrastructure.database.telemetry_writer import TelemetryWriter
+from main_server.web.fleet_stream import FleetStatusStream
+from main_server.core_layer.task_management.task_events import TaskEventHub
+from main_server.core_layer.navigation.travel_cost import TravelCostMatrix
+from main_server.core_layer.navigation.zone_engine import ZoneEngine, ZoneEvent
+from .action_planner import ActionPlan, ActionPlanner, LocationTable
+from .fleet_state import FleetStateStore
 
 
 class FleetManager:
@@ -20,50 +31,194 @@ class FleetManager:
                  robot_repo: IRobotRepository,
                  robot_communicator: IRobotCommunicator,
                  ai_service: AIInferenceService,
-                 connection_manager: ConnectionManager):
+                 status_stream: FleetStatusStream,
+                 telemetry_writer: TelemetryWriter,
+                 task_events: TaskEventHub,
+                 action_planner: Optional[ActionPlanner] = None,
+                 travel_costs: Optional[TravelCostMatrix] = None,
+                 zone_engine: Optional[ZoneEngine] = None):
         """
-        리포지토리, 커뮤니케이터, AI 서비스, 웹소켓 연결 관리자를 주입받습니다.
+        리포지토리, 커뮤니케이터, AI 서비스, 관리자 상태 스트림, 텔레메트리 기록기, 작업 이벤트 허브,
+        Action Sequence 계획기, 목적지 간 이동 비용 표, 구역 엔진을 주입받습니다.
+        (계획기를 주지 않으면 목적지 테이블 없이 좌표만 해석하고, 비용 표를 주지 않으면 직선 거리로 배차하며,
+        구역 엔진을 주지 않으면 구역 진입/이탈을 판정하지 않습니다)
         """
         self.robot_repo = robot_repo
         self.robot_communicator = robot_communicator
         self.ai_service = ai_service
-        self.connection_manager = connection_manager
+        self.status_stream = status_stream
+        self.telemetry_writer = telemetry_writer
+        self.task_events = task_events
+        self.action_planner = action_planner or ActionPlanner(LocationTable())
+        self.travel_costs = travel_costs or TravelCostMatrix()
+        self.zone_engine = zone_engine or ZoneEngine()
+        # 로봇 상태의 원본은 메모리 상태 테이블이며, DB에는 TelemetryWriter가 일괄 반영합니다.
+        self.fleet_state = FleetStateStore()
+        self._robot_available_listeners: List[Callable[[Robot], None]] = []
+        self._robot_registered_listeners: List[Callable[[Robot], None]] = []
+        self._zone_event_listeners: List[Callable[[ZoneEvent], None]] = []
+        # AI 추론 결과 종류별 처리기와 스트림 소비자 (start_ai_stream()에서 구독 시작)
+        self.ai_handlers = InferenceHandlerRegistry()
+        self.ai_handlers.register(ObjectDetectionEvent.type, self._on_object_detection)
+        self.ai_handlers.register(FaceRecognitionEvent.type, self._on_face_recognition)
+        self.ai_stream = InferenceStreamConsumer(
+            lambda resume_after, epoch: self.ai_service.stream_inference_results(resume_after, epoch),
+            self.ai_handlers.dispatch)
         print("Fleet Manager 초기화 완료 (AI 서비스 연동).")
 
+    def add_robot_available_listener(self, listener: Callable[[Robot], None]):
+        """로봇이 배차 가능한 상태(IDLE, 배터리 충분)로 전환될 때 호출될 리스너를 등록합니다."""
+        self._robot_available_listeners.append(listener)
+
+    def add_robot_registered_listener(self, listener: Callable[[Robot], None]):
+        """시작 이후 등록된 로봇이 상태 테이블에 처음 추가될 때 호출될 리스너를 등록합니다."""
+        self._robot_registered_listeners.append(listener)
+
+    def add_zone_event_listener(self, listener: Callable[[ZoneEvent], None]):
+        """로봇이 지도 구역에 진입하거나 구역에서 이탈할 때 호출될 리스너를 등록합니다."""
+        self._zone_event_listeners.append(listener)
+
+    def _is_available(self, robot_id: int) -> bool:
+        return self.fleet_state.is_available(robot_id, RobotStatus.IDLE, config.DISPATCH_MIN_BATTERY)
+
+    async def load_fleet_state(self):
+        """
+        DB의 로봇 목록으로 메모리 상태 테이블을 초기화합니다.
+        애플리케이션 시작 시 한 번 호출되어야 합니다.
+        """
+        robots = await self.robot_repo.get_all()
+        self.fleet_state.load(robots)
+        self.status_stream.load(self.fleet_state.all())
+        print(f"로봇 상태 테이블 적재 완료 ({len(self.fleet_state)}대).")
+
+    async def sync_robots(self) -> List[Robot]:
+        """
+        DB의 로봇 목록에서 상태 테이블에 없는 로봇(시작 이후 등록된 로봇)을 추가하고 반환합니다.
+        이미 있는 로봇의 상태는 건드리지 않습니다.
+        """
+        added = [robot for robot in await self.robot_repo.get_all() if robot.id not in self.fleet_state]
+        for robot in added:
+            self._register_robot(robot)
+        return added
+
+    def _register_robot(self, robot: Robot):
+        self.fleet_state.upsert(robot)
+        print(f"새 로봇 등록: {robot.name} (ID: {robot.id})")
+        for listener in self._robot_registered_listeners:
+            listener(robot)
+
     async def start_ai_stream(self):
         """
         AI 서버로부터의 실시간 추론 스트림을 구독하고 처리를 시작합니다.
+        스트림 읽기와 결과 처리는 제한된 큐로 분리되며, 연결이 끊기면 마지막 순번부터 이어서 다시 구독합니다.
+        """
+        await self.ai_stream.run()
+
+    async def handle_frame_detection(self, robot_id: int, frame_id: int, detection: Dict[str, Any]):
+        """
+        메인 서버가 수신한 영상에서 샘플링해 보낸 프레임의 객체 인식 결과를 처리합니다.
+        스트림으로 받은 결과와 같은 이벤트로 만들어 같은 처리기로 넘깁니다.
+        """
+        await self.ai_handlers.dispatch(object_detection_event(str(robot_id), detection))
+
+    async def _on_object_detection(self, event: ObjectDetectionEvent):
+        # AI 추론 결과에 따른 로직 처리 (예: 특정 객체 발견 시 정지, 안내 등)
+        if config.AI_STREAM_LOG_RESULTS:
+            print(f"[AI Stream] 로봇({event.robot_id})로부터 {event.type} 결과 수신: {event.content}")
+
+        # TODO: 여기에 추론 결과에 따른 구체적인 비즈니스 로직 추가
+        # 예: 간식 배달 중 장애물 발견 시 경로 재탐색 요청 등
+
+    async def _on_face_recognition(self, event: FaceRecognitionEvent):
         """
-        async def handle_ai_result(data: Dict[str, Any]):
-            # AI 추론 결과에 따른 로직 처리 (예: 특정 객체 발견 시 정지, 안내 등)
-            robot_id = data.get("robot_id")
-            result_type = data.get("type")
-            content = data.get("content")
-            
-            print(f"[AI Stream] 로봇({robot_id})로부터 {result_type} 결과 수신: {content}")
-            
-            # TODO: 여기에 추론 결과에 따른 구체적인 비즈니스 로직 추가
-            # 예: 간식 배달 중 장애물 발견 시 경로 재탐색 요청 등
+        로봇 카메라의 얼굴 인식 결과를 그 로봇이 수행 중인 작업의 구독자에게 알립니다.
+        (예: 손님 안내 작업에서 손님을 인식했는지 직원 앱에 표시)
+        인식된 직원은 AI 서비스의 직원 ID별 캐시에 기록하며, 캐시 유효 시간 안에 이미 인식된 직원이면
+        이벤트의 repeat를 true로 보내 앱이 같은 사람을 반복해서 알리지 않게 합니다.
+        """
+        if config.AI_STREAM_LOG_RESULTS:
+            print(f"[AI Stream] 로봇({event.robot_id})로부터 {event.type} 결과 수신: {event.content}")
+
+        employee_id = event.employee_id
+        repeat = False
+        if employee_id and self.ai_service is not None:
+            repeat = self.ai_service.get_recent_face_recognition(employee_id) is not None
+            self.ai_service.remember_face_recognition({**event.content, "employee_id": employee_id})
+
+        robot = self._robot_from_event(event.robot_id)
+        if robot is not None and robot.current_task_id is not None:
+            self.task_events.publish(robot.current_task_id, "face", {
+                "robot_id": robot.id, "person_type": event.person_type, "confidence": event.confidence,
+                "employee_id": employee_id, "repeat": repeat,
+            })
 
-        await self.ai_service.start_inference_stream(handle_ai_result)
+    def _robot_from_event(self, robot_id: str) -> Optional[Robot]:
+        """추론 결과의 robot_id(로봇 ID 숫자 문자열 또는 로봇 이름)로 상태 테이블의 로봇을 찾습니다."""
+        if robot_id.isdigit():
+            return self.fleet_state.get(int(robot_id))
+        return next((robot for robot in self.fleet_state.all() if robot.name == robot_id), None)
 
     async def find_optimal_robot(self, target_pose: tuple) -> Optional[Robot]:
         """
         주어진 목적지에 가장 적합한 로봇을 찾습니다.
         (거리, 배터리, 현재 상태 고려)
+        로봇 위치 공간 인덱스를 사용하여 가까운 로봇부터 탐색합니다.
+        이동 비용 표가 준비되어 있으면 직선 거리로 가까운 후보 몇 대를 고른 뒤,
+        벽 / 금지 구역을 돌아가는 실제 이동 비용으로 다시 비교합니다.
+        후보가 모두 목적지에 도달할 수 없으면 나머지 가용 로봇 전체를 같은 방식으로 비교합니다.
         """
         print(f"{target_pose}로의 작업을 위한 최적 로봇 탐색...")
-        
-        idle_robots = await self.robot_repo.find_by_status(RobotStatus.IDLE)
+
+        use_travel_costs = self.travel_costs.ready
+        candidates = self.fleet_state.nearest_available(
+            target_pose[0], target_pose[1], k=config.DISPATCH_TRAVEL_CANDIDATES if use_travel_costs else 1,
+            status=RobotStatus.IDLE, min_battery=config.DISPATCH_MIN_BATTERY
+        )
+
+        if not candidates:
+            print("현재 가용한 로봇이 없습니다.")
+            return None
+
+        if use_travel_costs:
+            min_score, best_robot = self._nearest_by_travel_cost([robot for _, robot in candidates], target_pose)
+            if best_robot is None and len(candidates) == config.DISPATCH_TRAVEL_CANDIDATES:
+                # 가까운 후보가 모두 도달할 수 없으면(예: 금지 구역 건너편) 나머지 가용 로봇도 비교합니다.
+                candidate_ids = {robot.id for _, robot in candidates}
+                others = [
+                    robot for robot in self.fleet_state.find_available(RobotStatus.IDLE, config.DISPATCH_MIN_BATTERY)
+                    if robot.id not in candidate_ids
+                ]
+                if others:
+                    min_score, best_robot = self._nearest_by_travel_cost(others, target_pose)
+            if best_robot is None:
+                print("목적지에 도달할 수 있는 가용 로봇이 없습니다.")
+                return None
+        else:
+            min_score, best_robot = candidates[0]
+        print(f"최적 로봇으로 '{best_robot.name}' 선택됨 (거리: {min_score:.2f}).")
+        return best_robot
+
+    def _nearest_by_travel_cost(self, robots: List[Robot], target_pose: tuple) -> Tuple[float, Optional[Robot]]:
+        """로봇 중 목적지까지의 이동 비용이 가장 작은 로봇을 (비용, Robot)으로 반환합니다. (모두 도달 불가면 Robot은 None)"""
+        travel = self.travel_costs.distance_matrix(
+            [(robot.pose_x, robot.pose_y) for robot in robots], [target_pose]
+        )[:, 0]
+        best = int(travel.argmin())
+        if not math.isfinite(travel[best]):
+            return math.inf, None
+        return float(travel[best]), robots[best]
+
+    def find_optimal_robot_linear(self, target_pose: tuple) -> Optional[Robot]:
+        """
+        모든 가용 로봇을 순회하며 가장 가까운 로봇을 찾는 기준(reference) 구현입니다.
+        공간 인덱스 결과를 검증하는 용도로 유지합니다.
+        """
+        idle_robots = self.fleet_state.find_by_status(RobotStatus.IDLE)
         
         available_robots = [
-            robot for robot in idle_robots if robot.battery_level > 20
+            robot for robot in idle_robots if robot.battery_level > config.DISPATCH_MIN_BATTERY
         ]
         
-        if not available_robots:
-            print("현재 가용한 로봇이 없습니다.")
-            return None
-        
         best_robot = None
         min_score = float('inf')
 
@@ -76,9 +231,12 @@ class FleetManager:
                 min_score = score
                 best_robot = robot
         
-        print(f"최적 로봇으로 '{best_robot.name}' 선택됨 (거리: {min_score:.2f}).")
         return best_robot
 
+    def get_available_robots(self) -> List[Robot]:
+        """배차 가능한(IDLE, 배터리 충분) 로봇 목록을 상태 테이블에서 조회합니다."""
+        return self.fleet_state.find_available(RobotStatus.IDLE, config.DISPATCH_MIN_BATTERY)
+
     async def assign_task_to_robot(self, robot: Robot, task: Task) -> Optional[Robot]:
         """
         선택된 로봇에게 작업을 할당하고 상태를 변경하며, 실제 로봇에게 명령을 전송합니다.
@@ -88,72 +246,162 @@ class FleetManager:
             "status": RobotStatus.MOVING,
             "current_task_id": task.id
         }
-        updated_robot = await self.robot_repo.update(robot.id, update_data)
+        updated_robot = await self.robot_repo.update(robot.id, update_data, current=robot)
         
         if updated_robot:
             print(f"로봇 '{updated_robot.name}'에게 작업 ID {task.id} 할당 (DB 업데이트).")
-            
-            # 로봇이 수행할 Action Sequence 생성
-            actions = self._generate_action_sequence(task)
-            
-            # 실제 로봇에게 명령 전송
-            self.robot_communicator.send_action_sequence(robot.name, actions)
-            print(f"로봇 '{robot.name}'에게 실제 작업 명령 전송 완료.")
-
-            # 변경된 상태를 모든 관리자 클라이언트에게 브로드캐스트
-            await self.connection_manager.broadcast(updated_robot.model_dump_json())
+            updated_robot = await self._dispatch_assignment(robot, task, update_data)
 
         return updated_robot
 
-    def _generate_action_sequence(self, task: Task) -> List[Dict[str, Any]]:
-        """작업 유형에 따라 로봇이 수행할 Action Command 리스트를 생성합니다."""
-        print(f"작업 ID {task.id} (유형: {task.task_type})에 대한 Action Sequence 생성 중...")
-        actions = []
-        
-        if task.task_type == TaskType.SNACK_DELIVERY:
-            pantry_loc = task.details.get("pantry_location", {"x": 5, "y": 5}) # 예시: 간식창고 위치
-            user_loc = task.details.get("destination", {"x": 0, "y": 0})
-            actions.append({"action": "GOTO", "params": pantry_loc})
-            actions.append({"action": "PICKUP", "params": {"item": task.details.get("item_name")}})
-            actions.append({"action": "GOTO", "params": user_loc})
-            actions.append({"action": "DROPOFF"})
-            
-        elif task.task_type == TaskType.ITEM_DELIVERY:
-            pickup_loc = task.details.get("source")
-            dropoff_loc = task.details.get("destination")
-            actions.append({"action": "GOTO", "params": pickup_loc})
-            actions.append({"action": "PICKUP"})
-            actions.append({"action": "GOTO", "params": dropoff_loc})
-            actions.append({"action": "DROPOFF"})
-
-        elif task.task_type == TaskType.GUIDE_GUEST:
-            destination = task.details.get("destination")
-            actions.append({"action": "LEAD_GUEST", "params": destination})
+    async def assign_tasks(self, assignments: List[Tuple[Robot, Task]],
+                           record_tasks: Optional[Callable[[], Awaitable[Any]]] = None) -> List[Robot]:
+        """
+        여러 (로봇, 작업) 배정을 한 번에 반영합니다.
+        로봇 상태는 하나의 UPDATE 문으로 기록한 뒤, 로봇별로 명령 전송 및 브로드캐스트를 수행합니다.
+        record_tasks(작업 상태 기록)가 주어지면 로봇 기록 뒤, 명령 전송 전에 호출하며,
+        실패하면 로봇 상태를 배정 전 값으로 되돌리고 명령을 보내지 않은 채 예외를 다시 발생시킵니다.
+        """
+        if not assignments:
+            return []
+
+        updates = {
+            robot.id: {"status": RobotStatus.MOVING, "current_task_id": task.id}
+            for robot, task in assignments
+        }
+        await self.robot_repo.update_many(updates)
+        if record_tasks is not None:
+            try:
+                await record_tasks()
+            except Exception:
+                await self._revert_assignments(assignments)
+                raise
+        print(f"로봇 {len(assignments)}대에게 작업 일괄 할당 (DB 업데이트).")
+
+        return [
+            await self._dispatch_assignment(robot, task, updates[robot.id])
+            for robot, task in assignments
+        ]
+
+    async def _revert_assignments(self, assignments: List[Tuple[Robot, Task]]):
+        """일괄 배정 기록이 실패했을 때 로봇 상태를 배정 전 값으로 되돌립니다."""
+        previous = {
+            robot.id: {"status": robot.status, "current_task_id": robot.current_task_id}
+            for robot, _ in assignments
+        }
+        try:
+            await self.robot_repo.update_many(previous)
+            print(f"작업 기록 실패로 로봇 {len(previous)}대의 배정을 되돌렸습니다.")
+        except Exception as e:
+            print(f"로봇 배정 되돌리기 실패 (로봇 {sorted(previous)}): {e}")
+
+    async def _dispatch_assignment(self, robot: Robot, task: Task, update_data: Dict[str, Any]) -> Robot:
+        """
+        DB에 기록된 할당을 상태 테이블에 반영하고, 로봇에게 명령을 전송한 뒤 브로드캐스트합니다.
+        """
+        # 할당은 DB에 즉시 기록하고, 메모리 상태 테이블에도 반영합니다.
+        robot_state = self.fleet_state.update(robot.id, **update_data)
+        if robot_state:
+            # 큐에 남아 있는 이전 텔레메트리가 할당 상태를 덮어쓰지 않도록 최신 값을 함께 넣습니다.
+            self.telemetry_writer.submit(robot.id, robot_state.telemetry())
+            updated_robot = robot_state.to_robot()
+        else:
+            updated_robot = robot.model_copy(update=update_data)
+
+        # 로봇이 수행할 Action Sequence 생성 (같은 경로는 캐시된 계획 / 직렬화된 명령을 재사용)
+        plan = self._generate_action_sequence(task)
         
-        print(f"생성된 Actions: {actions}")
-        return actions
+        # 실제 로봇에게 명령 전송
+        self.robot_communicator.send_action_sequence(robot.name, plan.actions, cache_key=plan.key)
+        print(f"로봇 '{robot.name}'에게 실제 작업 명령 전송 완료.")
+
+        # 변경된 상태를 관리자 상태 스트림에 반영 (다음 프레임에 바뀐 필드만 전송)
+        self.status_stream.publish(updated_robot)
+        self._publish_task_progress(updated_robot)
+        return updated_robot
+
+    def _generate_action_sequence(self, task: Task) -> ActionPlan:
+        """작업 유형별로 미리 컴파일된 템플릿으로 로봇이 수행할 Action Sequence를 생성합니다."""
+        return self.action_planner.plan(task)
 
     async def update_robot_status(self, robot_id: int, status: RobotStatus, location: tuple, battery: float) -> Optional[Robot]:
         """
-        로봇으로부터 주기적으로 상태를 보고받아 DB를 갱신하고,
+        로봇으로부터 주기적으로 상태를 보고받아 메모리 상태 테이블을 갱신하고,
         변경사항을 WebSocket으로 브로드캐스트합니다.
+        DB에는 TelemetryWriter가 로봇별 최신 값만 모아 일괄 반영합니다.
+        로봇이 배차 가능한 상태로 전환되면 등록된 리스너(배차 요청)를 호출합니다.
         """
-        update_data = {
-            "status": status,
-            "pose_x": location[0],
-            "pose_y": location[1],
-            "battery_level": battery
-        }
-        updated_robot = await self.robot_repo.update(robot_id, update_data)
-        
-        if updated_robot:
-            # 변경된 상태를 모든 관리자 클라이언트에게 브로드캐스트
-            await self.connection_manager.broadcast(updated_robot.model_dump_json())
+        was_available = self._is_available(robot_id)
+        previous_status = self.fleet_state.status_of(robot_id)
+        robot_state = self.fleet_state.apply_status(robot_id, status, location[0], location[1], battery)
+
+        if robot_state is None:
+            # 상태 테이블에 없는 로봇(시작 이후 등록된 로봇)은 DB에서 한 번 읽어와 추가합니다.
+            robot = await self.robot_repo.get_by_id(robot_id)
+            if not robot:
+                return None
+            self._register_robot(robot)
+            robot_state = self.fleet_state.apply_status(robot_id, status, location[0], location[1], battery)
+
+        self.telemetry_writer.submit(robot_id, robot_state.telemetry())
+
+        updated_robot = robot_state.to_robot()
+        if not was_available and self._is_available(robot_id):
+            for listener in self._robot_available_listeners:
+                listener(updated_robot)
+
+        # 변경된 상태를 관리자 상태 스트림에 반영 (다음 프레임에 바뀐 필드만 전송)
+        self.status_stream.publish(updated_robot)
+        # 위치 보고마다가 아니라 로봇 상태가 바뀔 때만 수행 중인 작업의 구독자에게 알립니다.
+        if robot_state.status != previous_status:
+            self._publish_task_progress(updated_robot)
 
         return updated_robot
 
+    def check_zones(self, positions: Dict[int, Tuple[float, float]]) -> List[ZoneEvent]:
+        """
+        텔레메트리 배치에 담긴 로봇 위치(로봇 ID -> (x, y))를 모든 활성 구역과 한 번에 대조하고,
+        구역 진입/이탈 이벤트를 처리합니다. (SR-014)
+        """
+        events = self.zone_engine.check(positions)
+        for event in events:
+            self.handle_zone_event(event)
+        return events
+
+    def set_zone_active(self, zone_id: int, active: bool) -> List[ZoneEvent]:
+        """구역 활성 상태 변경을 구역 엔진에 반영합니다. 비활성화된 구역 안에 있던 로봇은 이탈 처리됩니다."""
+        events = self.zone_engine.set_zone_active(zone_id, active)
+        for event in events:
+            self.handle_zone_event(event)
+        return events
+
+    def handle_zone_event(self, event: ZoneEvent):
+        """
+        구역 진입/이탈 이벤트를 처리합니다.
+        금지 구역 진입은 경고로 기록하고, 로봇이 수행 중인 작업의 구독자와 등록된 리스너에게 알립니다.
+        """
+        robot = self.fleet_state.get(event.robot_id)
+        robot_name = robot.name if robot else event.robot_id
+        if event.kind == "enter" and event.blocking:
+            print(f"[경고] 로봇 {robot_name}이(가) 금지 구역 '{event.zone_name}'({event.zone_type})에 진입했습니다.")
+        else:
+            action = "진입" if event.kind == "enter" else "이탈"
+            print(f"로봇 {robot_name}: 구역 '{event.zone_name}'({event.zone_type}) {action}")
+
+        if robot is not None and robot.current_task_id is not None:
+            self.task_events.publish(robot.current_task_id, "zone", {
+                "robot_id": event.robot_id, "zone_id": event.zone_id, "zone_type": event.zone_type, "kind": event.kind,
+            })
+        for listener in self._zone_event_listeners:
+            listener(event)
+
+    def _publish_task_progress(self, robot: Robot):
+        """로봇이 수행 중인 작업의 구독자에게 로봇 상태 변경 이벤트를 보냅니다."""
+        if robot.current_task_id is not None:
+            self.task_events.publish(robot.current_task_id, "robot", {"robot_id": robot.id, "status": robot.status})
+
     async def get_all_robot_status(self) -> List[Robot]:
         """
-        모든 로봇의 현재 상태를 DB에서 조회하여 반환합니다.
+        모든 로봇의 현재 상태를 메모리 상태 테이블에서 조회하여 반환합니다.
         """
-        return await self.robot_repo.get_all()
+        return self.fleet_state.all()
@@ -0,0 +1,173 @@
+"""
+FleetManager가 사용하는 인메모리 로봇 상태 테이블.
+로봇의 상태 보고(heartbeat)는 이 테이블만 갱신하며, DB(robots 테이블)에는 TelemetryWriter가 일괄 반영합니다.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from main_server.domains.robots.robot import Robot, RobotStatus
+from .spatial_index import SpatialGrid
+
+
+class RobotState:
+    """
+    로봇 한 대의 실시간 상태.
+    수십 대의 로봇이 초당 여러 번 갱신하므로 Pydantic 모델 대신 __slots__ 기반의 가벼운 객체를 사용합니다.
+    """
+    __slots__ = ("id", "name", "status", "battery_level", "pose_x", "pose_y", "current_task_id")
+
+    def __init__(self, id: int, name: str, status: str, battery_level: float,
+                 pose_x: float, pose_y: float, current_task_id: Optional[int]):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.battery_level = battery_level
+        self.pose_x = pose_x
+        self.pose_y = pose_y
+        self.current_task_id = current_task_id
+
+    @classmethod
+    def from_robot(cls, robot: Robot) -> "RobotState":
+        return cls(
+            id=robot.id,
+            name=robot.name,
+            status=RobotStatus(robot.status).value,
+            battery_level=robot.battery_level,
+            pose_x=robot.pose_x,
+            pose_y=robot.pose_y,
+            current_task_id=robot.current_task_id,
+        )
+
+    def to_robot(self) -> Robot:
+        """API 응답 및 브로드캐스트용 Robot 모델로 변환합니다. (이미 검증된 값이므로 검증은 생략)"""
+        return Robot.model_construct(
+            id=self.id,
+            name=self.name,
+            status=self.status,
+            battery_level=self.battery_level,
+            pose_x=self.pose_x,
+            pose_y=self.pose_y,
+            current_task_id=self.current_task_id,
+        )
+
+    def telemetry(self) -> Dict[str, Any]:
+        """DB에 반영할 텔레메트리 필드를 반환합니다."""
+        return {
+            "status": self.status,
+            "pose_x": self.pose_x,
+            "pose_y": self.pose_y,
+            "battery_level": self.battery_level,
+        }
+
+
+class FleetStateStore:
+    """
+    로봇 ID를 키로 하는 권위 있는(authoritative) 로봇 상태 테이블.
+    - 시작 시 DB에서 한 번 적재(load)합니다.
+    - 상태 보고는 메모리만 갱신하며, DB 기록은 호출자(FleetManager)가 TelemetryWriter에 맡깁니다.
+    - 로봇 위치는 공간 인덱스(SpatialGrid)에도 점진적으로 반영되어 최근접 탐색에 사용됩니다.
+    """
+    def __init__(self, index: Optional[SpatialGrid] = None):
+        self._states: Dict[int, RobotState] = {}
+        self._index = index or SpatialGrid()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, robot_id: int) -> bool:
+        return robot_id in self._states
+
+    def load(self, robots: Iterable[Robot]):
+        """DB에서 조회한 로봇 목록으로 상태 테이블을 초기화합니다."""
+        self._states = {robot.id: RobotState.from_robot(robot) for robot in robots}
+        self._index.clear()
+        for state in self._states.values():
+            self._index.update(state.id, state.pose_x, state.pose_y)
+
+    def upsert(self, robot: Robot) -> RobotState:
+        """DB에서 읽은 로봇을 테이블에 추가하거나 교체합니다."""
+        state = RobotState.from_robot(robot)
+        self._states[robot.id] = state
+        self._index.update(state.id, state.pose_x, state.pose_y)
+        return state
+
+    def apply_status(self, robot_id: int, status: RobotStatus, pose_x: float, pose_y: float,
+                     battery_level: float) -> Optional[RobotState]:
+        """
+        로봇의 상태 보고를 반영합니다.
+        테이블에 없는 로봇이면 None을 반환합니다.
+        """
+        state = self._states.get(robot_id)
+        if state is None:
+            return None
+
+        state.status = RobotStatus(status).value
+        state.pose_x = pose_x
+        state.pose_y = pose_y
+        state.battery_level = battery_level
+        self._index.update(robot_id, pose_x, pose_y)
+        return state
+
+    def update(self, robot_id: int, **fields: Any) -> Optional[RobotState]:
+        """
+        DB에 이미 기록된 변경(예: 작업 할당)을 테이블에 반영합니다.
+        """
+        state = self._states.get(robot_id)
+        if state is None:
+            return None
+
+        for key, value in fields.items():
+            if key == "status":
+                value = RobotStatus(value).value
+            setattr(state, key, value)
+        if "pose_x" in fields or "pose_y" in fields:
+            self._index.update(robot_id, state.pose_x, state.pose_y)
+        return state
+
+    def status_of(self, robot_id: int) -> Optional[str]:
+        state = self._states.get(robot_id)
+        return state.status if state else None
+
+    def get(self, robot_id: int) -> Optional[Robot]:
+        state = self._states.get(robot_id)
+        return state.to_robot() if state else None
+
+    def all(self) -> List[Robot]:
+        return [state.to_robot() for state in self._states.values()]
+
+    def find_by_status(self, status: RobotStatus) -> List[Robot]:
+        status_value = RobotStatus(status).value
+        return [state.to_robot() for state in self._states.values() if state.status == status_value]
+
+    def is_available(self, robot_id: int, status: RobotStatus = RobotStatus.IDLE, min_battery: float = 0.0) -> bool:
+        """로봇이 주어진 상태이면서 배터리가 min_battery보다 많은지 확인합니다."""
+        state = self._states.get(robot_id)
+        return (state is not None
+                and state.status == RobotStatus(status).value
+                and state.battery_level > min_battery)
+
+    def find_available(self, status: RobotStatus = RobotStatus.IDLE, min_battery: float = 0.0) -> List[Robot]:
+        """주어진 상태이면서 배터리가 min_battery보다 많은 로봇 목록을 반환합니다."""
+        status_value = RobotStatus(status).value
+        return [
+            state.to_robot() for state in self._states.values()
+            if state.status == status_value and state.battery_level > min_battery
+        ]
+
+    def nearest_available(self, x: float, y: float, k: int = 1,
+                          status: RobotStatus = RobotStatus.IDLE,
+                          min_battery: float = 0.0) -> List[Tuple[float, Robot]]:
+        """
+        (x, y)에서 가장 가까운 로봇 k대를 (거리, Robot) 목록으로 반환합니다. (가까운 순)
+        주어진 상태이면서 배터리가 min_battery보다 많은 로봇만 대상으로 합니다.
+        """
+        status_value = RobotStatus(status).value
+        states = self._states
+
+        def is_available(robot_id: int) -> bool:
+            state = states[robot_id]
+            return state.status == status_value and state.battery_level > min_battery
+
+        return [
+            (dist, states[robot_id].to_robot())
+            for dist, robot_id in self._index.nearest(x, y, k, is_available)
+        ]
@@ -0,0 +1,127 @@
+"""
+로봇의 실시간 위치에 대한 균일 격자(uniform grid) 공간 인덱스.
+위치 보고가 들어올 때마다 점진적으로 갱신되며, 배차 시 가장 가까운 로봇 k대를 빠르게 찾습니다.
+"""
+import heapq
+import math
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from main_server import config
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """
+    로봇 ID를 cell_size 크기의 격자 칸에 나누어 보관하는 공간 인덱스.
+    - update(): 로봇 위치 갱신 (칸이 바뀔 때만 칸 간 이동)
+    - nearest(): 질의 지점에서 가까운 칸부터 링(ring) 단위로 넓혀가며 k-최근접 탐색
+    """
+    def __init__(self, cell_size: float = config.SPATIAL_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._positions: Dict[int, Tuple[float, float]] = {}
+        self._robot_cells: Dict[int, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _cell_of(self, x: float, y: float) -> Cell:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def update(self, robot_id: int, x: float, y: float):
+        """로봇 위치를 갱신합니다."""
+        self._positions[robot_id] = (x, y)
+        cell = self._cell_of(x, y)
+        old_cell = self._robot_cells.get(robot_id)
+        if old_cell == cell:
+            return
+
+        if old_cell is not None:
+            self._discard_from_cell(robot_id, old_cell)
+        self._cells.setdefault(cell, set()).add(robot_id)
+        self._robot_cells[robot_id] = cell
+
+    def remove(self, robot_id: int):
+        """인덱스에서 로봇을 제거합니다."""
+        self._positions.pop(robot_id, None)
+        cell = self._robot_cells.pop(robot_id, None)
+        if cell is not None:
+            self._discard_from_cell(robot_id, cell)
+
+    def clear(self):
+        self._cells.clear()
+        self._positions.clear()
+        self._robot_cells.clear()
+
+    def _discard_from_cell(self, robot_id: int, cell: Cell):
+        members = self._cells.get(cell)
+        if members is None:
+            return
+        members.discard(robot_id)
+        if not members:
+            del self._cells[cell]
+
+    def nearest(self, x: float, y: float, k: int = 1,
+                predicate: Optional[Callable[[int], bool]] = None) -> List[Tuple[float, int]]:
+        """
+        (x, y)에서 가장 가까운 로봇 k대를 (거리, 로봇 ID) 목록으로 반환합니다. (가까운 순)
+        predicate가 주어지면 이를 만족하는 로봇만 후보로 삼습니다. (예: 상태, 배터리 조건)
+        """
+        if not self._cells or k <= 0:
+            return []
+
+        cx, cy = self._cell_of(x, y)
+        # 질의 칸에서 점유된 가장 먼 칸까지의 링 거리 (이 이상은 탐색할 필요가 없음)
+        max_ring = max(
+            max(abs(cell_x - cx), abs(cell_y - cy)) for cell_x, cell_y in self._cells
+        )
+
+        # 최대 힙(음수 거리)으로 현재까지의 k-최근접 후보를 유지합니다.
+        best: List[Tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            if ring > 0 and 8 * ring > len(self._cells):
+                # 링의 칸 수가 점유된 칸 수보다 많아지면 남은 점유 칸만 직접 확인합니다.
+                remaining = [
+                    cell for cell in self._cells
+                    if max(abs(cell[0] - cx), abs(cell[1] - cy)) >= ring
+                ]
+                self._scan(remaining, x, y, k, predicate, best)
+                break
+
+            self._scan(self._ring_cells(cx, cy, ring), x, y, k, predicate, best)
+            # 다음 링의 칸들은 질의 지점에서 최소 ring * cell_size 이상 떨어져 있습니다.
+            if len(best) == k and -best[0][0] <= (ring * self.cell_size) ** 2:
+                break
+
+        return sorted((math.sqrt(-neg_dist_sq), -neg_id) for neg_dist_sq, neg_id in best)
+
+    def _scan(self, cells, x: float, y: float, k: int,
+              predicate: Optional[Callable[[int], bool]], best: List[Tuple[float, int]]):
+        """주어진 칸들의 로봇을 확인하여 k-최근접 후보 힙(best)을 갱신합니다."""
+        for cell in cells:
+            members = self._cells.get(cell)
+            if not members:
+                continue
+            for robot_id in members:
+                if predicate is not None and not predicate(robot_id):
+                    continue
+                px, py = self._positions[robot_id]
+                dist_sq = (px - x) ** 2 + (py - y) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-dist_sq, -robot_id))
+                elif (-dist_sq, -robot_id) > best[0]:
+                    heapq.heapreplace(best, (-dist_sq, -robot_id))
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int):
+        """(cx, cy)를 중심으로 체비쇼프 거리가 정확히 ring인 칸들을 생성합니다."""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
@@ -0,0 +1,53 @@
+"""
+구역 판정을 위한 NumPy 벡터화 기하 연산.
+"""
+import numpy as np
+
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    점 (P, 2)가 다각형 (E, 2) 내부에 있는지 ray casting으로 판정하여 (P,) bool 배열을 반환합니다.
+    경계 위의 점은 어느 쪽으로든 판정될 수 있습니다.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon = np.asarray(polygon, dtype=np.float64)
+    if len(polygon) < 3 or len(points) == 0:
+        return np.zeros(len(points), dtype=bool)
+
+    x, y = points[:, 0, None], points[:, 1, None]
+    x1, y1 = polygon[:, 0], polygon[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+
+    # 점에서 +x 방향으로 쏜 반직선이 가로지르는 변의 수가 홀수이면 내부입니다.
+    straddles = (y1 > y) != (y2 > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    crossings = np.count_nonzero(straddles & (x < x_cross), axis=1)
+    return crossings % 2 == 1
+
+
+def segments_cross_polygon(starts: np.ndarray, ends: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    선분 (P, 2)->(P, 2) 가 다각형 (E, 2)의 경계를 가로지르거나 내부를 지나는지 판정하여 (P,) bool 배열을 반환합니다.
+    (선분과 모든 변의 교차 여부를 P×E 배열로 한 번에 계산합니다)
+    """
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    polygon = np.asarray(polygon, dtype=np.float64)
+    if len(polygon) < 3 or len(starts) == 0:
+        return np.zeros(len(starts), dtype=bool)
+
+    a, b = starts[:, None, :], ends[:, None, :]
+    c, d = polygon[None, :, :], np.roll(polygon, -1, axis=0)[None, :, :]
+
+    def cross(o, p, q):
+        return (p[..., 0] - o[..., 0]) * (q[..., 1] - o[..., 1]) - (p[..., 1] - o[..., 1]) * (q[..., 0] - o[..., 0])
+
+    # 양 끝점이 서로 상대 선분의 반대편에 있으면 교차합니다. (끝점이 변에 닿기만 하는 경우는 제외)
+    d1, d2 = cross(c, d, a), cross(c, d, b)
+    d3, d4 = cross(a, b, c), cross(a, b, d)
+    crosses_edge = ((d1 * d2) < 0) & ((d3 * d4) < 0)
+
+    # 경계를 가로지르지 않고 내부에 완전히 들어 있는 선분은 중점으로 판정합니다.
+    inside = points_in_polygon((starts + ends) / 2, polygon)
+    return crosses_edge.any(axis=1) | inside
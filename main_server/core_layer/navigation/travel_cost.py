@@ -0,0 +1,315 @@
+"""
+명명된 목적지(Locations) 사이의 이동 비용 행렬.
+- 금지 구역(RESTRICTED, WALL)을 지나지 않는 목적지 쌍을 직선 간선으로 잇고,
+  감속 구역(SLOW_ZONE)을 지나는 간선은 가중치를 NAV_SLOW_ZONE_FACTOR배로 늘립니다.
+  금지 구역 안의 목적지(is_restricted)는 노드에서 제외합니다.
+- 시작 시 Floyd–Warshall로 전체 쌍 최단 경로 비용을 계산하여 float32 배열로 보관하고 .npz 파일에 캐시합니다.
+  목적지 / 구역 / 설정이 같으면(서명 일치) 다음 시작 때 다시 계산하지 않습니다.
+  (구역별 간선 판정 결과도 함께 저장하므로, 캐시를 사용할 때는 기하 계산도 하지 않습니다)
+- 배차 시에는 로봇과 목적지를 가장 가까운 노드에 붙이고(snap) 표를 조회합니다.
+  (노드까지의 짧은 구간은 직선 거리로 계산합니다)
+- 구역이 활성화/비활성화되면 바뀐 간선만 반영하여 영향을 받는 부분만 다시 계산합니다.
+"""
+import asyncio
+import hashlib
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from main_server import config
+from main_server.core_layer.fleet_management.action_planner import LocationTable
+from main_server.domains.locations.location import Location
+from main_server.domains.zones.map_zone import MapZone
+from main_server.domains.zones.zone_repository import IMapZoneRepository
+from .geometry import segments_cross_polygon
+
+
+def floyd_warshall(weights: np.ndarray) -> np.ndarray:
+    """간선 가중치 행렬(간선이 없으면 inf)로 전체 쌍 최단 경로 비용을 계산합니다. O(N^3), k 단위로 벡터화"""
+    costs = np.array(weights, dtype=np.float64)
+    np.fill_diagonal(costs, 0.0)
+    for k in range(len(costs)):
+        np.minimum(costs, costs[:, k, None] + costs[None, k, :], out=costs)
+    return costs
+
+
+def dijkstra(weights: np.ndarray, sources: Sequence[int]) -> np.ndarray:
+    """
+    조밀한 간선 가중치 행렬에서 여러 출발점의 최단 경로 비용 (len(sources), N)을 계산합니다.
+    모든 출발점을 한 번에 진행하므로 반복 횟수는 N번이며, 각 반복은 (출발점 수 × N) 벡터 연산입니다.
+    """
+    sources = np.asarray(sources, dtype=np.int64).reshape(-1)
+    rows = np.arange(len(sources))
+    dist = np.full((len(sources), len(weights)), np.inf)
+    dist[rows, sources] = 0.0
+    done = np.zeros(dist.shape, dtype=bool)
+    for _ in range(len(weights)):
+        candidates = np.where(done, np.inf, dist)
+        u = candidates.argmin(axis=1)
+        frontier = candidates[rows, u]
+        if not np.isfinite(frontier).any():
+            break
+        done[rows, u] = True
+        np.minimum(dist, frontier[:, None] + weights[u], out=dist)
+    return dist
+
+
+def update_costs(costs: np.ndarray, old_weights: np.ndarray, new_weights: np.ndarray) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    간선 가중치가 old_weights에서 new_weights로 바뀌었을 때 최단 경로 비용 행렬을 부분적으로 갱신합니다. (무향 그래프)
+    - 가중치가 늘어난(막힌) 간선: 그 간선을 최단 경로에 쓰던 출발점의 행만 Dijkstra로 다시 계산합니다.
+    - 가중치가 줄어든(열린) 간선: 새 간선의 양 끝점만 경유지로 하는 Floyd–Warshall 단계로 반영합니다.
+      (새 최단 경로는 기존 최단 경로 구간과 새 간선을 이어 붙인 것이므로, 이음점은 모두 새 간선의 끝점입니다)
+    """
+    costs = np.array(costs, dtype=np.float64)
+    increased = np.argwhere(np.triu(new_weights > old_weights, 1))
+    decreased = np.argwhere(np.triu(new_weights < old_weights, 1))
+
+    affected = np.zeros(len(costs), dtype=bool)
+    for u, v in increased:
+        w = old_weights[u, v]
+        for a, b in ((u, v), (v, u)):
+            # 출발점 s에서 b까지의 최단 경로가 간선 a-b를 지나면 cost[s, a] + w == cost[s, b] 입니다.
+            reachable = np.isfinite(costs[:, a])
+            affected |= reachable & np.isclose(costs[:, a] + w, costs[:, b], rtol=1e-4, atol=1e-4)
+    rows = np.flatnonzero(affected)
+    if len(rows):
+        recomputed = dijkstra(new_weights, rows)
+        costs[rows, :] = recomputed
+        costs[:, rows] = recomputed.T
+
+    pivots = np.unique(decreased)
+    if len(pivots):
+        np.minimum(costs, new_weights, out=costs)
+        for k in pivots:
+            np.minimum(costs, costs[:, k, None] + costs[None, k, :], out=costs)
+
+    return costs, {"rows_recomputed": len(rows), "pivots_relaxed": len(pivots)}
+
+
+class TravelCostMatrix:
+    """
+    목적지 노드 간 최단 이동 비용 표. 배차 점수 계산(거리 항)에 사용합니다.
+    표가 비어 있으면(목적지가 없으면) 직선(L2) 거리로 대신합니다.
+    """
+    def __init__(self, locations: Optional[LocationTable] = None,
+                 zone_repo: Optional[IMapZoneRepository] = None,
+                 cache_path: str = config.NAV_COST_CACHE_PATH,
+                 slow_zone_factor: float = config.NAV_SLOW_ZONE_FACTOR,
+                 max_edge_length: float = config.NAV_MAX_EDGE_LENGTH):
+        self.locations = locations
+        self.zone_repo = zone_repo
+        self.cache_path = cache_path
+        self.slow_zone_factor = slow_zone_factor
+        self.max_edge_length = max_edge_length
+
+        self.node_ids = np.zeros(0, dtype=np.int64)
+        self.node_xy = np.zeros((0, 2), dtype=np.float64)
+        self.costs = np.zeros((0, 0), dtype=np.float32)
+        self._weights = np.zeros((0, 0), dtype=np.float64)
+        self._distance = np.zeros((0, 0), dtype=np.float64)
+        self._zones: Dict[int, MapZone] = {}
+        # 구역 ID -> (N, N) bool: 노드 i-j 간선이 그 구역을 지나는지 (구역 토글 시 기하 계산을 다시 하지 않음)
+        self._zone_masks: Dict[int, np.ndarray] = {}
+        # 구역 변경은 이전 가중치를 기준으로 계산하므로, 동시에 들어온 변경을 하나씩 반영합니다.
+        self._zone_lock = asyncio.Lock()
+        self.stats: Dict[str, int] = {
+            "builds": 0, "cache_hits": 0, "zone_updates": 0, "rows_recomputed": 0, "pivots_relaxed": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def ready(self) -> bool:
+        return len(self.node_ids) > 0
+
+    async def load(self):
+        """목적지 테이블과 구역 목록으로 비용 표를 만듭니다. (계산은 별도 스레드에서 수행)"""
+        locations = self.locations.all() if self.locations is not None else []
+        zones = await self.zone_repo.get_all() if self.zone_repo is not None else []
+        from_cache = await asyncio.to_thread(self.build, locations, zones)
+        print(f"이동 비용 표 준비 완료 (노드 {len(self)}개, 구역 {len(self._zone_masks)}개, "
+              f"{'캐시 사용' if from_cache else '새로 계산'}).")
+
+    def build(self, locations: Iterable[Location], zones: Iterable[MapZone]) -> bool:
+        """
+        비용 표를 만듭니다. 캐시 파일의 서명이 일치하면 구역 기하 계산과 Floyd–Warshall을 건너뛰고 캐시를 사용합니다.
+        캐시를 사용했으면 True를 반환합니다.
+        """
+        nodes = sorted((location for location in locations if not location.is_restricted), key=lambda loc: loc.id)
+        self.node_ids = np.array([location.id for location in nodes], dtype=np.int64)
+        self.node_xy = np.array([(location.x, location.y) for location in nodes], dtype=np.float64).reshape(-1, 2)
+        self._distance = np.linalg.norm(self.node_xy[:, None, :] - self.node_xy[None, :, :], axis=2)
+        self._zones = {zone.id: zone for zone in zones}
+
+        # 경로에 영향을 주는 구역(금지 / 감속)만 간선 판정에 사용합니다.
+        route_zone_ids = sorted(
+            zone.id for zone in self._zones.values()
+            if len(zone.polygon) >= 3 and (zone.is_blocking or zone.is_slow)
+        )
+        signature = self._signature(route_zone_ids)
+        cached = self._load_cache(signature, route_zone_ids)
+        if cached is not None:
+            costs, self._zone_masks = cached
+            self.stats["cache_hits"] += 1
+        else:
+            self._zone_masks = {zone_id: self._crossing_mask(self._zones[zone_id]) for zone_id in route_zone_ids}
+        weights = self._edge_weights()
+
+        if cached is None:
+            costs = floyd_warshall(weights).astype(np.float32)
+            self.stats["builds"] += 1
+            self._save_cache(signature, costs)
+
+        self._weights, self.costs = weights, costs
+        return cached is not None
+
+    def _crossing_mask(self, zone: MapZone) -> np.ndarray:
+        n = len(self.node_ids)
+        i, j = np.triu_indices(n, k=1)
+        crosses = segments_cross_polygon(self.node_xy[i], self.node_xy[j], np.array(zone.polygon))
+        mask = np.zeros((n, n), dtype=bool)
+        mask[i, j] = crosses
+        mask[j, i] = crosses
+        return mask
+
+    def _edge_weights(self) -> np.ndarray:
+        """현재 활성 구역 기준의 간선 가중치 행렬 (간선이 없으면 inf)"""
+        weights = self._distance.copy()
+        if self.max_edge_length > 0:
+            weights[weights > self.max_edge_length] = np.inf
+
+        blocked = np.zeros(weights.shape, dtype=bool)
+        slow = np.zeros(weights.shape, dtype=bool)
+        for zone_id, mask in self._zone_masks.items():
+            zone = self._zones[zone_id]
+            if not zone.active:
+                continue
+            if zone.is_blocking:
+                blocked |= mask
+            else:
+                slow |= mask
+        weights[slow] *= self.slow_zone_factor
+        weights[blocked] = np.inf
+        np.fill_diagonal(weights, 0.0)
+        return weights
+
+    async def set_zone_active(self, zone_id: int, active: bool) -> bool:
+        """
+        구역의 활성 상태 변경을 비용 표에 반영합니다. (계산은 별도 스레드에서 수행)
+        여러 변경이 동시에 들어오면 잠금으로 순서대로 반영하여, 한 변경이 다른 변경의 결과를 덮어쓰지 않게 합니다.
+        알 수 없는 구역이면 False를 반환합니다.
+        """
+        async with self._zone_lock:
+            return await asyncio.to_thread(self.apply_zone_active, zone_id, active)
+
+    def apply_zone_active(self, zone_id: int, active: bool) -> bool:
+        zone = self._zones.get(zone_id)
+        if zone is None:
+            return False
+        if zone.active == active:
+            return True
+
+        self._zones[zone_id] = zone.model_copy(update={"active": active})
+        if zone_id not in self._zone_masks:
+            # 경로에 영향을 주지 않는 구역입니다.
+            return True
+
+        new_weights = self._edge_weights()
+        costs, update_stats = update_costs(self.costs, self._weights, new_weights)
+        # 배차가 읽는 배열은 통째로 교체하여, 갱신 도중의 값을 읽지 않도록 합니다.
+        self._weights, self.costs = new_weights, costs.astype(np.float32)
+        self.stats["zone_updates"] += 1
+        for key, value in update_stats.items():
+            self.stats[key] += value
+        self._save_cache(self._signature(sorted(self._zone_masks)), self.costs)
+        return True
+
+    def snap(self, xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """좌표 (M, 2)를 가장 가까운 노드에 붙여 (노드 인덱스, 노드까지의 직선 거리)를 반환합니다."""
+        distance = np.linalg.norm(xy[:, None, :] - self.node_xy[None, :, :], axis=2)
+        index = distance.argmin(axis=1)
+        return index, distance[np.arange(len(xy)), index]
+
+    def distance_matrix(self, from_xy: Sequence[Tuple[float, float]],
+                        to_xy: Sequence[Tuple[float, float]]) -> np.ndarray:
+        """
+        출발 좌표 (R개) × 도착 좌표 (T개)의 이동 비용 행렬 (R, T)을 반환합니다.
+        비용 = 출발점→가장 가까운 노드 + 노드 간 최단 경로 비용 + 노드→도착점 (도달할 수 없으면 inf)
+        """
+        from_xy = np.asarray(from_xy, dtype=np.float64).reshape(-1, 2)
+        to_xy = np.asarray(to_xy, dtype=np.float64).reshape(-1, 2)
+        if not self.ready:
+            return np.linalg.norm(from_xy[:, None, :] - to_xy[None, :, :], axis=2)
+
+        from_node, from_snap = self.snap(from_xy)
+        to_node, to_snap = self.snap(to_xy)
+        return from_snap[:, None] + self.costs[from_node[:, None], to_node[None, :]] + to_snap[None, :]
+
+    def _signature(self, route_zone_ids: List[int]) -> str:
+        """비용 표를 결정하는 입력(노드, 경로에 영향을 주는 구역과 활성 상태, 설정)의 해시"""
+        digest = hashlib.sha1()
+        digest.update(self.node_ids.tobytes())
+        digest.update(self.node_xy.tobytes())
+        for zone_id in route_zone_ids:
+            zone = self._zones[zone_id]
+            digest.update(repr((zone.id, zone.type, zone.active, zone.polygon)).encode())
+        digest.update(repr((self.slow_zone_factor, self.max_edge_length)).encode())
+        return digest.hexdigest()
+
+    def _load_cache(self, signature: str,
+                    route_zone_ids: List[int]) -> Optional[Tuple[np.ndarray, Dict[int, np.ndarray]]]:
+        """서명이 일치하는 캐시 파일에서 (비용 표, 구역별 간선 판정)을 읽습니다."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with np.load(self.cache_path) as cached:
+                if str(cached["signature"]) != signature:
+                    return None
+                costs = cached["costs"].astype(np.float32)
+                packed_masks = cached["zone_masks"]
+        except Exception as e:
+            print(f"이동 비용 캐시를 읽지 못했습니다 ({self.cache_path}): {e}")
+            return None
+
+        n = len(self.node_ids)
+        i, j = np.triu_indices(n, k=1)
+        masks: Dict[int, np.ndarray] = {}
+        for zone_id, packed in zip(route_zone_ids, packed_masks):
+            mask = np.zeros((n, n), dtype=bool)
+            crosses = np.unpackbits(packed, count=len(i)).astype(bool)
+            mask[i, j] = crosses
+            mask[j, i] = crosses
+            masks[zone_id] = mask
+        return costs, masks
+
+    def _save_cache(self, signature: str, costs: np.ndarray):
+        """비용 표와 구역별 간선 판정(상삼각 비트 배열)을 캐시 파일에 저장합니다."""
+        if not self.cache_path:
+            return
+        i, j = np.triu_indices(len(self.node_ids), k=1)
+        packed_masks = np.array(
+            [np.packbits(self._zone_masks[zone_id][i, j]) for zone_id in sorted(self._zone_masks)],
+            dtype=np.uint8,
+        ).reshape(len(self._zone_masks), -1)
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp.npz"
+            np.savez_compressed(tmp_path, signature=np.array(signature), node_ids=self.node_ids,
+                                costs=costs, zone_masks=packed_masks)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"이동 비용 캐시를 저장하지 못했습니다 ({self.cache_path}): {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        reachable = np.isfinite(self.costs)
+        return {
+            "nodes": len(self),
+            "zones": len(self._zone_masks),
+            "active_zones": sum(1 for zone_id in self._zone_masks if self._zones[zone_id].active),
+            "unreachable_pairs": int(reachable.size - np.count_nonzero(reachable)),
+            "matrix_bytes": int(self.costs.nbytes),
+            **self.stats,
+        }
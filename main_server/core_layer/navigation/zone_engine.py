@@ -0,0 +1,206 @@
+"""
+로봇 위치와 지도 구역(Map_Zones)을 대조하여 구역 진입/이탈 이벤트를 만드는 구역 엔진.
+- 활성 구역의 다각형은 (구역 수, 최대 꼭짓점 수) 크기의 NumPy 배열로 한 번만 변환해 둡니다.
+  (꼭짓점이 적은 구역은 마지막 꼭짓점을 반복해 채우며, 길이 0인 변은 판정에 영향을 주지 않습니다)
+- 텔레메트리 배치마다 모든 로봇 위치를 한 번에 대조합니다.
+  먼저 경계 상자(bounding box)로 (로봇, 구역) 후보 쌍을 거른 뒤, 후보 쌍에 대해서만 ray casting을 수행합니다.
+- 로봇별 소속 구역을 (로봇 × 구역) bool 행렬로 기억하고, 바뀐 칸만 enter / exit 이벤트로 내보냅니다.
+"""
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from main_server.domains.zones.map_zone import MapZone
+from main_server.domains.zones.zone_repository import IMapZoneRepository
+
+
+class ZoneEvent(NamedTuple):
+    """로봇의 구역 진입(kind="enter") / 이탈(kind="exit") 이벤트"""
+    robot_id: int
+    zone_id: int
+    zone_name: str
+    zone_type: str
+    kind: str
+    blocking: bool
+
+
+class ZoneEngine:
+    """
+    활성 구역에 대한 로봇 위치 판정기.
+    check()는 배치의 (로봇 ID -> 위치)를 받아 이전 판정과 달라진 구역 진입/이탈 이벤트를 반환합니다.
+    """
+    def __init__(self, zone_repo: Optional[IMapZoneRepository] = None):
+        self.zone_repo = zone_repo
+        self._zones: Dict[int, MapZone] = {}
+        # 활성 구역 배열 (열 순서 = self._zone_ids)
+        self._zone_ids = np.zeros(0, dtype=np.int64)
+        self._bbox = np.zeros((0, 4), dtype=np.float64)      # (Z, 4): min_x, min_y, max_x, max_y
+        self._x1 = np.zeros((0, 0), dtype=np.float64)        # (Z, V): 변의 시작점
+        self._y1 = np.zeros((0, 0), dtype=np.float64)
+        self._y2 = np.zeros((0, 0), dtype=np.float64)        # (Z, V): 변의 끝점 y
+        self._slope = np.zeros((0, 0), dtype=np.float64)     # (Z, V): dx / dy (수평 변은 0)
+        # 로봇별 현재 소속 구역: 로봇 ID -> 행 번호, (행 × 활성 구역) bool 행렬
+        self._rows: Dict[int, int] = {}
+        self._membership = np.zeros((0, 0), dtype=bool)
+        self.stats: Dict[str, Any] = {
+            "batches": 0, "poses": 0, "candidate_pairs": 0, "enter": 0, "exit": 0, "check_ms_avg": 0.0,
+        }
+        self._check_ms_total = 0.0
+
+    def __len__(self) -> int:
+        return len(self._zone_ids)
+
+    async def load(self):
+        """리포지토리에서 구역 목록을 읽어 활성 구역 배열을 만듭니다."""
+        if self.zone_repo is None:
+            return
+        self.set_zones(await self.zone_repo.get_all())
+        print(f"구역 엔진 준비 완료 (활성 구역 {len(self)}개).")
+
+    def set_zones(self, zones: Iterable[MapZone]):
+        """구역 목록을 교체합니다. 비활성 구역과 꼭짓점이 3개 미만인 구역은 판정하지 않습니다."""
+        self._zones = {zone.id: zone for zone in zones}
+        self._rebuild()
+
+    def _rebuild(self):
+        """활성 구역으로 판정 배열을 다시 만들고, 남아 있는 구역의 소속 정보는 유지합니다."""
+        active = [zone for zone in sorted(self._zones.values(), key=lambda z: z.id)
+                  if zone.active and len(zone.polygon) >= 3]
+        max_vertices = max((len(zone.polygon) for zone in active), default=0)
+
+        vertices = np.zeros((len(active), max_vertices, 2), dtype=np.float64)
+        for i, zone in enumerate(active):
+            polygon = np.asarray(zone.polygon, dtype=np.float64)
+            vertices[i, :len(polygon)] = polygon
+            vertices[i, len(polygon):] = polygon[-1]
+
+        x1, y1 = vertices[..., 0], vertices[..., 1]
+        x2, y2 = np.roll(x1, -1, axis=1), np.roll(y1, -1, axis=1)
+        dy = y2 - y1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(dy != 0, (x2 - x1) / dy, 0.0)
+
+        old_ids = self._zone_ids
+        new_ids = np.array([zone.id for zone in active], dtype=np.int64)
+        self._zone_ids = new_ids
+        self._bbox = np.stack([x1.min(axis=1), y1.min(axis=1), x1.max(axis=1), y1.max(axis=1)], axis=1) \
+            if len(active) else np.zeros((0, 4))
+        self._x1, self._y1, self._y2, self._slope = x1, y1, y2, slope
+
+        # 소속 행렬의 열을 새 구역 순서에 맞춥니다. (새로 생긴 구역은 아무도 속하지 않은 상태로 시작)
+        membership = np.zeros((len(self._membership), len(new_ids)), dtype=bool)
+        old_columns = {zone_id: column for column, zone_id in enumerate(old_ids.tolist())}
+        for column, zone_id in enumerate(new_ids.tolist()):
+            if zone_id in old_columns:
+                membership[:, column] = self._membership[:, old_columns[zone_id]]
+        self._membership = membership
+
+    def set_zone_active(self, zone_id: int, active: bool) -> List[ZoneEvent]:
+        """
+        구역의 활성 상태를 바꿉니다. 비활성화된 구역 안에 있던 로봇에 대해서는 exit 이벤트를 반환합니다.
+        (활성화된 구역의 enter 이벤트는 다음 위치 보고에서 만들어집니다)
+        """
+        zone = self._zones.get(zone_id)
+        if zone is None or zone.active == active:
+            return []
+
+        events: List[ZoneEvent] = []
+        if not active:
+            columns = np.flatnonzero(self._zone_ids == zone_id)
+            if len(columns):
+                robot_ids = self._robot_ids()
+                for row in np.flatnonzero(self._membership[:, columns[0]]):
+                    events.append(self._event(int(robot_ids[row]), zone, "exit"))
+        self._zones[zone_id] = zone.model_copy(update={"active": active})
+        self._rebuild()
+        self._count(events)
+        return events
+
+    def check(self, positions: Dict[int, Tuple[float, float]]) -> List[ZoneEvent]:
+        """
+        로봇 위치 배치를 모든 활성 구역과 한 번에 대조하여, 이전 판정과 달라진 진입/이탈 이벤트를 반환합니다.
+        """
+        if not positions:
+            return []
+        started = time.perf_counter()
+
+        robot_ids = np.fromiter(positions.keys(), dtype=np.int64, count=len(positions))
+        xy = np.array(list(positions.values()), dtype=np.float64).reshape(-1, 2)
+        rows = self._rows_of(robot_ids)
+
+        inside = np.zeros((len(robot_ids), len(self._zone_ids)), dtype=bool)
+        if len(self._zone_ids):
+            x, y = xy[:, 0, None], xy[:, 1, None]
+            bbox = self._bbox
+            # 1) 경계 상자로 (로봇, 구역) 후보 쌍을 거릅니다.
+            candidate = (x >= bbox[:, 0]) & (x <= bbox[:, 2]) & (y >= bbox[:, 1]) & (y <= bbox[:, 3])
+            robot_idx, zone_idx = np.nonzero(candidate)
+            self.stats["candidate_pairs"] += len(robot_idx)
+            if len(robot_idx):
+                # 2) 후보 쌍에 대해서만 ray casting: +x 방향 반직선이 가로지르는 변의 수가 홀수이면 내부
+                px, py = xy[robot_idx, 0, None], xy[robot_idx, 1, None]
+                y1, y2 = self._y1[zone_idx], self._y2[zone_idx]
+                straddles = (y1 > py) != (y2 > py)
+                x_cross = self._x1[zone_idx] + (py - y1) * self._slope[zone_idx]
+                crossings = np.count_nonzero(straddles & (px < x_cross), axis=1)
+                inside[robot_idx, zone_idx] = crossings % 2 == 1
+
+        # 3) 이전 판정과 비교하여 바뀐 칸만 이벤트로 만듭니다.
+        previous = self._membership[rows]
+        self._membership[rows] = inside
+        events = [
+            self._event(int(robot_ids[r]), self._zones[int(self._zone_ids[z])], "enter" if inside[r, z] else "exit")
+            for r, z in zip(*np.nonzero(inside != previous))
+        ]
+
+        self._count(events)
+        self.stats["batches"] += 1
+        self.stats["poses"] += len(robot_ids)
+        self._check_ms_total += (time.perf_counter() - started) * 1000
+        self.stats["check_ms_avg"] = round(self._check_ms_total / self.stats["batches"], 4)
+        return events
+
+    def zones_of(self, robot_id: int) -> List[int]:
+        """로봇이 현재 속한 활성 구역 ID 목록을 반환합니다."""
+        row = self._rows.get(robot_id)
+        if row is None:
+            return []
+        return self._zone_ids[self._membership[row]].tolist()
+
+    def _rows_of(self, robot_ids: np.ndarray) -> np.ndarray:
+        """로봇 ID의 소속 행렬 행 번호를 반환합니다. 처음 보는 로봇은 행을 추가합니다."""
+        rows = np.empty(len(robot_ids), dtype=np.int64)
+        for i, robot_id in enumerate(robot_ids.tolist()):
+            row = self._rows.get(robot_id)
+            if row is None:
+                row = self._rows[robot_id] = len(self._rows)
+            rows[i] = row
+        if len(self._rows) > len(self._membership):
+            grow = np.zeros((max(len(self._rows), 2 * len(self._membership)) - len(self._membership),
+                             len(self._zone_ids)), dtype=bool)
+            self._membership = np.vstack([self._membership, grow])
+        return rows
+
+    def _robot_ids(self) -> np.ndarray:
+        """소속 행렬의 행 번호 -> 로봇 ID"""
+        robot_ids = np.full(len(self._membership), -1, dtype=np.int64)
+        for robot_id, row in self._rows.items():
+            robot_ids[row] = robot_id
+        return robot_ids
+
+    @staticmethod
+    def _event(robot_id: int, zone: MapZone, kind: str) -> ZoneEvent:
+        return ZoneEvent(robot_id, zone.id, zone.name, zone.type, kind, zone.is_blocking)
+
+    def _count(self, events: List[ZoneEvent]):
+        for event in events:
+            self.stats[event.kind] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "zones": len(self._zones),
+            "active_zones": len(self._zone_ids),
+            "robots_in_zones": int(self._membership.any(axis=1).sum()) if self._membership.size else 0,
+            **self.stats,
+        }
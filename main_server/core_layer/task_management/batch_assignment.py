@@ -0,0 +1,103 @@
+"""
+대기 작업 일괄 배차를 위한 비용 행렬 생성 및 할당 문제(Hungarian) 풀이.
+작업마다 가장 가까운 로봇을 탐욕적으로 고르는 대신, 로봇×작업 전체 비용의 합이 최소가 되도록 배정합니다.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from main_server import config
+from main_server.domains.robots.robot import Robot
+from main_server.domains.tasks.task import Task
+
+
+def build_cost_matrix(robots: Sequence[Robot],
+                      tasks: Sequence[Task],
+                      target_poses: Sequence[Tuple[float, float]],
+                      battery_weight: float = config.DISPATCH_BATTERY_WEIGHT,
+                      priority_weight: float = config.DISPATCH_PRIORITY_WEIGHT,
+                      distance: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    로봇×작업 비용 행렬을 만듭니다. (값이 낮을수록 좋은 배정)
+    비용 = 목적지까지의 거리 (distance가 없으면 L2 거리)
+         + battery_weight * (1 - 배터리 잔량 / 100)
+         + priority_weight * (작업 우선순위 - 1)   # 1이 가장 긴급
+
+    :param target_poses: 작업별 목적지 좌표 (tasks와 같은 순서)
+    :param distance: 미리 계산한 로봇×작업 이동 비용 (R, T). 도달할 수 없는 쌍(inf)은
+                     DISPATCH_UNREACHABLE_COST로 바꿉니다.
+    """
+    battery = np.array([robot.battery_level for robot in robots], dtype=np.float64)
+    priority = np.array([task.priority for task in tasks], dtype=np.float64)
+
+    if distance is None:
+        robot_xy = np.array([(robot.pose_x, robot.pose_y) for robot in robots], dtype=np.float64)
+        task_xy = np.array(target_poses, dtype=np.float64)
+        # (R, 1, 2) - (1, T, 2) -> (R, T)
+        distance = np.linalg.norm(robot_xy[:, None, :] - task_xy[None, :, :], axis=2)
+    else:
+        distance = np.where(np.isfinite(distance), distance, config.DISPATCH_UNREACHABLE_COST)
+    battery_cost = battery_weight * (1.0 - battery / 100.0)
+    priority_cost = priority_weight * (priority - 1.0)
+    return distance + battery_cost[:, None] + priority_cost[None, :]
+
+
+def solve_assignment(cost: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    직사각형 비용 행렬에 대한 최소 비용 할당 문제를 풉니다. (Hungarian, 최단 증가 경로 방식)
+    min(행 수, 열 수)개의 (행, 열) 쌍을 행 순서대로 반환합니다.
+    내부 루프는 열 단위로 벡터화되어 O(n^2 * m)의 대부분을 NumPy가 처리합니다.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.size == 0:
+        return []
+
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    # 1-based 인덱스 (0번 열은 가상의 시작 열)
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    row_of_col = np.zeros(m + 1, dtype=np.int64)   # 열 j에 배정된 행 (0이면 미배정)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        row_of_col[0] = i
+        j0 = 0
+        min_slack = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        while True:
+            used[j0] = True
+            i0 = row_of_col[j0]
+            free = ~used[1:]
+
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            improved = free & (reduced < min_slack[1:])
+            min_slack[1:][improved] = reduced[improved]
+            way[1:][improved] = j0
+
+            candidates = np.where(free, min_slack[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[row_of_col[used]] += delta
+            v[used] -= delta
+            min_slack[1:][free] -= delta
+
+            j0 = j1
+            if row_of_col[j0] == 0:
+                break
+
+        # 증가 경로를 따라 배정을 갱신합니다.
+        while j0:
+            j1 = way[j0]
+            row_of_col[j0] = row_of_col[j1]
+            j0 = j1
+
+    pairs = [(int(row_of_col[j]) - 1, j - 1) for j in range(1, m + 1) if row_of_col[j]]
+    if transposed:
+        pairs = [(col, row) for row, col in pairs]
+    return sorted(pairs)
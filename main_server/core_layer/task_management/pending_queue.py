@@ -0,0 +1,71 @@
+"""
+배차 대기 중인(PENDING) 작업의 인메모리 우선순위 큐.
+시작 시 DB에서 한 번 적재한 뒤에는 배차의 기준(source of truth)이 되어, 대기 작업을 DB에서 반복 조회하지 않습니다.
+"""
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Optional
+
+from main_server.domains.tasks.task import Task
+
+
+class PendingTaskQueue:
+    """
+    우선순위(priority, 1이 가장 긴급) → 생성 시각(created_at) 순으로 정렬되는 대기 작업 큐.
+    제거는 항목을 무효화하는 지연 삭제(lazy deletion) 방식으로 처리하여 push/remove 모두 O(log n) 이하입니다.
+    """
+    def __init__(self):
+        # 힙 항목: [priority, created_at, task_id, 삽입 순번, Task 또는 None(제거됨)]
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._entries
+
+    def _entry(self, task: Task) -> list:
+        return [task.priority, task.created_at, task.id, next(self._counter), task]
+
+    def load(self, tasks: Iterable[Task]):
+        """DB에서 조회한 대기 작업으로 큐를 초기화합니다."""
+        self._entries = {task.id: self._entry(task) for task in tasks}
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+
+    def push(self, task: Task):
+        """작업을 큐에 추가합니다. 이미 있는 작업이면 새 내용으로 교체합니다."""
+        self.remove(task.id)
+        entry = self._entry(task)
+        self._entries[task.id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """작업을 큐에서 제거합니다. (힙의 항목은 무효화만 하고 나중에 정리합니다)"""
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return None
+        task, entry[-1] = entry[-1], None
+        return task
+
+    def get(self, task_id: int) -> Optional[Task]:
+        entry = self._entries.get(task_id)
+        return entry[-1] if entry else None
+
+    def ordered(self, limit: Optional[int] = None) -> List[Task]:
+        """대기 작업을 배차 순서대로 반환합니다. (큐에서 제거하지 않음)"""
+        self._compact()
+        valid = (entry for entry in self._heap if entry[-1] is not None)
+        entries = heapq.nsmallest(limit, valid) if limit is not None else sorted(valid)
+        return [entry[-1] for entry in entries]
+
+    def _compact(self):
+        """무효화된 항목이 절반을 넘으면 힙을 다시 만들고, 아니면 맨 앞의 무효 항목만 정리합니다."""
+        if len(self._heap) > 2 * len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+            return
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
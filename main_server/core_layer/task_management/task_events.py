@@ -0,0 +1,74 @@
+"""
+작업 상태 변경을 구독자에게 push하는 프로세스 내 pub/sub 허브.
+직원 앱이 작업 상태를 반복 조회(polling)하는 대신, SSE / long-poll 요청이 전이(transition)마다 한 번씩 이벤트를 받습니다.
+"""
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, NamedTuple, Set
+
+from main_server import config
+from main_server.domains.tasks.task import Task
+
+
+class TaskEvent(NamedTuple):
+    """
+    task_id 작업에 대한 이벤트.
+    - kind="status": 작업 상태 변경 (data: Task)
+    - kind="robot" : 작업을 수행 중인 로봇의 상태 변경 (data: {"robot_id", "status"})
+    - kind="zone"  : 작업을 수행 중인 로봇의 구역 진입/이탈 (data: {"robot_id", "zone_id", "zone_type", "kind"})
+    - kind="face"  : 작업을 수행 중인 로봇의 얼굴 인식 결과 (data: {"robot_id", "person_type", "confidence", "employee_id", "repeat"})
+    """
+    task_id: int
+    kind: str
+    data: Any
+
+
+class TaskEventHub:
+    """
+    작업 ID별 구독자 큐를 관리합니다.
+    publish는 기다리지 않으며, 구독자 큐가 가득 차면 가장 오래된 이벤트를 버립니다.
+    """
+    def __init__(self, queue_size: int = config.TASK_EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self.stats: Dict[str, int] = {"published": 0, "delivered": 0, "dropped": 0}
+
+    @contextmanager
+    def subscribe(self, task_id: int) -> Iterator["asyncio.Queue[TaskEvent]"]:
+        """task_id 작업의 이벤트를 받을 큐를 등록하고, 블록을 벗어나면 해제합니다."""
+        queue: "asyncio.Queue[TaskEvent]" = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(task_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[task_id]
+
+    def publish(self, task_id: int, kind: str, data: Any):
+        """task_id 작업의 구독자들에게 이벤트를 보냅니다. 구독자가 없으면 아무 일도 하지 않습니다."""
+        self.stats["published"] += 1
+        subscribers = self._subscribers.get(task_id)
+        if not subscribers:
+            return
+
+        event = TaskEvent(task_id, kind, data)
+        for queue in subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.stats["dropped"] += 1
+            queue.put_nowait(event)
+            self.stats["delivered"] += 1
+
+    def publish_task(self, task: Task):
+        """작업 상태 변경 이벤트를 보냅니다."""
+        self.publish(task.id, "status", task)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "tasks_watched": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            **self.stats,
+        }
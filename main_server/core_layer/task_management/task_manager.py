@@ -1,36 +1,161 @@
-from typing import Dict, Any, Optional
+import asyncio
+import numpy as np
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
-from main_server.domains.tasks.task import Task, TaskType, TaskStatus
-from main_server.domains.tasks.task_repository import ITaskRepository
+from main_server import config
+from main_server.domains.robots.robot import Robot
+from main_server.domains.tasks.task import Task, TaskType, TaskStatus, DEFAULT_TASK_PRIORITY
+from main_server.domains.tasks.task_repository import ITaskRepository, TaskCursor
+from main_server.core_layer.fleet_management.action_planner import LocationTable, unresolved_locations
 from main_server.core_layer.fleet_management.fleet_manager import FleetManager
-from main_server.common.exceptions import TaskAssignmentException
+from main_server.common.exceptions import InvalidDestinationException, TaskAssignmentException
+from .batch_assignment import build_cost_matrix, solve_assignment
+from .pending_queue import PendingTaskQueue
+from .task_events import TaskEvent, TaskEventHub
+
+# 더 이상 상태가 바뀌지 않는 작업 상태
+TERMINAL_TASK_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED}
 
 class TaskManager:
     """
     사용자로부터의 작업 요청을 생성, 처리하고 FMS에 할당을 요청하는 비동기 서비스.
     이것이 아키텍처 문서의 'Task Management Service'입니다.
     """
-    def __init__(self, task_repo: ITaskRepository, fleet_manager: FleetManager):
+    def __init__(self, task_repo: ITaskRepository, fleet_manager: FleetManager, task_events: TaskEventHub,
+                 locations: Optional[LocationTable] = None):
         self.task_repo = task_repo
         self.fleet_manager = fleet_manager
+        # 목적지가 Locations ID / 이름으로 주어진 작업의 좌표를 생성 시 검증하고 배차 시 해석합니다.
+        self.locations = locations or LocationTable()
+        # 작업 상태 변경을 SSE / long-poll 구독자에게 push합니다.
+        self.task_events = task_events
+        # 작업 생성 응답 방식 (sync: 이 작업의 배차 결과까지 기다림 / async: 저장 후 바로 반환)
+        # 배차는 두 방식 모두 디스패처가 수행합니다.
+        self.dispatch_mode = config.TASK_DISPATCH_MODE
+        self.sync_dispatch_timeout = config.TASK_SYNC_DISPATCH_TIMEOUT
+        # 대기 작업의 원본은 메모리 우선순위 큐입니다. (시작 시 DB에서 한 번 적재)
+        self.pending_queue = PendingTaskQueue()
+        # 같은 로봇이 두 작업에 배정되지 않도록 배차는 한 번에 하나씩만 수행합니다.
+        self._dispatch_lock = asyncio.Lock()
+        self._dispatch_event = asyncio.Event()
+        # 다음 배차가 끝나면 그 결과({작업 ID: Task})를 받을 future들 (sync 모드의 작업 생성 요청)
+        self._dispatch_waiters: List[asyncio.Future] = []
+        # 로봇이 IDLE로 전환되어 배차 가능해지면 대기 작업 배차를 시도합니다.
+        self.fleet_manager.add_robot_available_listener(self._on_robot_available)
         print("TaskManager initialized.")
 
+    async def load_pending_tasks(self):
+        """
+        DB의 PENDING 작업으로 대기 큐를 초기화합니다.
+        애플리케이션 시작 시 목적지 테이블을 적재한 뒤 한 번 호출되며, 이후에는 대기 큐가 배차의 기준이 됩니다.
+        목적지를 해석할 수 없는 작업(예: 삭제된 목적지)은 배차하지 않고 FAILED로 바꿉니다.
+        """
+        pending_tasks = []
+        invalid_ids = []
+        for task in await self.task_repo.get_all_by_status(TaskStatus.PENDING):
+            if unresolved_locations(task.task_type, task.details or {}, self.locations):
+                invalid_ids.append(task.id)
+            else:
+                pending_tasks.append(task)
+        if invalid_ids:
+            await self.task_repo.update_many({task_id: {"status": TaskStatus.FAILED} for task_id in invalid_ids})
+            print(f"Pending tasks with unresolvable destinations marked as failed: {invalid_ids}")
+        self.pending_queue.load(pending_tasks)
+        print(f"Pending task queue loaded ({len(self.pending_queue)} tasks).")
+
+    def request_dispatch(self):
+        """배차 디스패처에 대기 작업 배차를 요청합니다. (여러 요청은 한 번의 배차로 합쳐집니다)"""
+        self._dispatch_event.set()
+
+    def _on_robot_available(self, robot: Robot):
+        if len(self.pending_queue):
+            self.request_dispatch()
+
+    async def run_dispatcher(self):
+        """
+        배차 요청 이벤트를 기다렸다가 대기 작업 배차를 수행하는 백그라운드 루프입니다.
+        주기적으로 DB를 조회(polling)하지 않습니다.
+        """
+        while True:
+            await self._dispatch_event.wait()
+            self._dispatch_event.clear()
+            # 이 배차가 시작되기 전에 대기 큐에 들어간 작업의 생성 요청만 이 배차의 결과를 받습니다.
+            waiters, self._dispatch_waiters = self._dispatch_waiters, []
+            dispatched: Dict[int, Task] = {}
+            try:
+                dispatched = await self.process_pending_tasks()
+            except Exception as e:
+                print(f"Dispatch failed: {e}")
+            finally:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(dispatched)
+
     async def create_new_task(self, task_type: TaskType, requester_id: int, details: Dict[str, Any]) -> Task:
         """
-        새로운 작업을 생성하고, 즉시 할당을 시도합니다. (SR-009)
+        새로운 작업을 생성하고 대기 큐에 넣은 뒤, 디스패처에 배차를 요청합니다. (SR-009)
+        - async 모드: 배차를 기다리지 않고 PENDING 작업을 바로 반환합니다.
+        - sync 모드: 디스패처의 다음 배차가 끝날 때까지(최대 sync_dispatch_timeout초) 기다려
+          이 작업의 배차 결과(ASSIGNED 등)를 반환합니다. 가용 로봇이 없거나 시간이 지나면 PENDING 작업을 반환합니다.
+        두 모드 모두 요청 안에서 대기 작업 전체를 배차하지 않으며, 배차 오류는 디스패처가 기록하고
+        이미 저장된 작업의 생성 요청을 실패시키지 않습니다.
+        배차는 큐의 우선순위 순서를 따르므로, 더 긴급한 대기 작업이 먼저 로봇을 배정받을 수 있습니다.
+        목적지를 해석할 수 없으면 작업을 저장하지 않고 InvalidDestinationException을 발생시킵니다.
         """
+        self._validate_destinations(task_type, details)
         task_data = {
             "task_type": task_type,
             "requester_id": requester_id,
             "details": details,
+            "priority": DEFAULT_TASK_PRIORITY[task_type],
             "status": TaskStatus.PENDING
         }
         new_task = await self.task_repo.create(task_data)
         print(f"New task created with ID: {new_task.id}")
         
-        # 즉시 할당 시도
-        assigned_task = await self.try_to_assign_task(new_task)
-        return assigned_task or new_task
+        # 대기 큐에 넣고 배차 요청 (배차 결과는 작업 이벤트로도 전달됩니다)
+        self.pending_queue.push(new_task)
+        if self.dispatch_mode != "sync":
+            self.request_dispatch()
+            return new_task
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._dispatch_waiters.append(waiter)
+        self.request_dispatch()
+        try:
+            dispatched = await asyncio.wait_for(waiter, self.sync_dispatch_timeout)
+        except asyncio.TimeoutError:
+            print(f"Task {new_task.id} was not dispatched within {self.sync_dispatch_timeout}s. It remains pending.")
+            return new_task
+        return dispatched.get(new_task.id, new_task)
+
+    async def create_tasks(self, requests: List[Dict[str, Any]]) -> List[Task]:
+        """
+        여러 작업을 하나의 트랜잭션으로 생성하고 대기 큐에 넣은 뒤 즉시 반환합니다.
+        배차는 디스패처가 한 번의 배차로 묶어 비동기로 처리합니다.
+
+        :param requests: [{"task_type", "requester_id", "details"}, ...]
+        목적지를 해석할 수 없는 작업이 하나라도 있으면 아무 작업도 저장하지 않고 InvalidDestinationException을 발생시킵니다.
+        """
+        for index, request in enumerate(requests):
+            self._validate_destinations(request["task_type"], request.get("details") or {}, index)
+        task_datas = [
+            {
+                "task_type": request["task_type"],
+                "requester_id": request["requester_id"],
+                "details": request.get("details") or {},
+                "priority": DEFAULT_TASK_PRIORITY[request["task_type"]],
+                "status": TaskStatus.PENDING
+            }
+            for request in requests
+        ]
+        new_tasks = await self.task_repo.create_many(task_datas)
+        print(f"{len(new_tasks)} tasks created in bulk.")
+
+        for task in new_tasks:
+            self.pending_queue.push(task)
+        self.request_dispatch()
+        return new_tasks
 
     async def try_to_assign_task(self, task: Task) -> Optional[Task]:
         """
@@ -39,9 +164,7 @@ class TaskManager:
         """
         try:
             # 1. 최적 로봇 탐색 (목적지 정보가 필요하다면 details에서 추출)
-            # 예시: 'destination' 키가 있으면 그걸 쓰고, 없으면 기본값 (0,0) 사용
-            destination = task.details.get("destination", {"x": 0, "y": 0})
-            target_pose = (destination.get("x", 0), destination.get("y", 0))
+            target_pose = self._target_pose(task)
             
             optimal_robot = await self.fleet_manager.find_optimal_robot(target_pose)
             
@@ -51,7 +174,7 @@ class TaskManager:
 
                 # 3. 작업 상태를 'ASSIGNED'로 업데이트 (Task Repo)
                 update_data = {"status": TaskStatus.ASSIGNED, "robot_id": optimal_robot.id}
-                updated_task = await self.task_repo.update(task.id, update_data)
+                updated_task = await self.task_repo.update(task.id, update_data, current=task)
 
                 # 4. 사용자에게 알림 (Notification Service 호출 - 미구현)
                 print(f"Notification: Task {task.id} assigned to robot {optimal_robot.name}.")
@@ -66,19 +189,159 @@ class TaskManager:
             await self.task_repo.update(task.id, {"status": TaskStatus.FAILED})
             raise TaskAssignmentException(f"Failed to assign task {task.id}: {e}") from e
 
-    async def process_pending_tasks(self):
+    async def process_pending_tasks(self) -> Dict[int, Task]:
         """
-        주기적으로 호출되어, 처리되지 않은 'PENDING' 상태의 작업들을 할당 시도합니다.
+        대기 큐의 작업들을 우선순위 순으로 할당 시도합니다.
+        일괄 배정 모드에서는 모든 대기 작업과 가용 로봇을 한 번에 최적 배정합니다.
+        큐에서 빠져나간 작업(할당 또는 실패)을 {작업 ID: Task}로 반환합니다.
         """
-        pending_tasks = await self.task_repo.get_all_by_status(TaskStatus.PENDING)
-        if not pending_tasks:
-            return
+        async with self._dispatch_lock:
+            pending_tasks = self.pending_queue.ordered()
+            if not pending_tasks:
+                return {}
+
+            print(f"Found {len(pending_tasks)} pending tasks. Trying to assign...")
+            if config.DISPATCH_BATCH_MODE:
+                dispatched = {task.id: task for task in await self.assign_tasks_in_batch(pending_tasks)}
+            else:
+                dispatched = await self._assign_tasks_in_order(pending_tasks)
+
+            for task_id, task in dispatched.items():
+                self.pending_queue.remove(task_id)
+                self.task_events.publish_task(task)
+            return dispatched
+
+    async def _assign_tasks_in_order(self, tasks: List[Task]) -> Dict[int, Task]:
+        """작업을 순서대로 하나씩 가장 가까운 로봇에 할당합니다. (탐욕 배정)"""
+        dispatched: Dict[int, Task] = {}
+        for task in tasks:
+            try:
+                assigned_task = await self.try_to_assign_task(task)
+            except TaskAssignmentException:
+                dispatched[task.id] = task.model_copy(update={"status": TaskStatus.FAILED})
+                continue
 
-        print(f"Found {len(pending_tasks)} pending tasks. Trying to assign...")
-        for task in pending_tasks:
-            await self.try_to_assign_task(task)
+            if not assigned_task:
+                # 가용 로봇이 없으면 나머지 작업도 할당할 수 없습니다.
+                break
+            dispatched[task.id] = assigned_task
+        return dispatched
+
+    async def assign_tasks_in_batch(self, tasks: List[Task]) -> List[Task]:
+        """
+        가용 로봇×대기 작업 비용 행렬(거리, 배터리, 우선순위)을 만들어 할당 문제로 풀고,
+        결과 배정을 한 번에 반영합니다. 배정된 작업 목록을 반환합니다.
+        """
+        robots = self.fleet_manager.get_available_robots()
+        if not robots or not tasks:
+            print(f"No available robot for {len(tasks)} pending tasks.")
+            return []
+
+        target_poses = [self._target_pose(task) for task in tasks]
+        distance = self.fleet_manager.travel_costs.distance_matrix(
+            [(robot.pose_x, robot.pose_y) for robot in robots], target_poses
+        )
+        cost = build_cost_matrix(robots, tasks, target_poses, distance=distance)
+        pairs = solve_assignment(cost)
+        # 도달할 수 없는 배정은 반영하지 않고, 해당 작업은 대기 상태로 남깁니다.
+        assignments = [
+            (robots[robot_idx], tasks[task_idx]) for robot_idx, task_idx in pairs
+            if np.isfinite(distance[robot_idx, task_idx])
+        ]
+        if not assignments:
+            print(f"No reachable robot for {len(tasks)} pending tasks.")
+            return []
+
+        # 로봇 상태와 작업 상태를 각각 하나의 UPDATE 문으로 기록합니다.
+        # 작업 기록이 실패하면 로봇 배정은 되돌려지고 명령도 보내지 않으며, 작업은 대기 큐에 남아 다음 배차에 다시 시도됩니다.
+        task_updates = {
+            task.id: {"status": TaskStatus.ASSIGNED, "robot_id": robot.id}
+            for robot, task in assignments
+        }
+        try:
+            await self.fleet_manager.assign_tasks(
+                assignments, record_tasks=lambda: self.task_repo.update_many(task_updates))
+        except Exception as e:
+            print(f"Batch dispatch failed to record {len(assignments)} assignments: {e}")
+            return []
+
+        assigned_tasks = [
+            task.model_copy(update={"status": TaskStatus.ASSIGNED, "robot_id": robot.id})
+            for robot, task in assignments
+        ]
+        print(f"Batch dispatch: {len(assigned_tasks)}/{len(tasks)} tasks assigned to {len(robots)} available robots.")
+        return assigned_tasks
+
+    def _validate_destinations(self, task_type: TaskType, details: Dict[str, Any], index: Optional[int] = None):
+        """작업 유형이 사용하는 목적지를 모두 해석할 수 있는지 확인합니다."""
+        unresolved = unresolved_locations(task_type, details, self.locations)
+        if unresolved:
+            where = f"tasks[{index}]: " if index is not None else ""
+            values = ", ".join(f"{key}={details.get(key)!r}" for key in unresolved)
+            raise InvalidDestinationException(f"{where}unresolvable destination ({values})")
+
+    def _target_pose(self, task: Task) -> Tuple[float, float]:
+        """
+        작업의 목적지 좌표를 반환합니다. 목적지 ID / 이름은 목적지 테이블에서 해석합니다.
+        (목적지는 생성 시 검증되므로, 'destination' 키를 쓰지 않는 작업 유형만 기본값 (0,0)을 사용)
+        """
+        return self.locations.resolve(task.details.get("destination")) or (0.0, 0.0)
 
     async def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """ID로 작업을 조회합니다."""
-        return await self.task_repo.find_by_id(task_id)
+        return await self.task_repo.get_by_id(task_id)
+
+    def stream_task_history(self, requester_id: Optional[int] = None, status: Optional[TaskStatus] = None,
+                            before: Optional[TaskCursor] = None, limit: Optional[int] = None) -> AsyncIterator[Task]:
+        """작업 이력을 최신순으로 하나씩 내보냅니다. (before: 직전 페이지 마지막 작업의 (created_at, id))"""
+        return self.task_repo.stream(requester_id=requester_id, status=status, before=before, limit=limit)
+
+    async def wait_for_task_change(self, task_id: int, known_status: TaskStatus,
+                                   timeout: float = config.TASK_WATCH_TIMEOUT) -> Optional[Task]:
+        """
+        작업 상태가 known_status에서 바뀔 때까지 기다렸다가 작업을 반환합니다. (long-poll)
+        이미 다르면 즉시 반환하고, timeout 안에 바뀌지 않으면 현재 작업을 그대로 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # 조회와 구독 사이에 일어난 변경을 놓치지 않도록 먼저 구독합니다.
+        with self.task_events.subscribe(task_id) as events:
+            task = await self.get_task_by_id(task_id)
+            while task is not None and task.status == TaskStatus(known_status):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(events.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if event.kind == "status":
+                    task = event.data
+            return task
+
+    async def watch_task(self, task_id: int, timeout: float = config.TASK_WATCH_TIMEOUT,
+                         keepalive: float = config.TASK_WATCH_KEEPALIVE) -> AsyncIterator[Optional[TaskEvent]]:
+        """
+        작업의 현재 상태를 먼저 내보낸 뒤, 이후의 상태 / 로봇 이벤트를 전이마다 하나씩 내보냅니다. (SSE)
+        작업이 종료 상태가 되거나 timeout이 지나면 끝나며, keepalive초 동안 이벤트가 없으면 None을 내보냅니다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        with self.task_events.subscribe(task_id) as events:
+            task = await self.get_task_by_id(task_id)
+            if task is None:
+                return
+            yield TaskEvent(task_id, "status", task)
 
+            while TaskStatus(task.status) not in TERMINAL_TASK_STATUSES:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    event = await asyncio.wait_for(events.get(), min(remaining, keepalive))
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event.kind == "status":
+                    task = event.data
+                yield event
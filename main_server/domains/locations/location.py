@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from enum import Enum
+
+class LocationType(str, Enum):
+    """주요 목적지(POI)의 종류를 나타내는 열거형 (SR-015)"""
+    OFFICE = "OFFICE"
+    MEETING_ROOM = "MEETING_ROOM"
+    WAREHOUSE = "WAREHOUSE"
+    CHARGER = "CHARGER"
+    WAITING_AREA = "WAITING_AREA"
+
+class Location(BaseModel):
+    """주요 목적지(Locations 테이블)의 데이터 모델"""
+    id: int = Field(..., description="목적지의 고유 ID (location_id)")
+    name: str = Field(..., description="목적지 이름 (예: 3층 간식창고)")
+    type: LocationType = Field(..., description="시설물 종류")
+    x: float = Field(..., description="목적지의 X 좌표")
+    y: float = Field(..., description="목적지의 Y 좌표")
+    is_restricted: bool = Field(default=False, description="금지 구역 여부 (SR-014)")
+
+    class Config:
+        orm_mode = True
+        use_enum_values = True
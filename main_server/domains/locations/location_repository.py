@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from .location import Location
+
+class ILocationRepository(ABC):
+    """
+    주요 목적지(POI) 데이터에 접근하기 위한 리포지토리 인터페이스입니다.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, location_id: int) -> Optional[Location]:
+        """ID로 특정 목적지를 조회합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(self) -> List[Location]:
+        """모든 목적지 목록을 조회합니다."""
+        raise NotImplementedError
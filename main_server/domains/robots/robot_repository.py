@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from .robot import Robot, RobotStatus
 
@@ -31,8 +31,22 @@ class IRobotRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, robot_id: int, update_data: dict) -> Optional[Robot]:
-        """로봇의 정보를 업데이트합니다."""
+    async def update(self, robot_id: int, update_data: dict,
+                     current: Optional[Robot] = None) -> Optional[Robot]:
+        """로봇의 정보를 업데이트합니다. current(현재 객체)가 주어지면 다시 조회하지 않고 변경 필드를 합쳐 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        """여러 로봇의 정보를 한 번에 업데이트합니다. ({로봇 ID: 갱신할 필드})"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_telemetry_batch(self, telemetry: Dict[int, Dict[str, Any]]) -> int:
+        """
+        여러 로봇의 텔레메트리(상태, 위치, 배터리)를 한 번에 기록합니다.
+        등록된 로봇의 행만 갱신하며(새 행을 만들지 않음), 갱신된 로봇 수를 반환합니다.
+        """
         raise NotImplementedError
 
     @abstractmethod
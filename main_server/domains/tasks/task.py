@@ -9,6 +9,13 @@ class TaskType(str, Enum):
     ITEM_DELIVERY = "item_delivery"
     GUIDE_GUEST = "guide_guest"
 
+# 작업 종류별 기본 우선순위 (1: 가이드, 2: 물품, 3: 간식 / 숫자가 낮을수록 긴급) (SR-012)
+DEFAULT_TASK_PRIORITY = {
+    TaskType.GUIDE_GUEST: 1,
+    TaskType.ITEM_DELIVERY: 2,
+    TaskType.SNACK_DELIVERY: 3,
+}
+
 class TaskStatus(str, Enum):
     """작업의 현재 상태를 나타내는 열거형"""
     PENDING = "pending"
@@ -25,6 +32,7 @@ class Task(BaseModel):
     status: TaskStatus = Field(default=TaskStatus.PENDING, description="작업의 현재 상태")
     requester_id: int = Field(..., description="작업을 요청한 직원의 ID")
     robot_id: Optional[int] = Field(None, description="작업에 할당된 로봇의 ID")
+    priority: int = Field(default=3, description="작업 우선순위 (1이 가장 긴급) (SR-012)")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="작업 생성 시간")
     completed_at: Optional[datetime] = Field(None, description="작업 완료 시간")
     details: dict = Field({}, description="작업 관련 추가 정보 (e.g., 목적지, 간식 종류)")
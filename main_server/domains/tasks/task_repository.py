@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 
 from .task import Task, TaskStatus
 
+# keyset 페이지네이션 커서: 직전 페이지 마지막 작업의 (created_at, id)
+TaskCursor = Tuple[datetime, int]
+
 class ITaskRepository(ABC):
     """
     작업(Task) 데이터에 접근하기 위한 리포지토리 인터페이스입니다.
@@ -19,8 +23,15 @@ class ITaskRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all_for_user(self, user_id: int) -> List[Task]:
-        """특정 사용자가 요청한 모든 작업을 조회합니다."""
+    async def get_all_for_user(self, user_id: int, limit: int = 100,
+                               before: Optional[TaskCursor] = None) -> List[Task]:
+        """특정 사용자가 요청한 작업을 최신순으로 조회합니다. (before 이전의 작업부터 최대 limit건)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, requester_id: Optional[int] = None, status: Optional[TaskStatus] = None,
+               before: Optional[TaskCursor] = None, limit: Optional[int] = None) -> AsyncIterator[Task]:
+        """작업 이력을 최신순으로 하나씩 내보내는 비동기 이터레이터를 반환합니다."""
         raise NotImplementedError
 
     @abstractmethod
@@ -29,6 +40,17 @@ class ITaskRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, task_id: int, update_data: Dict[str, Any]) -> Optional[Task]:
-        """작업 정보를 업데이트합니다."""
+    async def create_many(self, datas: List[Dict[str, Any]]) -> List[Task]:
+        """여러 작업을 하나의 트랜잭션으로 생성합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, task_id: int, update_data: Dict[str, Any],
+                     current: Optional[Task] = None) -> Optional[Task]:
+        """작업 정보를 업데이트합니다. current(현재 객체)가 주어지면 다시 조회하지 않고 변경 필드를 합쳐 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        """여러 작업의 정보를 한 번에 업데이트합니다. ({작업 ID: 갱신할 필드})"""
         raise NotImplementedError
\ No newline at end of file
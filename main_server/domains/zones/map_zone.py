@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import List, Tuple
+
+# 로봇이 지나갈 수 없는 구역 종류 (SR-014)
+BLOCKING_ZONE_TYPES = {"RESTRICTED", "WALL"}
+# 통과할 수는 있지만 감속해야 하는 구역 종류
+SLOW_ZONE_TYPES = {"SLOW_ZONE"}
+
+class MapZone(BaseModel):
+    """지도 구역(Map_Zones 테이블)의 데이터 모델"""
+    id: int = Field(..., description="구역의 고유 ID (zone_id)")
+    name: str = Field(..., description="구역 이름")
+    polygon: List[Tuple[float, float]] = Field(..., description="구역 경계 다각형의 꼭짓점 좌표 목록")
+    type: str = Field(..., description="구역 종류 (RESTRICTED, SLOW_ZONE 등)")
+    active: bool = Field(default=True, description="구역 활성화 여부")
+
+    @property
+    def is_blocking(self) -> bool:
+        return self.type.upper() in BLOCKING_ZONE_TYPES
+
+    @property
+    def is_slow(self) -> bool:
+        return self.type.upper() in SLOW_ZONE_TYPES
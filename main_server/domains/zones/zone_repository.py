@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from .map_zone import MapZone
+
+class IMapZoneRepository(ABC):
+    """
+    지도 구역(금지 구역, 감속 구역 등) 데이터에 접근하기 위한 리포지토리 인터페이스입니다.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, zone_id: int) -> Optional[MapZone]:
+        """ID로 특정 구역을 조회합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(self) -> List[MapZone]:
+        """모든 구역 목록을 조회합니다. (비활성 구역 포함)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_active(self, zone_id: int, active: bool) -> bool:
+        """구역을 활성화/비활성화합니다. 해당 구역이 없으면 False를 반환합니다."""
+        raise NotImplementedError
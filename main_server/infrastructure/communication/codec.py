@@ -0,0 +1,150 @@
+"""
+ROS Bridge 메시지 페이로드 인코딩.
+- json   : std_msgs/String 의 data 필드에 JSON 문자열을 담습니다. (기본값, 기존 로봇과 호환)
+- msgpack: std_msgs/UInt8MultiArray 의 data 필드에 msgpack 바이트를 담습니다.
+- cbor   : std_msgs/UInt8MultiArray 의 data 필드에 CBOR 바이트를 담습니다.
+rosbridge 는 uint8[] 필드를 base64 문자열로 주고받으므로, 바이너리 인코딩은 base64 로 한 번 더 감쌉니다.
+그래서 작은 메시지는 바이너리 인코딩이 오히려 커지므로(상태 보고 94 -> 143 bytes, scripts.bench_ros_codec),
+바이너리 인코딩은 명령 메시지에만 사용하고 로봇 상태 메시지는 항상 json 으로 주고받습니다.
+msgpack / cbor2 패키지는 해당 인코딩을 선택했을 때만 필요합니다.
+encode_fragment / encode_with_fragment 로 자주 반복되는 값(예: 같은 경로의 Action 목록)을 한 번만 직렬화하여
+여러 메시지에 그대로 끼워 넣을 수 있습니다.
+"""
+import base64
+import json
+from typing import Any, Dict
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+class MessageCodec:
+    """JSON 인코딩. 다른 인코딩은 이 클래스를 상속하여 바이트 직렬화만 바꿉니다."""
+    name = "json"
+    message_type = "std_msgs/String"
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """딕셔너리를 ROS 메시지 본문({'data': ...})으로 인코딩합니다."""
+        return {"data": json.dumps(data, separators=(",", ":"))}
+
+    def decode(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        """ROS 메시지 본문을 딕셔너리로 디코딩합니다."""
+        return json.loads(msg["data"])
+
+    def encode_fragment(self, value: Any) -> str:
+        """encode_with_fragment에 넘길 값 하나를 미리 직렬화합니다."""
+        return json.dumps(value, separators=(",", ":"))
+
+    def encode_with_fragment(self, data: Dict[str, Any], key: str, fragment: str) -> Dict[str, Any]:
+        """data 뒤에 key: (미리 직렬화된 fragment) 항목을 더한 딕셔너리를 ROS 메시지 본문으로 인코딩합니다."""
+        head = json.dumps(data, separators=(",", ":"))[:-1]
+        separator = "," if data else ""
+        return {"data": f"{head}{separator}{json.dumps(key)}:{fragment}}}"}
+
+
+class _BinaryCodec(MessageCodec):
+    message_type = "std_msgs/UInt8MultiArray"
+
+    def _dumps(self, data: Dict[str, Any]) -> bytes:
+        raise NotImplementedError
+
+    def _loads(self, raw: bytes) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _map_header(self, size: int) -> bytes:
+        """size개 항목을 가진 맵의 헤더 바이트"""
+        raise NotImplementedError
+
+    def _wrap(self, raw: bytes) -> Dict[str, Any]:
+        return {
+            "layout": {"dim": [], "data_offset": 0},
+            "data": base64.b64encode(raw).decode("ascii"),
+        }
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return self._wrap(self._dumps(data))
+
+    def encode_fragment(self, value: Any) -> bytes:
+        return self._dumps(value)
+
+    def encode_with_fragment(self, data: Dict[str, Any], key: str, fragment: bytes) -> Dict[str, Any]:
+        # msgpack / CBOR 의 맵은 헤더 뒤에 키와 값의 인코딩을 차례로 이어 붙인 형태이므로,
+        # data 를 인코딩한 뒤 헤더만 항목 수 +1 로 바꾸고 마지막 항목을 덧붙입니다.
+        items = self._dumps(data)[len(self._map_header(len(data))):]
+        return self._wrap(self._map_header(len(data) + 1) + items + self._dumps(key) + fragment)
+
+    def decode(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        raw = msg["data"]
+        # rosbridge 는 uint8[] 를 base64 문자열로 보내지만, 정수 리스트로 오는 경우도 처리합니다.
+        raw = base64.b64decode(raw) if isinstance(raw, str) else bytes(raw)
+        return self._loads(raw)
+
+
+class MsgpackCodec(_BinaryCodec):
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("msgpack 인코딩을 사용하려면 'pip install msgpack'이 필요합니다.")
+        # packb 는 호출마다 Packer 를 새로 만드므로, 하나를 만들어 재사용합니다.
+        self._packer = msgpack.Packer(use_bin_type=True)
+
+    def _dumps(self, data: Dict[str, Any]) -> bytes:
+        return self._packer.pack(data)
+
+    def encode_fragment(self, value: Any) -> Any:
+        # C 구현 Packer 는 조각을 이어 붙이는 것보다 전체를 한 번에 다시 인코딩하는 편이 빠르므로,
+        # 값을 미리 직렬화하지 않고 그대로 둡니다.
+        return value
+
+    def encode_with_fragment(self, data: Dict[str, Any], key: str, fragment: Any) -> Dict[str, Any]:
+        return self.encode({**data, key: fragment})
+
+    def _loads(self, raw: bytes) -> Dict[str, Any]:
+        return msgpack.unpackb(raw, raw=False)
+
+    def _map_header(self, size: int) -> bytes:
+        if size < 16:
+            return bytes([0x80 | size])
+        return b"\xde" + size.to_bytes(2, "big")
+
+
+class CborCodec(_BinaryCodec):
+    name = "cbor"
+
+    def __init__(self):
+        if cbor2 is None:
+            raise ImportError("cbor 인코딩을 사용하려면 'pip install cbor2'가 필요합니다.")
+
+    def _dumps(self, data: Dict[str, Any]) -> bytes:
+        return cbor2.dumps(data)
+
+    def _loads(self, raw: bytes) -> Dict[str, Any]:
+        return cbor2.loads(raw)
+
+    def _map_header(self, size: int) -> bytes:
+        if size < 24:
+            return bytes([0xa0 | size])
+        return b"\xb9" + size.to_bytes(2, "big")
+
+
+CODECS = {
+    MessageCodec.name: MessageCodec,
+    MsgpackCodec.name: MsgpackCodec,
+    CborCodec.name: CborCodec,
+}
+
+
+def get_codec(name: str) -> MessageCodec:
+    """인코딩 이름(json / msgpack / cbor)에 해당하는 코덱을 생성합니다."""
+    codec_class = CODECS.get(name.lower())
+    if codec_class is None:
+        raise ValueError(f"지원하지 않는 ROS 메시지 인코딩입니다: {name} (가능한 값: {', '.join(CODECS)})")
+    return codec_class()
@@ -1,4 +1,4 @@
-from typing import Protocol, List, Dict, Any
+from typing import Protocol, List, Dict, Any, Hashable, Optional, Sequence
 
 class IRobotCommunicator(Protocol):
     """
@@ -6,22 +6,26 @@ class IRobotCommunicator(Protocol):
     ROS Bridge, MQTT, TCP 소켓 등 구체적인 구현을 추상화합니다.
     """
 
-    def send_action_sequence(self, robot_name: str, actions: List[Dict[str, Any]]):
+    def send_action_sequence(self, robot_name: str, actions: Sequence[Dict[str, Any]],
+                             cache_key: Optional[Hashable] = None):
         """
         로봇에게 수행할 액션 시퀀스를 전송합니다.
         
         Args:
             robot_name (str): 명령을 수신할 로봇의 이름.
-            actions (List[Dict[str, Any]]): 로봇이 순차적으로 수행할 액션 목록.
+            actions (Sequence[Dict[str, Any]]): 로봇이 순차적으로 수행할 액션 목록.
                 예: [{'action': 'GOTO', 'params': {'x': 1.0, 'y': 2.5}}, {'action': 'PICKUP'}]
+            cache_key (Hashable, optional): 같은 actions에 대해 항상 같은 값인 키 (ActionPlan.key).
+                주어지면 구현체는 직렬화된 메시지를 캐시하여 재사용할 수 있습니다.
         """
         ...
 
-    def listen_for_status(self, callback: Any):
+    def listen_for_status(self, callback: Any, robot_names: Optional[List[str]] = None):
         """
         로봇으로부터 상태 업데이트를 비동기적으로 수신 대기합니다.
         
         Args:
             callback (Callable): 상태 데이터를 수신했을 때 호출할 함수.
+            robot_names (List[str], optional): 로봇별 상태 토픽을 사용하는 경우 구독할 로봇 이름 목록.
         """
         ...
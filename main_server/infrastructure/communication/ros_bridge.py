@@ -1,22 +1,46 @@
-import json
+import time
 import roslibpy
 import asyncio
-from typing import List, Dict, Any, Optional, Callable
+from collections import deque
+from typing import List, Dict, Any, Hashable, Optional, Callable, Deque, Sequence, Tuple
+from .codec import MessageCodec, get_codec
 from .protocols import IRobotCommunicator
 from main_server import config
+from main_server.common.ttl_cache import TTLCache
 
 class ROSBridgeCommunicator(IRobotCommunicator):
     """
     rosbridge_suite를 통해 실제 ROS 로봇과 통신하는 구현체입니다.
+    - topic_layout="shared": 모든 로봇이 /robot/commands, /robot/status 를 공유합니다. (기본값, 기존 방식)
+    - topic_layout="per_robot": 로봇마다 /<robot_name>/commands, /<robot_name>/status 토픽을 사용하여
+      각 로봇이 자신의 명령만 받고, 다른 로봇의 명령을 파싱하지 않도록 합니다. (로봇 측도 같은 구성이어야 함)
+    - encoding: 명령 메시지 페이로드 인코딩 (json / msgpack / cbor, codec.py 참고)
+      상태 메시지는 작아서 base64로 감싼 바이너리가 JSON보다 커지므로 항상 json으로 받습니다.
+    - cache_key가 주어진 명령은 Action 목록의 직렬화 결과를 cache_key 단위로 캐시하여,
+      같은 경로의 명령은 로봇이 달라도 Action 목록을 다시 직렬화하지 않습니다.
     """
-    def __init__(self, host: str = config.ROS_BRIDGE_HOST, port: int = config.ROS_BRIDGE_PORT):
+    SHARED_COMMAND_TOPIC = '/robot/commands'
+    SHARED_STATUS_TOPIC = '/robot/status'
+
+    def __init__(self, host: str = config.ROS_BRIDGE_HOST, port: int = config.ROS_BRIDGE_PORT,
+                 topic_layout: str = config.ROS_TOPIC_LAYOUT, encoding: str = config.ROS_MESSAGE_ENCODING,
+                 command_cache_size: int = config.ROS_COMMAND_CACHE_SIZE):
+        if topic_layout not in ("per_robot", "shared"):
+            raise ValueError(f"지원하지 않는 토픽 구성입니다: {topic_layout} (per_robot 또는 shared)")
         self.host = host
         self.port = port
+        self.topic_layout = topic_layout
+        self.codec = get_codec(encoding)
+        self.status_codec = MessageCodec()
         self.client = roslibpy.Ros(host=self.host, port=self.port)
-        self.command_topic = roslibpy.Topic(self.client, '/robot/commands', 'std_msgs/String')
-        self.status_topic = roslibpy.Topic(self.client, '/robot/status', 'std_msgs/String')
-        
-        print(f"ROSBridgeCommunicator: {self.host}:{self.port} 연결 준비 중...")
+        # 토픽 이름 -> roslibpy.Topic (처음 사용할 때 생성하여 재사용)
+        self._command_topics: Dict[str, roslibpy.Topic] = {}
+        self._status_topics: Dict[str, roslibpy.Topic] = {}
+        # cache_key -> 직렬화된 Action 목록. 같은 key는 항상 같은 Action 목록이므로 만료시키지 않습니다.
+        self._command_payloads: TTLCache[Any] = TTLCache(maxsize=command_cache_size, ttl=None)
+
+        print(f"ROSBridgeCommunicator: {self.host}:{self.port} 연결 준비 중... "
+              f"(토픽: {self.topic_layout}, 명령 인코딩: {self.codec.name}, 상태 인코딩: {self.status_codec.name})")
 
     def connect(self):
         if not self.client.is_connected:
@@ -30,79 +54,219 @@ class ROSBridgeCommunicator(IRobotCommunicator):
         self.client.terminate()
         print("ROS Bridge 연결 종료.")
 
-    def send_action_sequence(self, robot_name: str, actions: List[Dict[str, Any]]):
+    def command_topic_name(self, robot_name: str) -> str:
+        if self.topic_layout == "shared":
+            return self.SHARED_COMMAND_TOPIC
+        return f"/{robot_name}/commands"
+
+    def status_topic_name(self, robot_name: Optional[str] = None) -> str:
+        if self.topic_layout == "shared" or robot_name is None:
+            return self.SHARED_STATUS_TOPIC
+        return f"/{robot_name}/status"
+
+    def _command_topic(self, robot_name: str) -> roslibpy.Topic:
+        name = self.command_topic_name(robot_name)
+        topic = self._command_topics.get(name)
+        if topic is None:
+            topic = roslibpy.Topic(self.client, name, self.codec.message_type)
+            self._command_topics[name] = topic
+        return topic
+
+    def send_action_sequence(self, robot_name: str, actions: Sequence[Dict[str, Any]],
+                             cache_key: Optional[Hashable] = None):
         if not self.client.is_connected:
             print("ROS Bridge가 연결되어 있지 않아 명령을 보낼 수 없습니다.")
             return
 
-        message = {
-            "robot_name": robot_name,
-            "type": "ACTION_SEQUENCE",
-            "payload": actions
-        }
-        self.command_topic.publish(roslibpy.Message({'data': json.dumps(message)}))
+        self._command_topic(robot_name).publish(self._encode_command(robot_name, actions, cache_key))
         print(f"[{robot_name}] 명령 발행 완료.")
 
-    def listen_for_status(self, callback: Any):
+    def _encode_command(self, robot_name: str, actions: Sequence[Dict[str, Any]],
+                        cache_key: Optional[Hashable]) -> roslibpy.Message:
+        envelope = {"robot_name": robot_name, "type": "ACTION_SEQUENCE"}
+        if cache_key is None:
+            return roslibpy.Message(self.codec.encode({**envelope, "payload": list(actions)}))
+
+        payload = self._command_payloads.get(cache_key)
+        if payload is None:
+            payload = self.codec.encode_fragment(list(actions))
+            self._command_payloads.set(cache_key, payload)
+        return roslibpy.Message(self.codec.encode_with_fragment(envelope, "payload", payload))
+
+    def get_command_cache_stats(self) -> Dict[str, Any]:
+        """직렬화된 명령 페이로드 캐시의 통계를 반환합니다."""
+        return self._command_payloads.get_stats()
+
+    def listen_for_status(self, callback: Any, robot_names: Optional[List[str]] = None):
+        """
+        로봇 상태 토픽을 구독합니다.
+        per_robot 구성에서는 robot_names의 각 로봇 토픽을 구독하며, 이미 구독 중인 토픽은 건너뜁니다.
+        (새 로봇이 등록되면 그 이름으로 다시 호출하면 됩니다)
+        """
+        if self.topic_layout == "shared" or not robot_names:
+            targets = [(self.status_topic_name(), None)]
+        else:
+            targets = [(self.status_topic_name(name), name) for name in robot_names]
+
+        for topic_name, robot_name in targets:
+            if topic_name in self._status_topics:
+                continue
+            topic = roslibpy.Topic(self.client, topic_name, self.status_codec.message_type)
+            topic.subscribe(self._make_status_callback(callback, robot_name))
+            self._status_topics[topic_name] = topic
+            print(f"로봇 상태 구독 시작 ({topic_name})")
+
+    def _make_status_callback(self, callback: Any, robot_name: Optional[str]):
         def _callback(msg):
             try:
-                data = json.loads(msg['data'])
+                data = self.status_codec.decode(msg)
+                if robot_name is not None:
+                    # 로봇별 토픽에서는 토픽 이름으로 발신 로봇을 알 수 있습니다.
+                    data.setdefault("robot_name", robot_name)
                 callback(data)
             except Exception as e:
                 print(f"상태 메시지 처리 오류: {e}")
-
-        self.status_topic.subscribe(_callback)
-        print("로봇 상태 구독 시작 (/robot/status)")
+        return _callback
 
 class ROSBridge:
     """
     애플리케이션과 ROS 간의 고수준 가교 역할을 수행하는 클래스.
     FleetManager와 연동하여 수신된 상태를 시스템에 반영합니다.
+
+    roslibpy의 콜백은 별도(Twisted) 스레드에서 실행되므로, 상태 메시지를 바로 처리하지 않고
+    스레드 안전한 고정 크기 수신 큐(deque)에 넣기만 합니다. 시작 시 잡아둔 메인 이벤트 루프의
+    단일 소비 태스크가 큐를 한 번에 여러 건씩 꺼내 FleetManager에 반영합니다.
+    큐가 가득 차면 가장 오래된 메시지부터 버립니다.
     """
-    def __init__(self, host: str, port: int, fleet_manager: Any):
-        self.communicator = ROSBridgeCommunicator(host, port)
+    def __init__(self, communicator: ROSBridgeCommunicator, fleet_manager: Any,
+                 queue_depth: int = config.ROS_STATUS_QUEUE_DEPTH,
+                 max_batch_size: int = config.ROS_STATUS_MAX_BATCH_SIZE,
+                 robot_sync_interval: float = config.ROS_ROBOT_SYNC_INTERVAL):
+        self.communicator = communicator
         self.fleet_manager = fleet_manager
+        self.max_batch_size = max_batch_size
+        self.robot_sync_interval = robot_sync_interval
+        # (수신 시각, 상태 메시지). append/popleft는 스레드 안전하며 maxlen 초과 시 가장 오래된 항목이 밀려납니다.
+        self._inbox: Deque[Tuple[float, Dict[str, Any]]] = deque(maxlen=queue_depth)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wakeup_scheduled = False
+        self._robot_ids_by_name: Dict[str, int] = {}
+        self.stats: Dict[str, Any] = {
+            "received": 0, "dropped": 0, "applied": 0, "failed": 0, "batches": 0,
+            "lag_ms_avg": 0.0, "lag_ms_max": 0.0,
+        }
+        self._lag_ms_total = 0.0
 
     async def start(self):
         """ROS Bridge와의 통신을 시작하고 수신 대기 루프를 유지합니다."""
+        # 다른 스레드에서 호출되는 콜백이 사용할 메인 이벤트 루프를 미리 잡아둡니다.
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self.communicator.connect()
-        
-        # 상태 업데이트 시 FleetManager에 반영하도록 콜백 설정
-        def status_handler(data: Dict[str, Any]):
-            # 로봇 상태 업데이트 로직 (비동기 함수를 동기 콜백에서 호출하기 위해 이벤트 루프 사용)
-            # data 예시: {"robot_id": 1, "status": "IDLE", "location": [1.2, 3.4], "battery": 85.0}
-            try:
-                robot_id = data.get("robot_id")
-                status = data.get("status")
-                location = tuple(data.get("location", [0, 0]))
-                battery = data.get("battery", 0.0)
-                
-                # asyncio.run_coroutine_threadsafe를 사용하여 메인 루프에서 실행
-                asyncio.run_coroutine_threadsafe(
-                    self.fleet_manager.update_robot_status(robot_id, status, location, battery),
-                    asyncio.get_event_loop()
-                )
-            except Exception as e:
-                print(f"상태 핸들러 오류: {e}")
 
-        self.communicator.listen_for_status(status_handler)
-        
+        # 로봇별 상태 토픽 구독 및 robot_id가 없는 메시지의 발신 로봇 식별에 사용
+        self._robot_ids_by_name = {robot.name: robot.id for robot in await self.fleet_manager.get_all_robot_status()}
+        self.communicator.listen_for_status(self._on_status, list(self._robot_ids_by_name))
+        # 시작 이후 등록된 로봇도 상태 토픽을 구독합니다.
+        self.fleet_manager.add_robot_registered_listener(self._on_robot_registered)
+
+        consumer = asyncio.create_task(self._consume())
+        next_sync = time.monotonic() + self.robot_sync_interval
         try:
             while self.communicator.client.is_connected:
                 await asyncio.sleep(1)
+                if self.communicator.topic_layout == "per_robot" and time.monotonic() >= next_sync:
+                    # 로봇별 토픽은 구독하기 전에는 상태를 받을 수 없으므로 DB에서 새 로봇을 찾습니다.
+                    next_sync = time.monotonic() + self.robot_sync_interval
+                    try:
+                        await self.fleet_manager.sync_robots()
+                    except Exception as e:
+                        print(f"로봇 목록 동기화 오류: {e}")
         finally:
+            consumer.cancel()
             self.communicator.disconnect()
 
+    def _on_robot_registered(self, robot: Any):
+        """새로 등록된 로봇의 이름을 기록하고, per_robot 구성이면 그 로봇의 상태 토픽을 구독합니다."""
+        self._robot_ids_by_name[robot.name] = robot.id
+        self.communicator.listen_for_status(self._on_status, [robot.name])
+
+    def _on_status(self, data: Dict[str, Any]):
+        """
+        roslibpy 스레드에서 호출되는 상태 콜백. 수신 큐에 넣고 소비 태스크를 깨우기만 합니다.
+        data 예시: {"robot_id": 1, "status": "idle", "location": [1.2, 3.4], "battery": 85.0}
+        """
+        if len(self._inbox) == self._inbox.maxlen:
+            self.stats["dropped"] += 1
+        self._inbox.append((time.monotonic(), data))
+        self.stats["received"] += 1
+
+        # 이미 깨우기가 예약되어 있으면 루프에 콜백을 또 넣지 않습니다.
+        if not self._wakeup_scheduled:
+            self._wakeup_scheduled = True
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        self._wakeup_scheduled = False
+        self._wakeup.set()
+
+    async def _consume(self):
+        """수신 큐를 배치 단위로 비우며 상태를 반영하는 단일 소비 태스크입니다."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._inbox:
+                batch = []
+                while self._inbox and len(batch) < self.max_batch_size:
+                    batch.append(self._inbox.popleft())
+                await self._apply_batch(batch)
+
+    async def _apply_batch(self, batch: List[Tuple[float, Dict[str, Any]]]):
+        # 배치에서 반영된 로봇별 최신 위치 (구역 판정은 배치당 한 번만 수행)
+        positions: Dict[int, Tuple[float, float]] = {}
+        for received_at, data in batch:
+            try:
+                robot_id = data.get("robot_id") or self._robot_ids_by_name.get(data.get("robot_name"))
+                status = data.get("status")
+                location = tuple(data.get("location", [0, 0]))
+                battery = data.get("battery", 0.0)
+                if await self.fleet_manager.update_robot_status(robot_id, status, location, battery):
+                    positions[robot_id] = (float(location[0]), float(location[1]))
+                self.stats["applied"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f"상태 반영 오류: {e}")
+                continue
+            self._record_lag((time.monotonic() - received_at) * 1000)
+        if positions:
+            try:
+                self.fleet_manager.check_zones(positions)
+            except Exception as e:
+                print(f"구역 판정 오류: {e}")
+        self.stats["batches"] += 1
+
+    def _record_lag(self, lag_ms: float):
+        """수신 시각부터 반영 완료까지의 지연(ms)을 기록합니다."""
+        self._lag_ms_total += lag_ms
+        self.stats["lag_ms_avg"] = round(self._lag_ms_total / self.stats["applied"], 3)
+        self.stats["lag_ms_max"] = round(max(self.stats["lag_ms_max"], lag_ms), 3)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """수신 큐 통계를 반환합니다."""
+        return {"pending": len(self._inbox), **self.stats}
+
 class MockRobotCommunicator(IRobotCommunicator):
     """테스트용 Mock 구현체"""
     def __init__(self, host: str = "localhost", port: int = 6000):
         print(f"Mock Robot Communicator: {host}:{port} 시뮬레이션 모드.")
 
-    def send_action_sequence(self, robot_name: str, actions: List[Dict[str, Any]]):
+    def send_action_sequence(self, robot_name: str, actions: Sequence[Dict[str, Any]],
+                             cache_key: Optional[Hashable] = None):
         print(f"--- [Mock] '{robot_name}' Action Sequence ---")
         for action in actions:
             print(f"  - {action}")
         print("------------------------------------------")
 
-    def listen_for_status(self, callback: Any):
+    def listen_for_status(self, callback: Any, robot_names: Optional[List[str]] = None):
         print("[Mock] 로봇 상태 수신 대기 중...")
\ No newline at end of file
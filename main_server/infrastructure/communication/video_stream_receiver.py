@@ -0,0 +1,233 @@
+"""
+로봇 카메라의 MJPEG 영상을 UDP로 받아 프레임(JPEG) 단위로 다시 조립하는 수신기 (Data Plane).
+
+패킷 형식 (네트워크 바이트 순서, 헤더 16 bytes + JPEG 조각):
+    magic(2s, b"VF") | robot_id(H) | frame_id(I) | chunk_index(H) | chunk_count(H) | offset(I) | 조각 데이터
+- frame_id는 로봇별로 1씩 증가하며, offset은 조각 데이터가 프레임 안에서 시작하는 위치입니다.
+- 로봇별로 프레임 슬롯 slots개짜리 ring buffer를 미리 할당해 두고, 조각을 memoryview로 offset 위치에 바로 씁니다.
+  패킷마다 bytes 조각을 잘라 내거나 이어 붙이지 않으며, 받은 패킷에서 ring buffer로 한 번만 복사됩니다.
+- 조각이 모두 모인 프레임은 ring buffer를 가리키는 memoryview로 on_frame 콜백에 전달됩니다.
+  이 view는 같은 슬롯이 다음 프레임에 재사용될 때까지만 유효하므로, 보관하려면 콜백에서 복사해야 합니다.
+"""
+import asyncio
+import socket
+import struct
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from main_server import config
+
+PACKET_MAGIC = b"VF"
+PACKET_HEADER = struct.Struct("!2sHIHHI")
+
+# (robot_id, frame_id, JPEG 프레임 view) -> None
+FrameCallback = Callable[[int, int, memoryview], None]
+
+
+def iter_frame_packets(robot_id: int, frame_id: int, frame: bytes, chunk_size: int = 1400) -> Iterator[bytes]:
+    """프레임 하나를 위 형식의 UDP 패킷들로 나눕니다. (로봇 측 송신 형식 참고 구현)"""
+    chunk_count = max(1, -(-len(frame) // chunk_size))
+    for chunk_index in range(chunk_count):
+        offset = chunk_index * chunk_size
+        yield PACKET_HEADER.pack(PACKET_MAGIC, robot_id, frame_id, chunk_index, chunk_count, offset) \
+            + frame[offset:offset + chunk_size]
+
+
+class _FrameSlot:
+    """ring buffer 슬롯 하나에서 조립 중인 프레임의 상태"""
+    __slots__ = ("base", "frame_id", "chunk_count", "received", "length", "complete", "seen")
+
+    def __init__(self, base: int, max_chunks: int):
+        self.base = base  # ring buffer 안에서 슬롯이 시작하는 위치
+        self.frame_id = -1
+        self.chunk_count = 0
+        self.received = 0
+        self.length = 0
+        self.complete = False
+        self.seen = bytearray(max_chunks)  # 조각 번호별 수신 여부 (중복 패킷 판별)
+
+
+class FrameRingBuffer:
+    """
+    로봇 한 대의 프레임 재조립 버퍼. 프레임 최대 크기 max_frame_bytes짜리 슬롯 slots개를 미리 할당합니다.
+    frame_id % slots 슬롯에 조립하므로, 최근 slots개 프레임의 조각이 순서가 섞여 와도 함께 조립할 수 있습니다.
+    - dropped : 조각이 다 모이기 전에 슬롯이 다음 프레임에 재사용되어 버려진 프레임
+    - missed  : 조각을 하나도 받지 못한 프레임 (frame_id가 건너뛴 수)
+    - late    : 슬롯이 이미 더 새 프레임에 쓰인 뒤 도착한 패킷
+    frame_id가 최근 프레임보다 RESTART_GAP 이상 작은 패킷이 RESTART_PACKETS개 연속으로 오면
+    로봇 측 송신이 다시 시작된 것(frame_id 초기화)으로 보고 버퍼를 비웁니다. (늦게 도착한 패킷 하나로는 비우지 않음)
+    """
+    RESTART_GAP = 64
+    RESTART_PACKETS = 8
+
+    def __init__(self, slots: int, max_frame_bytes: int, max_chunks: int):
+        self.slots = max(1, slots)
+        self.max_frame_bytes = max_frame_bytes
+        self.max_chunks = max_chunks
+        self._view = memoryview(bytearray(self.slots * max_frame_bytes))
+        self._slots = [_FrameSlot(i * max_frame_bytes, max_chunks) for i in range(self.slots)]
+        self.last_frame_id = -1
+        self._behind_packets = 0  # frame_id가 RESTART_GAP 이상 뒤처진 연속 패킷 수
+        self.stats: Dict[str, int] = {"packets": 0, "frames": 0, "dropped": 0, "missed": 0, "late": 0,
+                                      "duplicates": 0, "invalid": 0, "restarts": 0}
+
+    def add(self, frame_id: int, chunk_index: int, chunk_count: int, offset: int,
+            chunk: memoryview) -> Optional[memoryview]:
+        """조각 하나를 슬롯에 씁니다. 이 조각으로 프레임이 완성되면 프레임 view를, 아니면 None을 반환합니다."""
+        stats = self.stats
+        stats["packets"] += 1
+        slot = self._slots[frame_id % self.slots]
+        if slot.frame_id != frame_id:
+            if not self._start_frame(slot, frame_id, chunk_count):
+                return None
+        elif slot.complete:
+            stats["duplicates"] += 1
+            return None
+
+        end = offset + len(chunk)
+        if chunk_index >= chunk_count or chunk_count != slot.chunk_count or end > self.max_frame_bytes:
+            stats["invalid"] += 1
+            return None
+        seen = slot.seen
+        if seen[chunk_index]:
+            stats["duplicates"] += 1
+            return None
+        seen[chunk_index] = 1
+        base = slot.base
+        self._view[base + offset:base + end] = chunk
+        if end > slot.length:
+            slot.length = end
+        slot.received += 1
+        if slot.received < chunk_count:
+            return None
+
+        slot.complete = True
+        stats["frames"] += 1
+        return self._view[base:base + slot.length]
+
+    def _start_frame(self, slot: _FrameSlot, frame_id: int, chunk_count: int) -> bool:
+        """
+        슬롯을 새 프레임에 씁니다. 슬롯에 있던 프레임이 미완성이면 버려진 것으로 집계합니다.
+        슬롯이 이미 더 새 프레임에 쓰였거나(late) 조각 수가 잘못된 패킷이면 False를 반환합니다.
+        """
+        stats = self.stats
+        if not 0 < chunk_count <= self.max_chunks:
+            stats["invalid"] += 1
+            return False
+        if frame_id + self.RESTART_GAP < self.last_frame_id:
+            self._behind_packets += 1
+            if self._behind_packets < self.RESTART_PACKETS:
+                stats["late"] += 1
+                return False
+            self._restart()
+        self._behind_packets = 0
+        if frame_id < slot.frame_id:
+            stats["late"] += 1
+            return False
+
+        if slot.frame_id >= 0 and not slot.complete:
+            stats["dropped"] += 1
+        if frame_id > self.last_frame_id:
+            if self.last_frame_id >= 0:
+                stats["missed"] += frame_id - self.last_frame_id - 1
+            self.last_frame_id = frame_id
+        elif stats["missed"] > 0:
+            # 누락으로 집계했던 프레임의 첫 조각이 늦게 도착한 경우
+            stats["missed"] -= 1
+        slot.frame_id = frame_id
+        slot.chunk_count = chunk_count
+        slot.received = 0
+        slot.length = 0
+        slot.complete = False
+        slot.seen[:chunk_count] = bytes(chunk_count)
+        return True
+
+    def _restart(self):
+        for slot in self._slots:
+            if slot.frame_id >= 0 and not slot.complete:
+                self.stats["dropped"] += 1
+            slot.frame_id = -1
+        self.last_frame_id = -1
+        self.stats["restarts"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.stats
+        finished = stats["frames"] + stats["dropped"] + stats["missed"]
+        return {**stats, "last_frame_id": self.last_frame_id,
+                "drop_rate": round((stats["dropped"] + stats["missed"]) / finished, 4) if finished else 0.0}
+
+
+class VideoStreamReceiver(asyncio.DatagramProtocol):
+    """
+    로봇들의 영상 UDP 패킷을 받아 로봇별 FrameRingBuffer로 조립하고, 완성된 프레임을 on_frame으로 넘깁니다.
+    ring buffer는 로봇의 첫 패킷이 도착할 때 할당하며, 최대 max_robots대까지만 받습니다.
+    """
+    def __init__(self, on_frame: Optional[FrameCallback] = None,
+                 host: str = config.VIDEO_STREAM_HOST, port: int = config.VIDEO_STREAM_PORT,
+                 slots: int = config.VIDEO_RING_SLOTS, max_frame_bytes: int = config.VIDEO_MAX_FRAME_BYTES,
+                 max_chunks: int = config.VIDEO_MAX_CHUNKS, max_robots: int = config.VIDEO_MAX_ROBOTS,
+                 rcvbuf: int = config.VIDEO_SOCKET_RCVBUF):
+        self.on_frame = on_frame
+        self.host = host
+        self.port = port
+        self.slots = slots
+        self.max_frame_bytes = max_frame_bytes
+        self.max_chunks = max_chunks
+        self.max_robots = max_robots
+        self.rcvbuf = rcvbuf
+        self.buffers: Dict[int, FrameRingBuffer] = {}
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.stats: Dict[str, int] = {"packets": 0, "malformed": 0, "rejected_robots": 0, "callback_errors": 0}
+
+    async def start(self) -> Tuple[str, int]:
+        """UDP 소켓을 열고 수신을 시작합니다. 실제로 바인딩된 (host, port)를 반환합니다."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+            sock.bind((self.host, self.port))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(lambda: self, sock=sock)
+        address = sock.getsockname()
+        print(f"영상 스트림 수신 시작 (UDP {address[0]}:{address[1]}, 로봇당 ring buffer "
+              f"{self.slots} × {self.max_frame_bytes // 1024} KiB)")
+        return address
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        self.stats["packets"] += 1
+        if len(data) < PACKET_HEADER.size:
+            self.stats["malformed"] += 1
+            return
+        magic, robot_id, frame_id, chunk_index, chunk_count, offset = PACKET_HEADER.unpack_from(data)
+        if magic != PACKET_MAGIC:
+            self.stats["malformed"] += 1
+            return
+
+        buffer = self.buffers.get(robot_id)
+        if buffer is None:
+            if len(self.buffers) >= self.max_robots:
+                self.stats["rejected_robots"] += 1
+                return
+            buffer = self.buffers[robot_id] = FrameRingBuffer(self.slots, self.max_frame_bytes, self.max_chunks)
+
+        frame = buffer.add(frame_id, chunk_index, chunk_count, offset, memoryview(data)[PACKET_HEADER.size:])
+        if frame is not None and self.on_frame is not None:
+            try:
+                self.on_frame(robot_id, frame_id, frame)
+            except Exception as e:
+                self.stats["callback_errors"] += 1
+                print(f"영상 프레임 처리 오류 (로봇 {robot_id}, 프레임 {frame_id}): {e}")
+
+    def error_received(self, exc: Exception):
+        print(f"영상 스트림 수신 오류: {exc}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"listening": self.transport is not None, **self.stats,
+                "robots": {robot_id: buffer.get_stats() for robot_id, buffer in self.buffers.items()}}
@@ -1,7 +1,8 @@
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, TypeVar
 from pydantic import BaseModel
 import aiomysql
 
+from main_server import config
 from .connection import Database
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
@@ -10,6 +11,7 @@ class BaseRepository:
     """
     모든 리포지토리를 위한 기본 클래스입니다.
     비동기 CRUD 작업을 위한 공통 메서드를 제공합니다.
+    생성한 SQL 문은 (작업, 컬럼 구성) 단위로 캐시하여 같은 형태의 쿼리를 다시 만들지 않습니다.
     """
     def __init__(self, table_name: str, model: Type[ModelType]):
         """
@@ -20,43 +22,76 @@ class BaseRepository:
         """
         self.table_name = table_name
         self.model = model
+        self._statements: Dict[Hashable, str] = {}
+        self.statement_stats: Dict[str, int] = {"hits": 0, "misses": 0}
 
-    async def _execute(self, query: str, params: Optional[Tuple] = None, fetch: str = "all") -> Any:
+    def _statement(self, key: Hashable, build: Callable[[], str]) -> str:
+        """
+        key에 해당하는 SQL 문을 캐시에서 꺼내고, 없으면 build()로 만들어 캐시합니다.
+        캐시는 SQL_STATEMENT_CACHE_SIZE개까지만 채우며, 그 이후의 새 형태는 매번 생성합니다.
+        """
+        query = self._statements.get(key)
+        if query is not None:
+            self.statement_stats["hits"] += 1
+            return query
+
+        self.statement_stats["misses"] += 1
+        query = build()
+        if len(self._statements) < config.SQL_STATEMENT_CACHE_SIZE:
+            self._statements[key] = query
+        return query
+
+    def _to_model(self, row: Dict[str, Any]) -> ModelType:
+        """조회한 행을 모델로 변환합니다. 컬럼 변환이 필요한 리포지토리는 재정의합니다."""
+        return self.model(**row)
+
+    def get_statement_stats(self) -> Dict[str, int]:
+        """SQL 문 캐시의 적중/미스 횟수와 캐시된 문장 수를 반환합니다."""
+        return {"cached": len(self._statements), **self.statement_stats}
+
+    async def _execute(self, query: str, params: Optional[Tuple] = None, fetch: str = "all",
+                       conn: Optional[aiomysql.Connection] = None) -> Any:
         """
         주어진 쿼리를 실행하고 결과를 반환하는 내부 메서드입니다.
 
         :param query: 실행할 SQL 쿼리
         :param params: 쿼리에 바인딩할 파라미터
-        :param fetch: 'one', 'all', 'none' 중 하나
+        :param fetch: 'one', 'all', 'none' 중 하나. 'none'이면 영향을 받은(일치한) 행 수를 반환합니다.
+        :param conn: 이미 가져온 연결. 주어지면 풀에서 연결을 새로 가져오지 않고 이 연결을 사용합니다.
         """
-        async with Database.get_connection() as conn:
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                await cursor.execute(query, params or ())
-                if fetch == "one":
-                    return await cursor.fetchone()
-                elif fetch == "all":
-                    return await cursor.fetchall()
-                # fetch == 'none'의 경우, 아무것도 반환하지 않음 (e.g., INSERT, UPDATE, DELETE)
+        if conn is None:
+            async with Database.get_connection() as conn:
+                return await self._execute(query, params, fetch, conn)
+
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params or ())
+            if fetch == "one":
+                return await cursor.fetchone()
+            elif fetch == "all":
+                return await cursor.fetchall()
+            # fetch == 'none'의 경우 (e.g., INSERT, UPDATE, DELETE)
+            return cursor.rowcount
 
     async def get_by_id(self, item_id: int) -> Optional[ModelType]:
         """ID로 단일 항목을 조회합니다."""
-        query = f"SELECT * FROM {self.table_name} WHERE id = %s"
+        query = self._statement("get_by_id", lambda: f"SELECT * FROM {self.table_name} WHERE id = %s")
         result = await self._execute(query, (item_id,), fetch="one")
         if result:
-            return self.model(**result)
+            return self._to_model(result)
         return None
 
     async def get_all(self, limit: int = 100, offset: int = 0) -> List[ModelType]:
         """테이블의 모든 항목을 페이지네이션하여 조회합니다."""
-        query = f"SELECT * FROM {self.table_name} LIMIT %s OFFSET %s"
+        query = self._statement("get_all", lambda: f"SELECT * FROM {self.table_name} LIMIT %s OFFSET %s")
         results = await self._execute(query, (limit, offset), fetch="all")
-        return [self.model(**row) for row in results]
+        return [self._to_model(row) for row in results]
 
     async def create(self, data: Dict[str, Any]) -> int:
         """새로운 항목을 생성합니다."""
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["%s"] * len(data))
-        query = f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
+        keys = tuple(data.keys())
+        query = self._statement(("create", keys), lambda: (
+            f"INSERT INTO {self.table_name} ({', '.join(keys)}) VALUES ({', '.join(['%s'] * len(keys))})"
+        ))
         
         async with Database.get_connection() as conn:
             async with conn.cursor() as cursor:
@@ -64,20 +99,112 @@ class BaseRepository:
                 await conn.commit()
                 return cursor.lastrowid
 
-    async def update(self, item_id: int, data: Dict[str, Any]) -> None:
-        """ID로 기존 항목을 업데이트합니다."""
-        set_clause = ", ".join([f"{key} = %s" for key in data.keys()])
-        query = f"UPDATE {self.table_name} SET {set_clause} WHERE id = %s"
+    async def create_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        여러 항목을 하나의 트랜잭션에서 생성하고 생성된 ID 목록을 행 순서대로 반환합니다.
+        모든 행은 같은 컬럼 구성을 가져야 합니다.
+        행을 SQL_INSERT_CHUNK_SIZE개씩 나누어 직접 만든 다중 행 INSERT 문으로 실행하고, 문장마다 lastrowid를 읽습니다.
+        MySQL은 다중 행 INSERT의 lastrowid로 그 문장 첫 행의 ID를 돌려주며, 한 문장 안의 AUTO_INCREMENT 값은 연속됩니다.
+        (executemany는 문장이 max_stmt_length를 넘으면 스스로 여러 문장으로 나누고 마지막 문장의 lastrowid만 남기므로 사용하지 않습니다)
+        """
+        if not rows:
+            return []
+
+        keys = tuple(rows[0].keys())
+        row_placeholder = f"({', '.join(['%s'] * len(keys))})"
+        chunk_size = max(1, config.SQL_INSERT_CHUNK_SIZE)
+        ids: List[int] = []
+
+        async with Database.get_connection() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    for start in range(0, len(rows), chunk_size):
+                        chunk = rows[start:start + chunk_size]
+                        # 문장 형태는 컬럼 구성과 행 수에 따라 달라집니다. (마지막 조각만 행 수가 다름)
+                        query = self._statement(("create_many", keys, len(chunk)), lambda: (
+                            f"INSERT INTO {self.table_name} ({', '.join(keys)}) VALUES "
+                            + ", ".join([row_placeholder] * len(chunk))
+                        ))
+                        params = tuple(row[key] for row in chunk for key in keys)
+                        await cursor.execute(query, params)
+                        first_id = cursor.lastrowid
+                        ids.extend(range(first_id, first_id + len(chunk)))
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return ids
+
+    async def update(self, item_id: int, data: Dict[str, Any]) -> int:
+        """
+        ID로 기존 항목을 업데이트합니다. 하나의 연결에서 UPDATE와 COMMIT을 실행합니다.
+        연결 풀은 CLIENT.FOUND_ROWS로 열리므로, 값이 바뀌지 않았더라도 항목이 존재하면 1을 반환합니다.
+
+        :return: 일치한 행 수 (0이면 해당 ID의 항목이 없음)
+        """
+        keys = tuple(data.keys())
+        query = self._statement(("update", keys), lambda: (
+            f"UPDATE {self.table_name} SET {', '.join(f'{key} = %s' for key in keys)} WHERE id = %s"
+        ))
         params = list(data.values()) + [item_id]
-        
+
         async with Database.get_connection() as conn:
-            await self._execute(query, tuple(params), fetch="none")
-            await conn.commit()
+            try:
+                matched = await self._execute(query, tuple(params), fetch="none", conn=conn)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return matched
+
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        """
+        여러 항목을 하나의 UPDATE ... CASE 문으로 갱신합니다. (단일 왕복, 단일 트랜잭션)
+        모든 항목은 같은 컬럼 구성을 가져야 합니다.
+
+        :param updates: {항목 ID: 갱신할 컬럼 dict}
+        :return: 영향을 받은 행 수
+        """
+        if not updates:
+            return 0
+
+        item_ids = list(updates.keys())
+        keys = tuple(next(iter(updates.values())).keys())
+
+        def build() -> str:
+            when_clause = " ".join(["WHEN %s THEN %s"] * len(item_ids))
+            set_clause = ", ".join([f"{key} = CASE id {when_clause} END" for key in keys])
+            id_placeholders = ", ".join(["%s"] * len(item_ids))
+            return f"UPDATE {self.table_name} SET {set_clause} WHERE id IN ({id_placeholders})"
+
+        # 문장 형태는 컬럼 구성과 항목 수에 따라 달라집니다.
+        query = self._statement(("update_many", keys, len(item_ids)), build)
+
+        params: List[Any] = []
+        for key in keys:
+            for item_id in item_ids:
+                params.extend((item_id, updates[item_id][key]))
+        params.extend(item_ids)
 
-    async def delete(self, item_id: int) -> None:
-        """ID로 항목을 삭제합니다."""
-        query = f"DELETE FROM {self.table_name} WHERE id = %s"
         async with Database.get_connection() as conn:
-            await self._execute(query, (item_id,), fetch="none")
-            await conn.commit()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, tuple(params))
+                    affected = cursor.rowcount
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return affected
 
+    async def delete(self, item_id: int) -> int:
+        """ID로 항목을 삭제하고 삭제된 행 수를 반환합니다."""
+        query = self._statement("delete", lambda: f"DELETE FROM {self.table_name} WHERE id = %s")
+        async with Database.get_connection() as conn:
+            try:
+                deleted = await self._execute(query, (item_id,), fetch="none", conn=conn)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return deleted
@@ -1,7 +1,11 @@
+import asyncio
+import time
 import aiomysql
-from typing import Optional, AsyncGenerator
+from pymysql.constants import CLIENT
+from typing import Any, Dict, Optional, AsyncGenerator
 from contextlib import asynccontextmanager
 from main_server import config
+from .metrics import db_metrics
 
 class Database:
     _pool: Optional[aiomysql.Pool] = None
@@ -11,6 +15,7 @@ class Database:
         """
         데이터베이스 연결 풀을 초기화합니다.
         애플리케이션 시작 시 호출되어야 합니다.
+        풀은 DB_POOL_MIN_SIZE개의 연결로 시작하며, 첫 요청 전에 모두 사용 가능한지 확인(warmup)합니다.
         """
         if cls._pool is None:
             cls._pool = await aiomysql.create_pool(
@@ -20,8 +25,29 @@ class Database:
                 password=config.DB_PASSWORD,
                 db=config.DB_NAME,
                 autocommit=False,
+                # UPDATE의 rowcount를 '변경된 행'이 아닌 '일치한 행' 수로 받아, 존재 확인용 SELECT를 생략합니다.
+                client_flag=CLIENT.FOUND_ROWS,
+                minsize=config.DB_POOL_MIN_SIZE,
+                maxsize=config.DB_POOL_MAX_SIZE,
+                pool_recycle=config.DB_POOL_RECYCLE,
                 loop=None,  # aiomysql will use the current event loop
             )
+            await cls.warmup()
+
+    @classmethod
+    async def warmup(cls):
+        """
+        최소 연결 수만큼의 연결을 동시에 꺼내 SELECT 1을 실행합니다.
+        연결 수립 비용과 인증 실패를 첫 요청이 아닌 시작 시점에 드러냅니다.
+        """
+        async def _ping():
+            async with cls._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT 1")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_ping() for _ in range(cls._pool.minsize)))
+        print(f"DB 연결 풀 warmup 완료: {cls._pool.size}개 연결 ({(time.perf_counter() - start) * 1000:.1f} ms)")
 
     @classmethod
     async def close(cls):
@@ -43,12 +69,29 @@ class Database:
         if cls._pool is None:
             raise ConnectionError("Database pool is not initialized. Please call Database.initialize() first.")
         
+        start = time.perf_counter()
         async with cls._pool.acquire() as conn:
+            # 풀이 가득 차 있으면 acquire에서 대기하므로, 그 시간을 기록합니다.
+            db_metrics.acquire_wait.observe((time.perf_counter() - start) * 1000)
             try:
                 yield conn
             finally:
                 pass # The connection is automatically released back to the pool
 
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """연결 풀 상태(사용 중/유휴 연결 수)와 acquire 대기 및 쿼리 지연 시간 통계를 반환합니다."""
+        pool = {}
+        if cls._pool is not None:
+            pool = {
+                "minsize": cls._pool.minsize,
+                "maxsize": cls._pool.maxsize,
+                "size": cls._pool.size,
+                "free": cls._pool.freesize,
+                "in_use": cls._pool.size - cls._pool.freesize,
+            }
+        return {"pool": pool, **db_metrics.snapshot()}
+
 # FastAPI 등에서 사용할 수 있는 의존성 주입용 함수
 async def get_db_connection() -> AsyncGenerator[aiomysql.Connection, None]:
     """
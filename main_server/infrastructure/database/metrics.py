@@ -0,0 +1,85 @@
+"""
+데이터베이스 연결 풀과 쿼리 지연 시간 계측.
+- 연결 풀 acquire 대기 시간 히스토그램
+- 리포지토리 메서드별 지연 시간 히스토그램 (@timed_query)
+"""
+import bisect
+import functools
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상의 모든 값을 담습니다.
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (ms 단위)"""
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound:g}ms" for bound in self.buckets_ms] + [f"gt_{self.buckets_ms[-1]:g}ms"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class DatabaseMetrics:
+    """연결 풀 acquire 대기 시간과 리포지토리 메서드별 쿼리 지연 시간을 모읍니다."""
+    def __init__(self):
+        self.acquire_wait = LatencyHistogram()
+        self.queries: Dict[str, LatencyHistogram] = {}
+        self.query_errors: Dict[str, int] = {}
+
+    def observe_query(self, name: str, value_ms: float, failed: bool = False):
+        histogram = self.queries.get(name)
+        if histogram is None:
+            histogram = self.queries[name] = LatencyHistogram()
+        histogram.observe(value_ms)
+        if failed:
+            self.query_errors[name] = self.query_errors.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "acquire_wait": self.acquire_wait.snapshot(),
+            "queries": {
+                name: {**histogram.snapshot(), "errors": self.query_errors.get(name, 0)}
+                for name, histogram in sorted(self.queries.items())
+            },
+        }
+
+
+# 애플리케이션 전체에서 사용할 단일 DatabaseMetrics 인스턴스
+db_metrics = DatabaseMetrics()
+
+
+def timed_query(func: Callable) -> Callable:
+    """리포지토리의 비동기 메서드 실행 시간을 '클래스명.메서드명' 단위로 기록하는 데코레이터입니다."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = False
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            db_metrics.observe_query(name, (time.perf_counter() - start) * 1000, failed)
+    return wrapper
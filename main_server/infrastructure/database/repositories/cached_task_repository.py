@@ -0,0 +1,106 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from main_server import config
+from main_server.common.ttl_cache import TTLCache
+from main_server.domains.tasks.task import Task, TaskStatus
+from main_server.domains.tasks.task_repository import ITaskRepository, TaskCursor
+
+
+class CachedTaskRepository(ITaskRepository):
+    """
+    ID 기준 작업 조회 앞에 LRU+TTL 캐시를 두는 read-through 리포지토리 래퍼입니다.
+    - get_by_id: 캐시에 없을 때만 내부 리포지토리를 조회하여 결과를 캐시합니다.
+    - create / update: 쓰기 결과로 캐시 항목을 바로 갱신합니다.
+    - update_many: 갱신된 작업의 캐시 항목을 무효화합니다.
+    모든 작업 쓰기가 이 래퍼를 거치므로, 할당 직후에도 이전 상태가 반환되지 않습니다.
+
+    조회 중인 작업은 키별 세대(generation) 번호를 두고, 쓰기가 캐시를 무효화/갱신할 때마다 올립니다.
+    DB 조회가 끝났을 때 세대가 바뀌었으면 그 사이 쓰기가 있었던 것이므로 읽은 값(이전 상태일 수 있음)을 캐시하지 않습니다.
+    세대 번호는 조회 중인 키에 대해서만 유지합니다.
+    """
+    def __init__(self, repository: ITaskRepository,
+                 maxsize: int = config.TASK_CACHE_MAX_SIZE,
+                 ttl: float = config.TASK_CACHE_TTL):
+        self.repository = repository
+        self.cache: TTLCache[Task] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # 조회 중인 task_id -> [진행 중인 조회 수, 세대 번호]
+        self._reads: Dict[int, List[int]] = {}
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        task = self.cache.get(task_id)
+        if task is not None:
+            return task
+        state = self._reads.setdefault(task_id, [0, 0])
+        state[0] += 1
+        generation = state[1]
+        try:
+            task = await self.repository.get_by_id(task_id)
+        finally:
+            state[0] -= 1
+            if state[0] == 0:
+                del self._reads[task_id]
+        if task is not None and state[1] == generation:
+            self.cache.set(task_id, task)
+        return task
+
+    def _bump(self, task_id: int):
+        """진행 중인 조회가 있으면 세대를 올려, 그 조회 결과가 캐시되지 않게 합니다."""
+        state = self._reads.get(task_id)
+        if state is not None:
+            state[1] += 1
+
+    def _invalidate(self, task_id: int):
+        self._bump(task_id)
+        self.cache.invalidate(task_id)
+
+    def _store(self, task: Task):
+        self._bump(task.id)
+        self.cache.set(task.id, task)
+
+    async def get_all_by_status(self, status: TaskStatus) -> List[Task]:
+        return await self.repository.get_all_by_status(status)
+
+    async def get_all_for_user(self, user_id: int, limit: int = 100,
+                               before: Optional[TaskCursor] = None) -> List[Task]:
+        return await self.repository.get_all_for_user(user_id, limit=limit, before=before)
+
+    def stream(self, requester_id: Optional[int] = None, status: Optional[TaskStatus] = None,
+               before: Optional[TaskCursor] = None, limit: Optional[int] = None) -> AsyncIterator[Task]:
+        return self.repository.stream(requester_id=requester_id, status=status, before=before, limit=limit)
+
+    async def create(self, data: Dict[str, Any]) -> Task:
+        task = await self.repository.create(data)
+        self._store(task)
+        return task
+
+    async def create_many(self, datas: List[Dict[str, Any]]) -> List[Task]:
+        tasks = await self.repository.create_many(datas)
+        for task in tasks:
+            self._store(task)
+        return tasks
+
+    async def update(self, task_id: int, update_data: Dict[str, Any],
+                     current: Optional[Task] = None) -> Optional[Task]:
+        # 쓰기 도중 실패하더라도 이전 상태가 남지 않도록 먼저 무효화합니다.
+        self._invalidate(task_id)
+        try:
+            task = await self.repository.update(task_id, update_data, current=current)
+        finally:
+            # 쓰기 도중 시작된 조회는 이전 행을 읽었을 수 있습니다.
+            self._bump(task_id)
+        if task is not None:
+            self.cache.set(task_id, task)
+        return task
+
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        for task_id in updates:
+            self._invalidate(task_id)
+        try:
+            return await self.repository.update_many(updates)
+        finally:
+            for task_id in updates:
+                self._bump(task_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 크기와 적중/미스/내보냄/만료 횟수를 반환합니다."""
+        return self.cache.get_stats()
@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from main_server.domains.locations.location import Location
+from main_server.domains.locations.location_repository import ILocationRepository
+from main_server.infrastructure.database.base_repository import BaseRepository
+from main_server.infrastructure.database.metrics import timed_query
+
+class MySQLLocationRepository(BaseRepository, ILocationRepository):
+    """
+    MySQL 데이터베이스의 Locations 테이블(scripts/start_db.sql)을 조회하는 리포지토리 클래스입니다.
+    컬럼 이름(location_id, coordinate_x, coordinate_y)은 조회 시 모델 필드 이름으로 바꿉니다.
+    """
+    COLUMNS = "location_id AS id, name, type, coordinate_x AS x, coordinate_y AS y, is_restricted"
+
+    def __init__(self):
+        super().__init__(table_name="Locations", model=Location)
+
+    @timed_query
+    async def get_by_id(self, location_id: int) -> Optional[Location]:
+        query = self._statement("get_by_id", lambda: (
+            f"SELECT {self.COLUMNS} FROM {self.table_name} WHERE location_id = %s"
+        ))
+        result = await self._execute(query, (location_id,), fetch="one")
+        return self._to_model(result) if result else None
+
+    @timed_query
+    async def get_all(self) -> List[Location]:
+        query = self._statement("get_all", lambda: f"SELECT {self.COLUMNS} FROM {self.table_name}")
+        results = await self._execute(query, fetch="all")
+        return [self._to_model(row) for row in results]
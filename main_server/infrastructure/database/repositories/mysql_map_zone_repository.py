@@ -0,0 +1,75 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from main_server.domains.zones.map_zone import MapZone
+from main_server.domains.zones.zone_repository import IMapZoneRepository
+from main_server.infrastructure.database.base_repository import BaseRepository
+from main_server.infrastructure.database.connection import Database
+from main_server.infrastructure.database.metrics import timed_query
+
+
+def parse_polygon(polygon_data: Any) -> List[Tuple[float, float]]:
+    """
+    polygon_data 컬럼 값을 꼭짓점 좌표 목록으로 변환합니다.
+    JSON([[x, y], ...] 또는 [{"x": .., "y": ..}, ...])과 WKT(POLYGON((x y, x y, ...)))를 지원합니다.
+    """
+    if not polygon_data:
+        return []
+    text = polygon_data.strip() if isinstance(polygon_data, str) else polygon_data
+    if isinstance(text, str) and text.upper().startswith("POLYGON"):
+        # 바깥 경계(첫 번째 링)만 사용합니다.
+        ring = re.search(r"\(\(([^()]*)\)", text)
+        points = [tuple(map(float, pair.split())) for pair in ring.group(1).split(",")] if ring else []
+    else:
+        raw = json.loads(text) if isinstance(text, str) else text
+        points = [(float(p["x"]), float(p["y"])) if isinstance(p, dict) else (float(p[0]), float(p[1])) for p in raw]
+    # 닫힌 링(마지막 점 = 첫 점)이면 중복된 마지막 점을 제거합니다.
+    if len(points) > 1 and points[0] == points[-1]:
+        points = points[:-1]
+    return points
+
+
+class MySQLMapZoneRepository(BaseRepository, IMapZoneRepository):
+    """
+    MySQL 데이터베이스의 Map_Zones 테이블(scripts/start_db.sql)을 관리하는 리포지토리 클래스입니다.
+    polygon_data(JSON/WKT)는 조회 시 꼭짓점 좌표 목록으로 변환합니다.
+    """
+    COLUMNS = "zone_id AS id, name, polygon_data, type, active"
+
+    def __init__(self):
+        super().__init__(table_name="Map_Zones", model=MapZone)
+
+    def _to_model(self, row: Dict[str, Any]) -> MapZone:
+        row = dict(row)
+        row["polygon"] = parse_polygon(row.pop("polygon_data", None))
+        row["active"] = bool(row.get("active", True))
+        return self.model(**row)
+
+    @timed_query
+    async def get_by_id(self, zone_id: int) -> Optional[MapZone]:
+        query = self._statement("get_by_id", lambda: (
+            f"SELECT {self.COLUMNS} FROM {self.table_name} WHERE zone_id = %s"
+        ))
+        result = await self._execute(query, (zone_id,), fetch="one")
+        return self._to_model(result) if result else None
+
+    @timed_query
+    async def get_all(self) -> List[MapZone]:
+        query = self._statement("get_all", lambda: f"SELECT {self.COLUMNS} FROM {self.table_name}")
+        results = await self._execute(query, fetch="all")
+        return [self._to_model(row) for row in results]
+
+    @timed_query
+    async def set_active(self, zone_id: int, active: bool) -> bool:
+        query = self._statement("set_active", lambda: (
+            f"UPDATE {self.table_name} SET active = %s WHERE zone_id = %s"
+        ))
+        async with Database.get_connection() as conn:
+            try:
+                matched = await self._execute(query, (active, zone_id), fetch="none", conn=conn)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return matched > 0
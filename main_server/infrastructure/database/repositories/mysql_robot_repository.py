@@ -3,6 +3,7 @@ from typing import List, Optional, Dict, Any
 from main_server.domains.robots.robot import Robot, RobotStatus
 from main_server.domains.robots.robot_repository import IRobotRepository
 from main_server.infrastructure.database.base_repository import BaseRepository
+from main_server.infrastructure.database.metrics import timed_query
 
 class MySQLRobotRepository(BaseRepository, IRobotRepository):
     """
@@ -11,18 +12,22 @@ class MySQLRobotRepository(BaseRepository, IRobotRepository):
     def __init__(self):
         super().__init__(table_name="robots", model=Robot)
 
+    @timed_query
     async def get_by_id(self, robot_id: int) -> Optional[Robot]:
         return await super().get_by_id(robot_id)
 
+    @timed_query
     async def get_all(self) -> List[Robot]:
         return await super().get_all()
 
+    @timed_query
     async def find_by_status(self, status: RobotStatus) -> List[Robot]:
         """특정 상태의 모든 로봇을 조회합니다."""
-        query = f"SELECT * FROM {self.table_name} WHERE status = %s"
+        query = self._statement("find_by_status", lambda: f"SELECT * FROM {self.table_name} WHERE status = %s")
         results = await self._execute(query, (status.value,), fetch="all")
         return [self.model(**row) for row in results]
 
+    @timed_query
     async def create(self, name: str, battery_level: float) -> Robot:
         """새로운 로봇을 생성하고 생성된 객체를 반환합니다."""
         data_dict = {
@@ -33,24 +38,45 @@ class MySQLRobotRepository(BaseRepository, IRobotRepository):
         new_robot_id = await super().create(data_dict)
         return Robot(id=new_robot_id, **data_dict)
 
-    async def update(self, robot_id: int, update_data: Dict[str, Any]) -> Optional[Robot]:
-        """로봇 정보를 업데이트하고 업데이트된 객체를 반환합니다."""
+    @timed_query
+    async def update(self, robot_id: int, update_data: Dict[str, Any],
+                     current: Optional[Robot] = None) -> Optional[Robot]:
+        """
+        로봇 정보를 업데이트하고 업데이트된 객체를 반환합니다.
+        호출자가 알고 있는 현재 객체(current)를 넘기면 다시 조회하지 않고 변경 필드만 합쳐서 반환합니다.
+        """
         # Pydantic 모델의 기본값이 아닌 명시적으로 설정된 값만 포함
         update_values = {k: v for k, v in update_data.items() if v is not None}
         if not update_values:
-            return await self.get_by_id(robot_id) # 업데이트할 내용이 없으면 현재 상태 반환
+            return current or await self.get_by_id(robot_id) # 업데이트할 내용이 없으면 현재 상태 반환
 
-        await super().update(robot_id, update_values)
+        if not await super().update(robot_id, update_values):
+            return None # 해당 로봇이 없음
+        if current is not None:
+            return current.model_copy(update=update_values)
         return await self.get_by_id(robot_id)
 
+    @timed_query
+    async def save_telemetry_batch(self, telemetry: Dict[int, Dict[str, Any]]) -> int:
+        """
+        여러 로봇의 텔레메트리를 하나의 UPDATE ... CASE 문, 하나의 트랜잭션으로 기록합니다.
+        이미 등록된 로봇의 행만 갱신하며, 삭제되었거나 알 수 없는 로봇 ID의 행을 새로 만들지 않습니다.
+        """
+        updates = {
+            robot_id: {
+                "status": fields["status"],
+                "pose_x": fields["pose_x"],
+                "pose_y": fields["pose_y"],
+                "battery_level": fields["battery_level"],
+            }
+            for robot_id, fields in telemetry.items()
+        }
+        return await self.update_many(updates)
+
+    @timed_query
     async def delete(self, robot_id: int) -> bool:
         """ID로 로봇을 삭제하고 성공 여부를 반환합니다."""
-        robot = await self.get_by_id(robot_id)
-        if not robot:
-            return False
-        
-        await super().delete(robot_id)
-        return True
+        return await super().delete(robot_id) > 0
 
 # 이 리포지토리를 사용하기 위한 의존성 주입용 팩토리 함수
 def get_robot_repository() -> IRobotRepository:
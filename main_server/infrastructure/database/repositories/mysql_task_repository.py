@@ -1,10 +1,15 @@
 import json
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
+import aiomysql
+
+from main_server import config
 from main_server.domains.tasks.task import Task, TaskStatus
-from main_server.domains.tasks.task_repository import ITaskRepository
+from main_server.domains.tasks.task_repository import ITaskRepository, TaskCursor
 from main_server.infrastructure.database.base_repository import BaseRepository
+from main_server.infrastructure.database.connection import Database
+from main_server.infrastructure.database.metrics import timed_query
 
 class MySQLTaskRepository(BaseRepository, ITaskRepository):
     """
@@ -13,24 +18,86 @@ class MySQLTaskRepository(BaseRepository, ITaskRepository):
     def __init__(self):
         super().__init__(table_name="tasks", model=Task)
 
+    def _to_model(self, row: Dict[str, Any]) -> Task:
+        # DB에 JSON 문자열로 저장된 'details' 필드를 dict로 변환
+        if isinstance(row.get("details"), str):
+            row["details"] = json.loads(row["details"])
+        elif row.get("details") is None:
+            row["details"] = {}
+        return self.model(**row)
+
+    @timed_query
     async def get_by_id(self, task_id: int) -> Optional[Task]:
-        task_data = await super().get_by_id(task_id)
-        if task_data:
-            # DB에 JSON 문자열로 저장된 'details' 필드를 dict로 변환
-            if isinstance(task_data.details, str):
-                task_data.details = json.loads(task_data.details)
-        return task_data
+        return await super().get_by_id(task_id)
 
+    @timed_query
     async def get_all_by_status(self, status: TaskStatus) -> List[Task]:
-        query = f"SELECT * FROM {self.table_name} WHERE status = %s ORDER BY created_at ASC"
+        query = self._statement("get_all_by_status", lambda: (
+            f"SELECT * FROM {self.table_name} WHERE status = %s ORDER BY created_at ASC"
+        ))
         results = await self._execute(query, (status.value,), fetch="all")
-        return [self.model(**row) for row in results]
+        return [self._to_model(row) for row in results]
+
+    @timed_query
+    async def get_all_for_user(self, user_id: int, limit: int = 100,
+                               before: Optional[TaskCursor] = None) -> List[Task]:
+        """
+        사용자가 요청한 작업을 최신순으로 최대 limit건 조회합니다.
+        다음 페이지는 마지막 작업의 (created_at, id)를 before로 넘겨 조회합니다. (keyset 페이지네이션)
+        """
+        query, params = self._history_query(requester_id=user_id, status=None, before=before, limit=limit)
+        results = await self._execute(query, params, fetch="all")
+        return [self._to_model(row) for row in results]
+
+    async def stream(self, requester_id: Optional[int] = None, status: Optional[TaskStatus] = None,
+                     before: Optional[TaskCursor] = None, limit: Optional[int] = None,
+                     fetch_size: int = config.TASK_STREAM_FETCH_SIZE) -> AsyncIterator[Task]:
+        """
+        작업 이력을 최신순((created_at, id) 내림차순)으로 하나씩 내보내는 비동기 제너레이터입니다.
+        서버 측 커서(SSCursor)로 fetch_size건씩 읽으므로, 결과 전체를 메모리에 올리지 않습니다.
+        스트림이 끝나거나 중단될 때까지 연결 하나를 점유합니다.
+        """
+        query, params = self._history_query(requester_id, status, before, limit)
+        async with Database.get_connection() as conn:
+            async with conn.cursor(aiomysql.SSDictCursor) as cursor:
+                await cursor.execute(query, params)
+                while True:
+                    rows = await cursor.fetchmany(fetch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._to_model(row)
+
+    def _history_query(self, requester_id: Optional[int], status: Optional[TaskStatus],
+                       before: Optional[TaskCursor], limit: Optional[int]) -> Tuple[str, Tuple]:
+        """
+        (created_at, id) 내림차순 keyset 조회 쿼리를 만듭니다.
+        OFFSET 대신 직전 페이지의 마지막 (created_at, id)보다 작은 행부터 읽으므로,
+        (requester_id, created_at, id) / (status, created_at, id) 인덱스로 페이지 깊이와 무관하게 조회됩니다.
+        """
+        conditions, params = [], []
+        if requester_id is not None:
+            conditions.append("requester_id = %s")
+            params.append(requester_id)
+        if status is not None:
+            conditions.append("status = %s")
+            params.append(TaskStatus(status).value)
+        if before is not None:
+            conditions.append("(created_at < %s OR (created_at = %s AND id < %s))")
+            params.extend((before[0], before[0], before[1]))
+        if limit is not None:
+            params.append(limit)
+
+        key = ("history", requester_id is not None, status is not None, before is not None, limit is not None)
 
-    async def get_all_for_user(self, user_id: int) -> List[Task]:
-        query = f"SELECT * FROM {self.table_name} WHERE requester_id = %s ORDER BY created_at DESC"
-        results = await self._execute(query, (user_id,), fetch="all")
-        return [self.model(**row) for row in results]
+        def build() -> str:
+            where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+            tail = " LIMIT %s" if limit is not None else ""
+            return f"SELECT * FROM {self.table_name}{where} ORDER BY created_at DESC, id DESC{tail}"
 
+        return self._statement(key, build), tuple(params)
+
+    @timed_query
     async def create(self, data: Dict[str, Any]) -> Task:
         # 'details' 필드를 JSON 문자열로 변환
         if 'details' in data and isinstance(data['details'], dict):
@@ -47,15 +114,39 @@ class MySQLTaskRepository(BaseRepository, ITaskRepository):
 
         return Task(id=new_task_id, **data)
 
-    async def update(self, task_id: int, update_data: Dict[str, Any]) -> Optional[Task]:
-        if 'details' in update_data and isinstance(update_data['details'], dict):
-            update_data['details'] = json.dumps(update_data['details'])
-        
+    @timed_query
+    async def create_many(self, datas: List[Dict[str, Any]]) -> List[Task]:
+        """여러 작업을 하나의 트랜잭션으로 생성하고, 생성된 작업 목록을 입력 순서대로 반환합니다."""
+        rows = []
+        for data in datas:
+            row = {k: v for k, v in data.items() if k in Task.__fields__}
+            if isinstance(row.get('details'), dict):
+                row['details'] = json.dumps(row['details'])
+            rows.append(row)
+
+        new_task_ids = await super().create_many(rows)
+        return [Task(id=task_id, **data) for task_id, data in zip(new_task_ids, datas)]
+
+    @timed_query
+    async def update(self, task_id: int, update_data: Dict[str, Any],
+                     current: Optional[Task] = None) -> Optional[Task]:
+        """
+        작업 정보를 업데이트하고 업데이트된 객체를 반환합니다.
+        호출자가 알고 있는 현재 객체(current)를 넘기면 다시 조회하지 않고 변경 필드만 합쳐서 반환합니다.
+        """
+        update_values = dict(update_data)
         # 완료 시간을 자동으로 설정
-        if update_data.get("status") == TaskStatus.COMPLETED.value:
-            update_data["completed_at"] = datetime.utcnow()
+        if update_values.get("status") == TaskStatus.COMPLETED.value:
+            update_values["completed_at"] = datetime.utcnow()
+
+        row_values = dict(update_values)
+        if isinstance(row_values.get('details'), dict):
+            row_values['details'] = json.dumps(row_values['details'])
 
-        await super().update(task_id, update_data)
+        if not await super().update(task_id, row_values):
+            return None # 해당 작업이 없음
+        if current is not None:
+            return current.model_copy(update=update_values)
         return await self.get_by_id(task_id)
 
 def get_task_repository() -> ITaskRepository:
@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, Dict
+
+from main_server import config
+from main_server.domains.robots.robot_repository import IRobotRepository
+
+
+class TelemetryWriter:
+    """
+    로봇 텔레메트리를 DB에 기록하는 write-behind 단계.
+    - 상태 보고는 submit()으로 큐에 넣기만 하므로 호출자는 DB를 기다리지 않습니다.
+    - flush 주기 동안 같은 로봇의 보고는 최신 값(위치, 배터리, 상태) 하나로 합쳐집니다.
+    - 합쳐진 결과는 하나의 다중 행 문장, 하나의 트랜잭션으로 기록됩니다.
+    - 기록에 실패한 배치는 버리지 않고 다음 flush 주기의 배치에 합쳐 다시 기록합니다.
+      (그 사이 들어온 같은 로봇의 보고가 더 최신 값으로 덮어씁니다)
+    """
+    def __init__(self,
+                 robot_repo: IRobotRepository,
+                 flush_interval: float = config.TELEMETRY_FLUSH_INTERVAL,
+                 max_batch_size: int = config.TELEMETRY_MAX_BATCH_SIZE,
+                 queue_depth: int = config.TELEMETRY_QUEUE_DEPTH):
+        self.robot_repo = robot_repo
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_depth)
+        # 기록에 실패해 다음 배치에 합칠 텔레메트리 (로봇별로 합쳐지므로 크기는 로봇 수를 넘지 않음)
+        self._retry: Dict[int, Dict[str, Any]] = {}
+        self.stats: Dict[str, int] = {
+            "received": 0,   # submit()으로 들어온 보고 수
+            "dropped": 0,    # 큐가 가득 차 버려진 보고 수
+            "coalesced": 0,  # 같은 로봇의 더 최신 보고로 대체되어 기록되지 않은 보고 수
+            "written": 0,    # 실제로 DB에 기록된 행 수
+            "flushes": 0,    # 성공한 일괄 기록 횟수
+            "failed": 0,     # 실패한 일괄 기록 횟수
+            "retried": 0,    # 실패 후 다음 배치에 합쳐 다시 기록한 행 수
+        }
+
+    def submit(self, robot_id: int, telemetry: Dict[str, Any]) -> bool:
+        """
+        텔레메트리를 기록 큐에 넣습니다. 큐가 가득 차면 버리고 False를 반환합니다.
+        (메모리 상태 테이블에는 이미 반영되어 있으므로 다음 보고 때 다시 기록됩니다.)
+        """
+        self.stats["received"] += 1
+        try:
+            self._queue.put_nowait((robot_id, telemetry))
+            return True
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            return False
+
+    async def run(self):
+        """
+        큐를 비우며 일괄 기록을 수행하는 백그라운드 루프입니다.
+        취소될 때 큐에 남은 보고를 마지막으로 한 번 더 기록합니다.
+        """
+        try:
+            while True:
+                batch = self._take_retry()
+                if not batch:
+                    robot_id, telemetry = await self._queue.get()
+                    batch = {robot_id: dict(telemetry)}
+                await self._collect(batch)
+                if not await self.flush(batch):
+                    # DB 장애가 이어지는 동안 실패한 배치를 쉬지 않고 다시 보내지 않도록 한 주기 기다립니다.
+                    await asyncio.sleep(self.flush_interval)
+        finally:
+            while self._retry or not self._queue.empty():
+                batch = self._take_retry()
+                self._drain_nowait(batch)
+                if not await self.flush(batch):
+                    break
+
+    def _take_retry(self) -> Dict[int, Dict[str, Any]]:
+        """다시 기록할 배치를 꺼냅니다. 새 보고는 이 배치에 합쳐집니다."""
+        batch, self._retry = self._retry, {}
+        self.stats["retried"] += len(batch)
+        return batch
+
+    async def _collect(self, batch: Dict[int, Dict[str, Any]]):
+        """flush 주기가 끝나거나 배치가 가득 찰 때까지 보고를 모아 로봇별로 합칩니다."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.max_batch_size:
+            self._drain_nowait(batch)
+            if len(batch) >= self.max_batch_size:
+                break
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                robot_id, telemetry = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            self._merge(batch, robot_id, telemetry)
+
+    def _drain_nowait(self, batch: Dict[int, Dict[str, Any]]):
+        """대기 중인 보고를 기다리지 않고 꺼내 합칩니다. 배치가 가득 차면 멈춥니다."""
+        while len(batch) < self.max_batch_size:
+            try:
+                robot_id, telemetry = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            self._merge(batch, robot_id, telemetry)
+
+    def _merge(self, batch: Dict[int, Dict[str, Any]], robot_id: int, telemetry: Dict[str, Any]):
+        if robot_id in batch:
+            self.stats["coalesced"] += 1
+            batch[robot_id].update(telemetry)
+        else:
+            batch[robot_id] = dict(telemetry)
+
+    async def flush(self, batch: Dict[int, Dict[str, Any]]) -> bool:
+        """
+        합쳐진 텔레메트리를 단일 트랜잭션으로 기록합니다.
+        실패하면 배치를 다시 기록할 목록에 합쳐 두고 False를 반환합니다.
+        """
+        if not batch:
+            return True
+        try:
+            written = await self.robot_repo.save_telemetry_batch(batch)
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"텔레메트리 일괄 기록 실패 ({len(batch)}대, 다음 주기에 다시 기록): {e}")
+            self._retry.update(batch)
+            return False
+        self.stats["written"] += written
+        self.stats["flushes"] += 1
+        return True
@@ -1,6 +1,7 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from collections.abc import Mapping as _Mapping
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
 from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
@@ -9,21 +10,45 @@ class Empty(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
+class StreamRequest(_message.Message):
+    __slots__ = ("resume_after_sequence", "stream_epoch")
+    RESUME_AFTER_SEQUENCE_FIELD_NUMBER: _ClassVar[int]
+    STREAM_EPOCH_FIELD_NUMBER: _ClassVar[int]
+    resume_after_sequence: int
+    stream_epoch: int
+    def __init__(self, resume_after_sequence: _Optional[int] = ..., stream_epoch: _Optional[int] = ...) -> None: ...
+
 class InferenceResult(_message.Message):
-    __slots__ = ("robot_id", "object_detection", "face_recognition")
+    __slots__ = ("robot_id", "object_detection", "face_recognition", "sequence", "timestamp_ms", "stream_epoch")
     ROBOT_ID_FIELD_NUMBER: _ClassVar[int]
     OBJECT_DETECTION_FIELD_NUMBER: _ClassVar[int]
     FACE_RECOGNITION_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_MS_FIELD_NUMBER: _ClassVar[int]
+    STREAM_EPOCH_FIELD_NUMBER: _ClassVar[int]
     robot_id: str
     object_detection: ObjectDetectionResponse
     face_recognition: FaceRecognitionResponse
-    def __init__(self, robot_id: _Optional[str] = ..., object_detection: _Optional[_Union[ObjectDetectionResponse, _Mapping]] = ..., face_recognition: _Optional[_Union[FaceRecognitionResponse, _Mapping]] = ...) -> None: ...
+    sequence: int
+    timestamp_ms: int
+    stream_epoch: int
+    def __init__(self, robot_id: _Optional[str] = ..., object_detection: _Optional[_Union[ObjectDetectionResponse, _Mapping]] = ..., face_recognition: _Optional[_Union[FaceRecognitionResponse, _Mapping]] = ..., sequence: _Optional[int] = ..., timestamp_ms: _Optional[int] = ..., stream_epoch: _Optional[int] = ...) -> None: ...
 
 class ImageRequest(_message.Message):
-    __slots__ = ("image_id",)
+    __slots__ = ("image_id", "image_data")
     IMAGE_ID_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_DATA_FIELD_NUMBER: _ClassVar[int]
     image_id: str
-    def __init__(self, image_id: _Optional[str] = ...) -> None: ...
+    image_data: bytes
+    def __init__(self, image_id: _Optional[str] = ..., image_data: _Optional[bytes] = ...) -> None: ...
+
+class ImageBatchRequest(_message.Message):
+    __slots__ = ("image_ids", "image_data")
+    IMAGE_IDS_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_DATA_FIELD_NUMBER: _ClassVar[int]
+    image_ids: _containers.RepeatedScalarFieldContainer[str]
+    image_data: _containers.RepeatedScalarFieldContainer[bytes]
+    def __init__(self, image_ids: _Optional[_Iterable[str]] = ..., image_data: _Optional[_Iterable[bytes]] = ...) -> None: ...
 
 class ObjectDetectionResponse(_message.Message):
     __slots__ = ("object_name", "confidence", "box")
@@ -35,6 +60,12 @@ class ObjectDetectionResponse(_message.Message):
     box: BoundingBox
     def __init__(self, object_name: _Optional[str] = ..., confidence: _Optional[float] = ..., box: _Optional[_Union[BoundingBox, _Mapping]] = ...) -> None: ...
 
+class ObjectDetectionBatchResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[ObjectDetectionResponse]
+    def __init__(self, results: _Optional[_Iterable[_Union[ObjectDetectionResponse, _Mapping]]] = ...) -> None: ...
+
 class BoundingBox(_message.Message):
     __slots__ = ("x", "y", "width", "height")
     X_FIELD_NUMBER: _ClassVar[int]
@@ -45,9 +45,14 @@ class AIInferenceStub(object):
                 request_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ImageRequest.SerializeToString,
                 response_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.FaceRecognitionResponse.FromString,
                 _registered_method=True)
+        self.DetectObjectsBatch = channel.unary_unary(
+                '/ai_inference.AIInference/DetectObjectsBatch',
+                request_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ImageBatchRequest.SerializeToString,
+                response_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ObjectDetectionBatchResponse.FromString,
+                _registered_method=True)
         self.StreamInferenceResults = channel.unary_stream(
                 '/ai_inference.AIInference/StreamInferenceResults',
-                request_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.Empty.SerializeToString,
+                request_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.StreamRequest.SerializeToString,
                 response_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.InferenceResult.FromString,
                 _registered_method=True)
 
@@ -69,9 +74,19 @@ class AIInferenceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DetectObjectsBatch(self, request, context):
+        """배치 요청-응답 방식
+        여러 이미지의 객체 인식을 한 번의 호출로 요청합니다. 결과는 요청한 이미지 순서와 같은 순서로 반환됩니다.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def StreamInferenceResults(self, request, context):
         """서버 스트리밍 방식 (실시간 구독)
         서버에서 추론 결과가 발생할 때마다 클라이언트에게 스트림으로 전달합니다.
+        재연결 시 마지막으로 받은 순번을 보내면, 서버는 보관 중인 그 이후의 결과부터 다시 보냅니다.
+        순번은 서버가 다시 시작되면 1부터 새로 매기므로, 순번이 속한 스트림 epoch를 함께 주고받습니다.
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -90,9 +105,14 @@ def add_AIInferenceServicer_to_server(servicer, server):
                     request_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ImageRequest.FromString,
                     response_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.FaceRecognitionResponse.SerializeToString,
             ),
+            'DetectObjectsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.DetectObjectsBatch,
+                    request_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ImageBatchRequest.FromString,
+                    response_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ObjectDetectionBatchResponse.SerializeToString,
+            ),
             'StreamInferenceResults': grpc.unary_stream_rpc_method_handler(
                     servicer.StreamInferenceResults,
-                    request_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.Empty.FromString,
+                    request_deserializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.StreamRequest.FromString,
                     response_serializer=main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.InferenceResult.SerializeToString,
             ),
     }
@@ -161,6 +181,33 @@ class AIInference(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def DetectObjectsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/ai_inference.AIInference/DetectObjectsBatch',
+            main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ImageBatchRequest.SerializeToString,
+            main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.ObjectDetectionBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def StreamInferenceResults(request,
             target,
@@ -176,7 +223,7 @@ class AIInference(object):
             request,
             target,
             '/ai_inference.AIInference/StreamInferenceResults',
-            main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.Empty.SerializeToString,
+            main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.StreamRequest.SerializeToString,
             main__server_dot_infrastructure_dot_grpc_dot_ai__inference__pb2.InferenceResult.FromString,
             options,
             channel_credentials,
@@ -1,36 +1,139 @@
-from typing import List
+from typing import Any, Dict, Hashable, List, Optional
+from collections import OrderedDict
 import asyncio
+import itertools
 from fastapi import WebSocket
 
+from main_server import config
+
+
+class ClientChannel:
+    """
+    WebSocket 클라이언트 하나의 송신 큐와 전용 송신 태스크.
+    - 큐는 max_pending개로 제한되며, 가득 차면 가장 오래된 메시지를 버립니다. (drop-oldest)
+    - 같은 key로 들어온 메시지는 아직 전송 전이라면 최신 값으로 교체됩니다. (latest-value-wins)
+    - 전송이 send_timeout 안에 끝나지 않거나 오류가 나면 on_dead 콜백으로 연결을 정리합니다.
+    """
+    def __init__(self, websocket: WebSocket, on_dead: Any,
+                 max_pending: int = config.WS_SEND_QUEUE_SIZE,
+                 send_timeout: float = config.WS_SEND_TIMEOUT):
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self.send_timeout = send_timeout
+        self._on_dead = on_dead
+        self._pending: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._seq = itertools.count()
+        self.stats: Dict[str, int] = {"sent": 0, "dropped": 0, "replaced": 0}
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, message: str, key: Optional[Hashable] = None):
+        """메시지를 송신 큐에 넣습니다. 기다리지 않고 즉시 반환합니다."""
+        if key is None:
+            key = ("_seq", next(self._seq))
+        elif key in self._pending:
+            self._pending[key] = message
+            self.stats["replaced"] += 1
+            return
+
+        if len(self._pending) >= self.max_pending:
+            self._pending.popitem(last=False)
+            self.stats["dropped"] += 1
+        self._pending[key] = message
+        self._wakeup.set()
+
+    async def _run(self):
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._pending:
+                    _, message = self._pending.popitem(last=False)
+                    await asyncio.wait_for(self.websocket.send_text(message), self.send_timeout)
+                    self.stats["sent"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"클라이언트 전송 실패로 연결 정리: {self.websocket.client} ({e!r})")
+            self._on_dead(self.websocket)
+
+    def close(self):
+        """송신 태스크를 중단합니다."""
+        self._task.cancel()
+
 
 class ConnectionManager:
     """
     활성 WebSocket 연결을 관리하는 중앙 관리자 클래스.
     - 새로운 클라이언트의 연결 및 연결 해제를 처리합니다.
     - 모든 활성 클라이언트에게 메시지를 브로드캐스트합니다.
+      각 클라이언트는 자신만의 제한된 송신 큐와 송신 태스크를 가지므로,
+      느리거나 끊어진 클라이언트가 다른 클라이언트나 호출자를 막지 않습니다.
     """
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self._channels: Dict[WebSocket, ClientChannel] = {}
+        self.evicted = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self._channels.keys())
 
     async def connect(self, websocket: WebSocket):
         """새로운 WebSocket 연결을 수락하고 목록에 추가합니다."""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"새로운 클라이언트 연결: {websocket.client}. 총 {len(self.active_connections)} 명 접속 중.")
+        self._channels[websocket] = ClientChannel(websocket, on_dead=self._evict)
+        print(f"새로운 클라이언트 연결: {websocket.client}. 총 {len(self._channels)} 명 접속 중.")
 
     def disconnect(self, websocket: WebSocket):
         """WebSocket 연결을 목록에서 제거합니다."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            print(f"클라이언트 연결 해제: {websocket.client}. 총 {len(self.active_connections)} 명 접속 중.")
-
-    async def broadcast(self, message: str):
-        """모든 활성 WebSocket 연결에 텍스트 메시지를 브로드캐스트합니다."""
-        # 모든 클라이언트에 대한 전송 작업을 비동기적으로 동시에 실행합니다.
-        await asyncio.gather(
-            *[connection.send_text(message) for connection in self.active_connections],
-            return_exceptions=False # 오류가 발생한 전송은 무시
-        )
+        channel = self._channels.pop(websocket, None)
+        if channel:
+            channel.close()
+            print(f"클라이언트 연결 해제: {websocket.client}. 총 {len(self._channels)} 명 접속 중.")
+
+    def _evict(self, websocket: WebSocket):
+        """전송에 실패한(느리거나 끊어진) 클라이언트를 정리합니다."""
+        if websocket in self._channels:
+            self.evicted += 1
+            self.disconnect(websocket)
+            asyncio.create_task(self._close_quietly(websocket))
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket):
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+    async def broadcast(self, message: str, key: Optional[Hashable] = None):
+        """
+        모든 활성 WebSocket 연결에 텍스트 메시지를 브로드캐스트합니다.
+        메시지는 각 클라이언트의 송신 큐에 들어가기만 하므로 호출자는 전송 완료를 기다리지 않습니다.
+        key를 지정하면 (예: 로봇 ID) 아직 전송되지 않은 같은 key의 메시지는 최신 메시지로 교체됩니다.
+        """
+        for channel in self._channels.values():
+            channel.enqueue(message, key)
+
+    def send(self, websocket: WebSocket, message: str, key: Optional[Hashable] = None):
+        """특정 클라이언트 하나에게 메시지를 보냅니다. (송신 큐에 넣고 즉시 반환)"""
+        channel = self._channels.get(websocket)
+        if channel:
+            channel.enqueue(message, key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """클라이언트별 송신 통계를 반환합니다."""
+        return {
+            "connections": len(self._channels),
+            "evicted": self.evicted,
+            "clients": [
+                {"client": str(websocket.client), "pending": channel.pending, **channel.stats}
+                for websocket, channel in self._channels.items()
+            ],
+        }
 
 # 애플리케이션 전체에서 사용할 단일 ConnectionManager 인스턴스
 manager = ConnectionManager()
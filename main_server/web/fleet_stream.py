@@ -0,0 +1,79 @@
+import asyncio
+import json
+from typing import Any, Dict, Iterable
+
+from fastapi import WebSocket
+
+from main_server import config
+from main_server.domains.robots.robot import Robot
+from main_server.web.connection_manager import ConnectionManager
+
+
+class FleetStatusStream:
+    """
+    관리자 대시보드(/ws/admin/status)용 로봇 상태 스트림.
+    - 접속 시 전체 로봇 상태 스냅샷을 한 번 보냅니다.
+        {"type": "snapshot", "seq": 12, "robots": {"1": {...}, "2": {...}}}
+    - 이후에는 최대 max_rate_hz로 합쳐진 프레임을 보내며, 직전 프레임 이후 바뀐 필드만 담습니다.
+        {"type": "delta", "seq": 13, "robots": {"1": {"pose_x": 1.5, "battery_level": 79}}}
+    - 프레임은 한 번만 직렬화되어 모든 클라이언트가 같은 문자열을 공유합니다.
+    - 클라이언트가 seq 누락을 감지하면 "snapshot" 텍스트를 보내 스냅샷을 다시 받을 수 있습니다.
+    """
+    def __init__(self, connection_manager: ConnectionManager, max_rate_hz: float = config.ADMIN_STREAM_MAX_RATE_HZ):
+        self.connection_manager = connection_manager
+        self.min_interval = 1.0 / max_rate_hz
+        self._seq = 0
+        # 마지막으로 보낸 프레임 기준의 로봇별 상태 (스냅샷과 델타 계산의 기준)
+        self._sent: Dict[int, Dict[str, Any]] = {}
+        # 마지막 프레임 이후 바뀐 로봇의 최신 상태
+        self._changed: Dict[int, Dict[str, Any]] = {}
+        self._wakeup = asyncio.Event()
+        self.stats: Dict[str, int] = {"published": 0, "frames": 0, "snapshots": 0}
+
+    def load(self, robots: Iterable[Robot]):
+        """스냅샷 기준 상태를 초기화합니다. (로봇 상태 테이블 적재 시 호출)"""
+        self._sent = {robot.id: robot.model_dump(mode="json") for robot in robots}
+
+    def publish(self, robot: Robot):
+        """로봇 상태 변경을 다음 프레임에 반영하도록 기록합니다. 기다리지 않고 즉시 반환합니다."""
+        self._changed[robot.id] = robot.model_dump(mode="json")
+        self.stats["published"] += 1
+        self._wakeup.set()
+
+    def send_snapshot(self, websocket: WebSocket):
+        """특정 클라이언트에게 마지막 프레임 기준의 전체 스냅샷을 보냅니다."""
+        message = json.dumps(
+            {"type": "snapshot", "seq": self._seq, "robots": self._sent},
+            separators=(",", ":"),
+        )
+        self.connection_manager.send(websocket, message)
+        self.stats["snapshots"] += 1
+
+    def _build_frame(self) -> Dict[str, Dict[str, Any]]:
+        changed, self._changed = self._changed, {}
+        delta: Dict[str, Dict[str, Any]] = {}
+        for robot_id, current in changed.items():
+            previous = self._sent.get(robot_id)
+            if previous is None:
+                fields = current
+            else:
+                fields = {key: value for key, value in current.items() if previous.get(key) != value}
+            if fields:
+                delta[str(robot_id)] = fields
+                self._sent[robot_id] = current
+        return delta
+
+    async def run(self):
+        """변경분을 모아 최대 max_rate_hz로 델타 프레임을 브로드캐스트하는 백그라운드 루프입니다."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            delta = self._build_frame()
+            if delta:
+                self._seq += 1
+                message = json.dumps({"type": "delta", "seq": self._seq, "robots": delta}, separators=(",", ":"))
+                await self.connection_manager.broadcast(message)
+                self.stats["frames"] += 1
+
+            await asyncio.sleep(self.min_interval)
@@ -0,0 +1,98 @@
+"""
+Action Sequence 생성 + 명령 직렬화 비용 벤치마크.
+이전 방식(작업마다 분기 / dict.get 체인으로 Action 목록을 만들고 매번 인코딩)과
+현재 방식(컴파일된 템플릿 + 계획 캐시 + 경로 단위로 직렬화된 Action 목록 재사용)을 비교합니다.
+작업은 --locations 개의 목적지 중 하나로 가는 간식 배달(간식창고 → 자리)이며, 목적지는 Locations ID로 지정합니다.
+두 방식이 같은 Action 목록과 같은 명령 메시지를 만드는지도 확인합니다.
+
+실행: python -m scripts.bench_action_planner [--tasks 20000] [--robots 20] [--locations 30] [--encoding json]
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+from typing import Any, Dict, List
+
+import roslibpy
+
+from main_server.core_layer.fleet_management.action_planner import ActionPlanner, LocationTable
+from main_server.domains.locations.location import Location, LocationType
+from main_server.domains.tasks.task import Task, TaskType
+from main_server.infrastructure.communication.ros_bridge import ROSBridgeCommunicator
+
+PANTRY_ID = 1
+
+
+def legacy_actions(task: Task, locations: Dict[int, Dict[str, float]]) -> List[Dict[str, Any]]:
+    """이전 구현과 같은 방식으로 Action 목록을 만듭니다. (목적지 ID는 작업마다 조회)"""
+    actions = []
+    pantry_loc = locations[task.details.get("pantry_location")]
+    user_loc = locations[task.details.get("destination")]
+    actions.append({"action": "GOTO", "params": pantry_loc})
+    actions.append({"action": "PICKUP", "params": {"item": task.details.get("item_name")}})
+    actions.append({"action": "GOTO", "params": user_loc})
+    actions.append({"action": "DROPOFF"})
+    return actions
+
+
+def main(tasks: int, robots: int, location_count: int, encoding: str):
+    rng = random.Random(0)
+    locations = [
+        Location(id=i, name=f"loc-{i}", type=LocationType.WAREHOUSE if i == PANTRY_ID else LocationType.OFFICE,
+                 x=rng.uniform(0, 50), y=rng.uniform(0, 50))
+        for i in range(1, location_count + 1)
+    ]
+    table = LocationTable()
+    table.set_locations(locations)
+    planner = ActionPlanner(table)
+    legacy_table = {location.id: {"x": location.x, "y": location.y} for location in locations}
+
+    workload = [
+        (f"robot-{rng.randrange(robots)}",
+         Task(id=i, task_type=TaskType.SNACK_DELIVERY, requester_id=1, details={
+             "pantry_location": PANTRY_ID,
+             "destination": rng.randint(1, location_count),
+             "item_name": rng.choice(["coffee", "cookie", "chips"]),
+         }))
+        for i in range(tasks)
+    ]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        communicator = ROSBridgeCommunicator(encoding=encoding)
+    codec = communicator.codec
+
+    for robot_name, task in workload[:100]:
+        expected = legacy_actions(task, legacy_table)
+        plan = planner.plan(task)
+        assert list(plan.actions) == expected
+        message = communicator._encode_command(robot_name, plan.actions, plan.key)
+        assert codec.decode(message) == {"robot_name": robot_name, "type": "ACTION_SEQUENCE", "payload": expected}
+
+    start = time.perf_counter()
+    for robot_name, task in workload:
+        roslibpy.Message(codec.encode({"robot_name": robot_name, "type": "ACTION_SEQUENCE",
+                                       "payload": legacy_actions(task, legacy_table)}))
+    legacy_us = (time.perf_counter() - start) / tasks * 1e6
+
+    start = time.perf_counter()
+    for robot_name, task in workload:
+        plan = planner.plan(task)
+        communicator._encode_command(robot_name, plan.actions, plan.key)
+    current_us = (time.perf_counter() - start) / tasks * 1e6
+
+    print(f"작업 {tasks}개, 로봇 {robots}대, 목적지 {location_count}곳, 인코딩 {codec.name}")
+    print(f"  legacy : {legacy_us:6.2f} us/task")
+    print(f"  current: {current_us:6.2f} us/task (x{legacy_us / current_us:.1f})")
+    print(f"  계획 캐시: {planner.get_stats()['plans']}")
+    print(f"  명령 캐시: {communicator.get_command_cache_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--robots", type=int, default=20)
+    parser.add_argument("--locations", type=int, default=30)
+    parser.add_argument("--encoding", default="json", choices=["json", "msgpack", "cbor"])
+    args = parser.parse_args()
+    main(args.tasks, args.robots, args.locations, args.encoding)
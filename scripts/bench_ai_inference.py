@@ -0,0 +1,151 @@
+"""
+AI 추론 gRPC 클라이언트 처리량 벤치마크 (로컬 stub 서버 사용).
+stub 서버는 추론 장치 하나를 흉내 내어 호출마다 고정 비용(--call-ms)과 이미지당 비용(--image-ms)만큼 순서대로 처리합니다.
+동시 작업자 --concurrency 개가 객체 인식 요청을 총 --requests 번 보내며, 다음 클라이언트 구성을 비교합니다.
+  - legacy : 채널 1개, keepalive/재시도 설정 없음, 이미지마다 DetectObjects 단건 호출 (이전 구현)
+  - pooled : 채널 풀 + keepalive + 재시도 정책 + 제한 시간, 단건 호출
+  - batched: pooled + micro-batching (DetectObjectsBatch)
+--fail-every N 을 주면 서버가 N번째 호출마다 UNAVAILABLE을 반환하여, 재시도 정책으로 복구되는지 확인할 수 있습니다.
+--no-batch-rpc 를 주면 서버가 DetectObjectsBatch를 구현하지 않아, 클라이언트가 단건 호출로 전환하는지 확인할 수 있습니다.
+마지막으로 이미지 ID는 같고 이미지 데이터가 다른 요청(로봇 영상이 다시 시작된 뒤의 프레임)이 한 배치에 들어와도
+각자 자신의 이미지로 인식되는지 확인합니다.
+
+실행: python -m scripts.bench_ai_inference [--requests 4000] [--concurrency 64] [--call-ms 2] [--image-ms 0.1]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from typing import List
+
+import grpc
+import numpy as np
+
+from main_server.core_layer.ai_inference.grpc_inference_client import AIInferenceService
+from main_server.infrastructure.grpc import ai_inference_pb2, ai_inference_pb2_grpc
+
+
+class StubInferenceServicer(ai_inference_pb2_grpc.AIInferenceServicer):
+    def __init__(self, call_ms: float, image_ms: float, fail_every: int):
+        self.call_ms = call_ms
+        self.image_ms = image_ms
+        self.fail_every = fail_every
+        self.device = asyncio.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    async def _infer(self, images: int, context: grpc.aio.ServicerContext):
+        self.calls += 1
+        if self.fail_every and self.calls % self.fail_every == 0:
+            self.failures += 1
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "일시적 장애 (stub)")
+        async with self.device:
+            await asyncio.sleep((self.call_ms + self.image_ms * images) / 1000)
+
+    @staticmethod
+    def _detection(image_id: str, image_data: bytes = b"") -> ai_inference_pb2.ObjectDetectionResponse:
+        # 이미지 데이터를 함께 받으면 어떤 이미지로 인식했는지 알 수 있게 이름에 데이터를 붙입니다.
+        suffix = f"@{image_data.decode()}" if image_data else ""
+        return ai_inference_pb2.ObjectDetectionResponse(
+            object_name=f"obj-{image_id}{suffix}", confidence=0.9,
+            box=ai_inference_pb2.BoundingBox(x=1, y=2, width=3, height=4))
+
+    async def DetectObjects(self, request, context):
+        await self._infer(1, context)
+        return self._detection(request.image_id, request.image_data)
+
+    async def DetectObjectsBatch(self, request, context):
+        await self._infer(len(request.image_ids), context)
+        images = list(request.image_data) or [b""] * len(request.image_ids)
+        return ai_inference_pb2.ObjectDetectionBatchResponse(
+            results=[self._detection(image_id, image) for image_id, image in zip(request.image_ids, images)])
+
+
+class LegacyServicer(StubInferenceServicer):
+    """DetectObjectsBatch를 구현하지 않은(배치 이전 버전) 서버"""
+    DetectObjectsBatch = ai_inference_pb2_grpc.AIInferenceServicer.DetectObjectsBatch
+
+
+async def run_workload(service: AIInferenceService, requests: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            try:
+                result = await service.request_object_detection(f"img-{i}")
+                assert result["object_name"] == f"obj-img-{i}"
+            except grpc.aio.AioRpcError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    p50, p99 = np.percentile(latencies, [50, 99]) if latencies else (0.0, 0.0)
+    return {"rps": len(latencies) / elapsed, "p50": p50, "p99": p99, "errors": errors}
+
+
+async def check_same_id_frames(port: int):
+    """같은 이미지 ID의 서로 다른 프레임이 한 배치에서 덮어쓰이거나 하나로 합쳐지지 않는지 확인합니다."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        service = AIInferenceService("127.0.0.1", port, batch_window_ms=20)
+    frames = [b"before-restart", b"after-restart", b"after-restart"]
+    results = await asyncio.gather(*(service.request_object_detection("robot-1/frame-0", image_data=frame)
+                                     for frame in frames))
+    names = [result["object_name"] for result in results]
+    assert names == [f"obj-robot-1/frame-0@{frame.decode()}" for frame in frames], names
+    stats = service.get_stats()["detect_batches"]
+    print(f"  같은 이미지 ID의 다른 프레임: {names[:2]}, 같은 프레임 중복 제거 {stats['deduplicated']}회")
+    await service.close()
+
+
+async def main(args):
+    servicer_class = LegacyServicer if args.no_batch_rpc else StubInferenceServicer
+    servicer = servicer_class(args.call_ms, args.image_ms, args.fail_every)
+    server = grpc.aio.server()
+    ai_inference_pb2_grpc.add_AIInferenceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+
+    configs = {
+        "legacy": dict(pool_size=1, batch_window_ms=0, channel_options=[], deadline=None),
+        "pooled": dict(batch_window_ms=0),
+        "batched": dict(),
+    }
+    print(f"요청 {args.requests}개, 동시 작업자 {args.concurrency}개, "
+          f"stub 서버: 호출당 {args.call_ms} ms + 이미지당 {args.image_ms} ms"
+          + (f", {args.fail_every}번째 호출마다 UNAVAILABLE" if args.fail_every else "")
+          + (", DetectObjectsBatch 미구현" if args.no_batch_rpc else ""))
+    baseline = None
+    for name, kwargs in configs.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            service = AIInferenceService("127.0.0.1", port, **kwargs)
+        await run_workload(service, min(200, args.requests), args.concurrency) # 연결 수립 / 워밍업
+        calls_before = servicer.calls
+        result = await run_workload(service, args.requests, args.concurrency)
+        baseline = baseline or result["rps"]
+        print(f"  {name:8s}: {result['rps']:8.0f} req/s (x{result['rps'] / baseline:4.1f}), "
+              f"p50 {result['p50']:7.2f} ms, p99 {result['p99']:7.2f} ms, "
+              f"서버 호출 {servicer.calls - calls_before:5d}회, 실패 {result['errors']}")
+        if name == "batched":
+            print(f"    클라이언트 통계: {service.get_stats()}")
+        await service.close()
+    await check_same_id_frames(port)
+    await server.stop(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--call-ms", type=float, default=2.0)
+    parser.add_argument("--image-ms", type=float, default=0.1)
+    parser.add_argument("--fail-every", type=int, default=0)
+    parser.add_argument("--no-batch-rpc", action="store_true")
+    asyncio.run(main(parser.parse_args()))
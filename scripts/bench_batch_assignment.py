@@ -0,0 +1,144 @@
+"""
+대기 작업 배정 방식 비교 벤치마크.
+작업을 순서대로 가장 가까운 로봇에 배정하는 탐욕 방식과
+비용 행렬 + Hungarian 일괄 배정 방식을 비교합니다.
+  1. 배정 계산: 두 방식의 총 이동 거리와 배정 계산 시간 (DB 기록 제외)
+  2. 배차 전체: 실제 TaskManager.process_pending_tasks를 DISPATCH_BATCH_MODE별로 실행하여,
+     DB 왕복마다 --db-ms 만큼 지연하는 인메모리 리포지토리에 배정을 기록하기까지의 시간과 DB 왕복 횟수
+     (탐욕 방식은 배정마다 로봇 / 작업 UPDATE를 한 번씩, 일괄 방식은 로봇 / 작업 UPDATE를 한 번씩만 보냄)
+
+실행: python -m scripts.bench_batch_assignment [--robots 30] [--tasks 60] [--db-ms 0,1,2]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import time
+
+import numpy as np
+
+from main_server import config
+from main_server.core_layer.fleet_management.fleet_manager import FleetManager
+from main_server.core_layer.task_management.batch_assignment import build_cost_matrix, solve_assignment
+from main_server.core_layer.task_management.task_events import TaskEventHub
+from main_server.core_layer.task_management.task_manager import TaskManager
+from main_server.domains.robots.robot import Robot
+from main_server.domains.tasks.task import Task, TaskType, DEFAULT_TASK_PRIORITY
+from main_server.infrastructure.communication.ros_bridge import MockRobotCommunicator
+from main_server.infrastructure.database.telemetry_writer import TelemetryWriter
+from main_server.web.connection_manager import ConnectionManager
+from main_server.web.fleet_stream import FleetStatusStream
+from scripts.load_test_task_creation import SlowRobotRepository, SlowTaskRepository
+
+
+def make_scenario(num_robots: int, num_tasks: int, area: float, seed: int):
+    rng = random.Random(seed)
+    robots = [
+        Robot(id=i, name=f"robot-{i}", battery_level=rng.uniform(30, 100),
+              pose_x=rng.uniform(0, area), pose_y=rng.uniform(0, area))
+        for i in range(1, num_robots + 1)
+    ]
+    tasks = []
+    for i in range(1, num_tasks + 1):
+        task_type = rng.choice(list(TaskType))
+        tasks.append(Task(
+            id=i, task_type=task_type, requester_id=1, priority=DEFAULT_TASK_PRIORITY[task_type],
+            details={"source": {"x": 0.0, "y": 0.0},
+                     "destination": {"x": rng.uniform(0, area), "y": rng.uniform(0, area)}},
+        ))
+    targets = [(t.details["destination"]["x"], t.details["destination"]["y"]) for t in tasks]
+    return robots, tasks, targets
+
+
+def greedy(robots, tasks, targets):
+    """기존 방식: 우선순위/생성 순으로 작업마다 남은 로봇 중 가장 가까운 로봇을 배정"""
+    free = list(robots)
+    pairs = []
+    order = sorted(range(len(tasks)), key=lambda idx: tasks[idx].priority)
+    for task_idx in order:
+        if not free:
+            break
+        tx, ty = targets[task_idx]
+        robot = min(free, key=lambda r: (r.pose_x - tx) ** 2 + (r.pose_y - ty) ** 2)
+        free.remove(robot)
+        pairs.append((robots.index(robot), task_idx))
+    return pairs
+
+
+def batch(robots, tasks, targets):
+    return solve_assignment(build_cost_matrix(robots, tasks, targets))
+
+
+def total_distance(robots, targets, pairs) -> float:
+    return float(sum(
+        np.hypot(robots[r].pose_x - targets[t][0], robots[r].pose_y - targets[t][1]) for r, t in pairs
+    ))
+
+
+async def dispatch_end_to_end(robots, tasks, targets, batch_mode: bool, latency: float):
+    """DISPATCH_BATCH_MODE에 따라 대기 작업 전체를 한 번 배차하고 (소요 ms, DB 왕복 수, 배정 쌍)을 반환합니다."""
+    config.DISPATCH_BATCH_MODE = batch_mode
+    robot_repo = SlowRobotRepository(robots, latency)
+    task_repo = SlowTaskRepository(latency)
+    task_repo.latency = 0
+    stored = [await task_repo.create(task.model_dump(exclude={"id", "created_at"})) for task in tasks]
+    task_repo.latency, task_repo.round_trips = latency, 0
+    fleet_manager = FleetManager(
+        robot_repo=robot_repo,
+        robot_communicator=MockRobotCommunicator(),
+        ai_service=None,
+        status_stream=FleetStatusStream(ConnectionManager()),
+        telemetry_writer=TelemetryWriter(robot_repo),
+        task_events=TaskEventHub(),
+    )
+    await fleet_manager.load_fleet_state()
+    task_manager = TaskManager(task_repo=task_repo, fleet_manager=fleet_manager, task_events=TaskEventHub())
+    task_manager.pending_queue.load(stored)
+
+    start = time.perf_counter()
+    dispatched = await task_manager.process_pending_tasks()
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+
+    robot_index = {robot.id: idx for idx, robot in enumerate(robots)}
+    task_index = {task.id: idx for idx, task in enumerate(stored)}
+    pairs = [(robot_index[task.robot_id], task_index[task_id]) for task_id, task in dispatched.items()
+             if task.robot_id is not None]
+    return elapsed_ms, robot_repo.round_trips + task_repo.round_trips, pairs
+
+
+def main(num_robots: int, num_tasks: int, area: float, seed: int, repeat: int, db_ms: list):
+    robots, tasks, targets = make_scenario(num_robots, num_tasks, area, seed)
+    print(f"로봇 {num_robots}대, 대기 작업 {num_tasks}건, {repeat}회 반복")
+    print("1. 배정 계산 (DB 기록 제외)")
+    for name, solver in (("greedy", greedy), ("batch ", batch)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pairs = solver(robots, tasks, targets)
+        elapsed_ms = (time.perf_counter() - start) / repeat * 1e3
+        priorities = sorted(tasks[t].priority for _, t in pairs)
+        print(f"  {name}: 배정 {len(pairs)}건, 총 이동 거리 {total_distance(robots, targets, pairs):8.1f} m, "
+              f"{elapsed_ms:6.2f} ms/dispatch, 배정된 우선순위 분포 {np.bincount(priorities)[1:].tolist()}")
+
+    print("2. 배차 전체 (TaskManager.process_pending_tasks, DB 기록 포함)")
+    for ms in db_ms:
+        for name, batch_mode in (("greedy", False), ("batch ", True)):
+            # 배차 과정의 print 출력은 측정에서 제외합니다.
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed_ms, round_trips, pairs = asyncio.run(
+                    dispatch_end_to_end(robots, tasks, targets, batch_mode, ms / 1000))
+            print(f"  DB {ms:g} ms  {name}: 배정 {len(pairs)}건, 총 이동 거리 "
+                  f"{total_distance(robots, targets, pairs):8.1f} m, DB 왕복 {round_trips:3d}회, {elapsed_ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=30)
+    parser.add_argument("--tasks", type=int, default=60)
+    parser.add_argument("--area", type=float, default=60.0, help="맵 한 변의 길이 (m)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--db-ms", default="0,1,2", help="DB 왕복 지연 (ms, 쉼표로 여러 값)")
+    args = parser.parse_args()
+    main(args.robots, args.tasks, args.area, args.seed, args.repeat,
+         [float(ms) for ms in args.db_ms.split(",")])
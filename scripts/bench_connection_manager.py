@@ -0,0 +1,124 @@
+"""
+ConnectionManager 브로드캐스트 벤치마크.
+200개의 가상 WebSocket 클라이언트(일부는 의도적으로 느리거나 끊어진 상태)에 로봇 상태를 브로드캐스트하며,
+기존 방식(asyncio.gather로 모든 전송 완료를 대기)과 클라이언트별 송신 큐 방식을 비교합니다.
+
+실행: python -m scripts.bench_connection_manager [--clients 200] [--slow 20] [--dead 5]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from main_server.web.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """전송 지연과 실패를 흉내 내는 가상 WebSocket 클라이언트"""
+    def __init__(self, index: int, delay: float = 0.0, dead: bool = False):
+        self.client = f"fake-{index}"
+        self.delay = delay
+        self.dead = dead
+        self.received = 0
+
+    async def accept(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send_text(self, message: str):
+        if self.dead:
+            raise ConnectionResetError("client is gone")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+
+
+def make_clients(num_clients: int, num_slow: int, num_dead: int, slow_delay: float):
+    clients = []
+    for i in range(num_clients):
+        if i < num_dead:
+            clients.append(FakeWebSocket(i, dead=True))
+        elif i < num_dead + num_slow:
+            clients.append(FakeWebSocket(i, delay=slow_delay))
+        else:
+            clients.append(FakeWebSocket(i, delay=0.0005))
+    return clients
+
+
+def status_messages(num_messages: int, num_robots: int):
+    return [
+        (json.dumps({"id": i % num_robots, "status": "moving", "pose_x": i * 0.1, "pose_y": 0.0,
+                     "battery_level": 80}), ("robot", i % num_robots))
+        for i in range(num_messages)
+    ]
+
+
+async def run_legacy(clients, messages):
+    """기존 구현: 모든 클라이언트 전송이 끝날 때까지 호출자가 대기"""
+    latencies = []
+    errors = 0
+    for message, _ in messages:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[c.send_text(message) for c in clients], return_exceptions=True)
+        latencies.append(time.perf_counter() - start)
+        errors += sum(isinstance(r, Exception) for r in results)
+    return latencies, errors
+
+
+async def run_queued(clients, messages, interval: float):
+    manager = ConnectionManager()
+    for client in clients:
+        await manager.connect(client)
+
+    latencies = []
+    for message, key in messages:
+        start = time.perf_counter()
+        await manager.broadcast(message, key=key)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)  # 텔레메트리 수신 간격
+    await asyncio.sleep(0.5)  # 남은 전송 처리 대기
+    stats = manager.get_stats()
+    for websocket in manager.active_connections:
+        manager.disconnect(websocket)
+    return latencies, stats
+
+
+def summarize(name: str, latencies):
+    ms = sorted(l * 1e3 for l in latencies)
+    p99 = ms[int(len(ms) * 0.99) - 1]
+    print(f"  {name}: 호출자 대기 p50 {statistics.median(ms):8.3f} ms, p99 {p99:8.3f} ms, 합계 {sum(ms):9.1f} ms")
+
+
+async def main(args):
+    messages = status_messages(args.messages, args.robots)
+    print(f"클라이언트 {args.clients}개 (느림 {args.slow}, 끊김 {args.dead}), 메시지 {args.messages}개")
+
+    legacy_clients = make_clients(args.clients, args.slow, args.dead, args.slow_delay)
+    legacy_latencies, errors = await run_legacy(legacy_clients, messages[: args.legacy_messages])
+    summarize(f"gather 방식 ({args.legacy_messages}개만 측정)", legacy_latencies)
+    print(f"    전송 오류 {errors}건 (끊어진 클라이언트가 매번 다시 시도됨)")
+
+    queued_clients = make_clients(args.clients, args.slow, args.dead, args.slow_delay)
+    queued_latencies, stats = await run_queued(queued_clients, messages, args.interval)
+    summarize("송신 큐 방식", queued_latencies)
+    fast = [c.received for c in queued_clients[args.dead + args.slow:]]
+    print(f"    정리된 클라이언트 {stats['evicted']}개, 남은 연결 {stats['connections']}개, "
+          f"정상 클라이언트 평균 수신 {statistics.mean(fast):.0f}개, "
+          f"교체(latest-value-wins) {sum(c['replaced'] for c in stats['clients'])}건, "
+          f"버림 {sum(c['dropped'] for c in stats['clients'])}건")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--slow", type=int, default=20)
+    parser.add_argument("--dead", type=int, default=5)
+    parser.add_argument("--slow-delay", type=float, default=0.2, help="느린 클라이언트의 전송 지연 (초)")
+    parser.add_argument("--robots", type=int, default=30)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--legacy-messages", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.001, help="브로드캐스트 간격 (초)")
+    asyncio.run(main(parser.parse_args()))
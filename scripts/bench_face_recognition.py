@@ -0,0 +1,115 @@
+"""
+방문객 도착 시 얼굴 인식 요청 중복 제거 / 결과 캐시 효과 측정 (로컬 stub 서버 사용).
+방문객 --guests 명이 차례로 안내 데스크에 도착하고, 도착할 때마다 로봇과 카메라 --sources 대가
+같은 이미지 ID로 얼굴 인식을 동시에 요청한 뒤 --repeat-ms 간격으로 --repeats 번 더 요청합니다.
+stub 서버는 호출 하나에 --rpc-ms 가 걸리며, 방문객의 일부는 직원(employee_id 있음)입니다.
+  - legacy : 요청마다 RecognizeFaces 호출 (이전 구현)
+  - dedup  : 진행 중인 같은 이미지 요청만 공유 (캐시 없음)
+  - cached : dedup + 결과 캐시 (AI_FACE_CACHE_TTL)
+세 방식이 같은 결과를 반환하는지, 직원 ID로 최근 인식 결과를 찾을 수 있는지도 확인합니다.
+
+실행: python -m scripts.bench_face_recognition [--guests 50] [--sources 5] [--repeats 4] [--rpc-ms 20]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from typing import Dict, List
+
+import grpc
+import numpy as np
+
+from main_server.core_layer.ai_inference.grpc_inference_client import AIInferenceService
+from main_server.infrastructure.grpc import ai_inference_pb2, ai_inference_pb2_grpc
+
+
+class StubFaceServicer(ai_inference_pb2_grpc.AIInferenceServicer):
+    def __init__(self, rpc_ms: float):
+        self.rpc_ms = rpc_ms
+        self.calls = 0
+
+    async def RecognizeFaces(self, request, context):
+        self.calls += 1
+        await asyncio.sleep(self.rpc_ms / 1000)
+        guest = int(request.image_id.split("-")[1])
+        if guest % 3 == 0:
+            return ai_inference_pb2.FaceRecognitionResponse(person_type="Employee", employee_id=f"E{guest:04d}",
+                                                            confidence=0.95)
+        return ai_inference_pb2.FaceRecognitionResponse(person_type="Guest", confidence=0.8)
+
+
+async def reception(call, guests: int, sources: int, repeats: int, repeat_ms: float,
+                    arrival_ms: float) -> Dict[str, object]:
+    """방문객 도착 시나리오를 실행하고 요청별 지연과 결과를 모읍니다."""
+    latencies: List[float] = []
+    results: Dict[str, Dict] = {}
+
+    async def source(image_id: str):
+        for i in range(repeats + 1):
+            if i:
+                await asyncio.sleep(repeat_ms / 1000)
+            started = time.perf_counter()
+            result = await call(image_id)
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert results.setdefault(image_id, result) == result
+
+    async def arrival(guest: int):
+        await asyncio.sleep(guest * arrival_ms / 1000)
+        await asyncio.gather(*(source(f"guest-{guest}") for _ in range(sources)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(arrival(g) for g in range(guests)))
+    return {"elapsed": time.perf_counter() - started, "latencies": latencies, "results": results}
+
+
+async def main(args):
+    servicer = StubFaceServicer(args.rpc_ms)
+    server = grpc.aio.server()
+    ai_inference_pb2_grpc.add_AIInferenceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+
+    requests = args.guests * args.sources * (args.repeats + 1)
+    print(f"방문객 {args.guests}명 × 요청원 {args.sources}대 × {args.repeats + 1}회 = 요청 {requests}개, "
+          f"RPC {args.rpc_ms} ms, 재요청 간격 {args.repeat_ms} ms")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy = AIInferenceService("127.0.0.1", port, face_cache_ttl=0)
+        dedup = AIInferenceService("127.0.0.1", port, face_cache_ttl=0)
+        cached = AIInferenceService("127.0.0.1", port)
+    modes = {
+        "legacy": (legacy, lambda image_id: legacy._recognize_face(image_id, None)),
+        "dedup": (dedup, dedup.request_face_recognition),
+        "cached": (cached, cached.request_face_recognition),
+    }
+    expected = None
+    for name, (service, call) in modes.items():
+        calls_before = servicer.calls
+        run = await reception(call, args.guests, args.sources, args.repeats, args.repeat_ms, args.arrival_ms)
+        expected = expected or run["results"]
+        assert run["results"] == expected
+        p50, p99 = np.percentile(run["latencies"], [50, 99])
+        print(f"  {name:6s}: RPC {servicer.calls - calls_before:5d}회, p50 {p50:7.2f} ms, p99 {p99:7.2f} ms")
+
+    stats = cached.get_face_cache_stats()
+    print(f"  cached 통계: hit_rate {stats['hit_rate']}, saved_rpcs {stats['saved_rpcs']}, "
+          f"in_flight {stats['in_flight']}, by_image {stats['by_image']}")
+    employee = cached.get_recent_face_recognition("E0003")
+    assert employee is not None and employee["person_type"] == "Employee"
+    print(f"  직원 ID로 최근 인식 결과 조회: E0003 -> {employee}, by_employee {cached.get_face_cache_stats()['by_employee']}")
+
+    for service, _ in modes.values():
+        await service.close()
+    await server.stop(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guests", type=int, default=50)
+    parser.add_argument("--sources", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=4)
+    parser.add_argument("--repeat-ms", type=float, default=500)
+    parser.add_argument("--arrival-ms", type=float, default=50, help="방문객 도착 간격")
+    parser.add_argument("--rpc-ms", type=float, default=20)
+    asyncio.run(main(parser.parse_args()))
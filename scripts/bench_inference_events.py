@@ -0,0 +1,148 @@
+"""
+스트림 추론 결과 디코딩 + 처리기 호출 비용 벤치마크.
+직렬화된 InferenceResult --events 개(객체 인식 / 얼굴 인식 혼합)를 파싱한 뒤 다음 방식으로 처리하여 초당 처리 수를 비교합니다.
+  - dict+print: 이전 구현 (HasField 분기로 중첩 dict를 만들고, 처리기가 결과마다 로그를 출력)
+  - dict      : 이전 구현에서 로그 출력만 뺀 것 (dict 변환 + if/elif 분기 비용)
+  - events    : 메시지를 감싼 __slots__ 이벤트 + 결과 종류별 처리기 등록부 (로그 출력 없음)
+처리기는 모든 방식에서 로봇 ID와 신뢰도를 읽습니다. 로그 출력은 메모리 버퍼로 보내므로 터미널 출력 비용은 포함되지 않습니다.
+
+실행: python -m scripts.bench_inference_events [--events 200000]
+"""
+import argparse
+import asyncio
+import io
+import random
+import time
+from typing import Any, Dict, List
+
+from main_server.core_layer.ai_inference.inference_events import (
+    FaceRecognitionEvent, InferenceHandlerRegistry, ObjectDetectionEvent, event_from_result
+)
+from main_server.infrastructure.grpc import ai_inference_pb2
+
+
+def make_stream(count: int) -> List[bytes]:
+    rng = random.Random(0)
+    payloads = []
+    for sequence in range(1, count + 1):
+        result = ai_inference_pb2.InferenceResult(robot_id=f"robot-{rng.randrange(20)}", sequence=sequence,
+                                                  timestamp_ms=1_700_000_000_000 + sequence)
+        if rng.random() < 0.7:
+            result.object_detection.object_name = rng.choice(["person", "cup", "box", "chair"])
+            result.object_detection.confidence = rng.random()
+            result.object_detection.box.width = 10
+        else:
+            result.face_recognition.person_type = rng.choice(["Employee", "Guest", "Unknown"])
+            result.face_recognition.confidence = rng.random()
+        payloads.append(result.SerializeToString())
+    return payloads
+
+
+def legacy_dict(result: ai_inference_pb2.InferenceResult) -> Dict[str, Any]:
+    """이전 구현의 스트림 결과 변환"""
+    data = {
+        "robot_id": result.robot_id,
+        "sequence": result.sequence,
+        "timestamp_ms": result.timestamp_ms,
+    }
+    if result.HasField("object_detection"):
+        data["type"] = "object_detection"
+        data["content"] = {
+            "object_name": result.object_detection.object_name,
+            "confidence": result.object_detection.confidence
+        }
+    elif result.HasField("face_recognition"):
+        data["type"] = "face_recognition"
+        data["content"] = {
+            "person_type": result.face_recognition.person_type,
+            "confidence": result.face_recognition.confidence
+        }
+    return data
+
+
+async def run_legacy(payloads: List[bytes], log: bool) -> int:
+    sink = io.StringIO()
+    seen = 0
+
+    async def handle_ai_result(data: Dict[str, Any]):
+        nonlocal seen
+        robot_id = data.get("robot_id")
+        result_type = data.get("type")
+        content = data.get("content")
+        if log:
+            print(f"[AI Stream] 로봇({robot_id})로부터 {result_type} 결과 수신: {content}", file=sink)
+        if result_type == "object_detection":
+            seen += content["confidence"] > 0.5
+        elif result_type == "face_recognition":
+            seen += content["confidence"] > 0.5
+
+    parse = ai_inference_pb2.InferenceResult.FromString
+    for payload in payloads:
+        await handle_ai_result(legacy_dict(parse(payload)))
+    return seen
+
+
+async def run_events(payloads: List[bytes]) -> int:
+    registry = InferenceHandlerRegistry()
+    seen = 0
+
+    @registry.on(ObjectDetectionEvent.type)
+    async def on_detection(event: ObjectDetectionEvent):
+        nonlocal seen
+        event.robot_id
+        seen += event.confidence > 0.5
+
+    @registry.on(FaceRecognitionEvent.type)
+    async def on_face(event: FaceRecognitionEvent):
+        nonlocal seen
+        event.robot_id
+        seen += event.confidence > 0.5
+
+    parse = ai_inference_pb2.InferenceResult.FromString
+    dispatch = registry.dispatch
+    for payload in payloads:
+        await dispatch(event_from_result(parse(payload)))
+    return seen
+
+
+def main(count: int):
+    payloads = make_stream(count)
+    parse = ai_inference_pb2.InferenceResult.FromString
+
+    start = time.perf_counter()
+    messages = [parse(payload) for payload in payloads]
+    parse_rate = count / (time.perf_counter() - start)
+
+    # 디코딩만 (파싱된 메시지 -> dict / 이벤트)
+    decode_rates = {}
+    for name, decode in (("dict", legacy_dict), ("events", event_from_result)):
+        start = time.perf_counter()
+        for message in messages:
+            decode(message)
+        decode_rates[name] = count / (time.perf_counter() - start)
+
+    runs = {
+        "dict+print": lambda: run_legacy(payloads, log=True),
+        "dict": lambda: run_legacy(payloads, log=False),
+        "events": lambda: run_events(payloads),
+    }
+    rates, results = {}, {}
+    for name, run in runs.items():
+        start = time.perf_counter()
+        results[name] = asyncio.run(run())
+        rates[name] = count / (time.perf_counter() - start)
+    assert len(set(results.values())) == 1, results
+
+    print(f"결과 {count}개 (파싱만: {parse_rate:,.0f} events/s)")
+    print(f"  디코딩만 - dict: {decode_rates['dict']:,.0f} events/s, events: {decode_rates['events']:,.0f} events/s "
+          f"(x{decode_rates['events'] / decode_rates['dict']:.2f})")
+    print("  파싱 + 디코딩 + 처리기 호출:")
+    for name, rate in rates.items():
+        print(f"    {name:10s}: {rate:>10,.0f} events/s (x{rate / rates['dict+print']:.2f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.events)
@@ -0,0 +1,131 @@
+"""
+리포지토리 update 경로의 DB 왕복 횟수와 지연 시간 비교 벤치마크.
+실제 MySQL 대신 왕복마다 --rtt-ms 만큼 지연하는 스텁 연결 풀을 Database에 연결하여,
+기존 경로(연결 2개 사용 + UPDATE 후 재조회)와 현재 경로(연결 1개 + 알고 있는 모델에 병합)를 비교합니다.
+
+실행: python -m scripts.bench_repository_update [--rtt-ms 0.5] [--repeat 500]
+"""
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from main_server.domains.robots.robot import Robot, RobotStatus
+from main_server.infrastructure.database.connection import Database
+from main_server.infrastructure.database.repositories.mysql_robot_repository import MySQLRobotRepository
+
+ROBOT_ROW = {
+    "id": 1, "name": "robot-1", "status": "idle", "battery_level": 90.0,
+    "pose_x": 1.0, "pose_y": 2.0, "current_task_id": None,
+}
+
+
+class StubCursor:
+    def __init__(self, pool: "StubPool"):
+        self.pool = pool
+        self.rowcount = 0
+        self.lastrowid = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=()):
+        await self.pool.round_trip()
+        self.rowcount = 1
+
+    async def executemany(self, query, params):
+        await self.pool.round_trip()
+        self.rowcount = len(params)
+        self.lastrowid = 1
+
+    async def fetchone(self):
+        return dict(ROBOT_ROW)
+
+    async def fetchall(self):
+        return [dict(ROBOT_ROW)]
+
+
+class StubConnection:
+    def __init__(self, pool: "StubPool"):
+        self.pool = pool
+
+    def cursor(self, *args):
+        return StubCursor(self.pool)
+
+    async def commit(self):
+        await self.pool.round_trip()
+
+    async def rollback(self):
+        await self.pool.round_trip()
+
+
+class StubPool:
+    """왕복마다 rtt만큼 지연하고, 왕복 수와 동시에 점유된 연결 수를 세는 스텁 연결 풀"""
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self.acquired = 0
+        self.in_use = 0
+        self.max_in_use = 0
+
+    async def round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+        try:
+            yield StubConnection(self)
+        finally:
+            self.in_use -= 1
+
+
+async def legacy_update(repo: MySQLRobotRepository, robot_id: int, update_data: dict):
+    """이전 구현: 연결을 하나 잡은 채 _execute가 또 다른 연결로 UPDATE를 실행하고, 다시 SELECT로 모델을 만듭니다."""
+    set_clause = ", ".join([f"{key} = %s" for key in update_data.keys()])
+    query = f"UPDATE {repo.table_name} SET {set_clause} WHERE id = %s"
+    async with Database.get_connection() as conn:
+        await repo._execute(query, tuple(update_data.values()) + (robot_id,), fetch="none")
+        await conn.commit()
+    return await repo.get_by_id(robot_id)
+
+
+async def current_update(repo: MySQLRobotRepository, robot: Robot, update_data: dict):
+    return await repo.update(robot.id, update_data, current=robot)
+
+
+async def measure(name: str, pool: StubPool, repeat: int, call):
+    pool.round_trips = pool.acquired = pool.max_in_use = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await call()
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1e3
+    print(f"  {name}: 왕복 {pool.round_trips / repeat:.1f}회/update, 연결 획득 {pool.acquired / repeat:.1f}회/update, "
+          f"동시 점유 최대 {pool.max_in_use}개, {elapsed_ms:6.3f} ms/update")
+
+
+async def main(rtt_ms: float, repeat: int):
+    pool = StubPool(rtt_ms / 1000)
+    Database._pool = pool
+    repo = MySQLRobotRepository()
+    robot = Robot(**ROBOT_ROW)
+    update_data = {"status": RobotStatus.MOVING, "current_task_id": 7}
+
+    print(f"왕복 지연 {rtt_ms} ms, {repeat}회 반복")
+    await measure("legacy ", pool, repeat, lambda: legacy_update(repo, robot.id, update_data))
+    await measure("current", pool, repeat, lambda: current_update(repo, robot, update_data))
+    Database._pool = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="스텁 DB 왕복 지연 (ms)")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rtt_ms, args.repeat))
@@ -0,0 +1,63 @@
+"""
+ROS Bridge 메시지 인코딩별 인코딩/디코딩 비용 벤치마크.
+액션 시퀀스 명령과 상태 보고 메시지를 json / msgpack / cbor 로 인코딩했을 때의
+메시지당 소요 시간과 rosbridge 로 실제 전송되는 본문 크기(base64 포함)를 비교합니다.
+서버는 바이너리 인코딩을 명령에만 사용하며 상태 메시지는 항상 json 이므로, 바이너리 status 행은 참고용입니다.
+
+실행: python -m scripts.bench_ros_codec [--actions 6] [--repeat 20000]
+"""
+import argparse
+import json
+import time
+
+from main_server.infrastructure.communication.codec import CODECS, get_codec
+
+
+def make_messages(num_actions: int):
+    command = {
+        "robot_name": "robot-1",
+        "type": "ACTION_SEQUENCE",
+        "payload": [
+            {"action": "GOTO", "params": {"x": 12.345 + i, "y": 6.789 - i}} if i % 2 == 0
+            else {"action": "WAIT_FOR_INTERACTION", "params": {"timeout": 30, "message": "물품을 받아주세요"}}
+            for i in range(num_actions)
+        ],
+    }
+    status = {"robot_id": 1, "status": "moving", "location": [12.345, 6.789], "battery": 87.5}
+    return {"command": command, "status": status}
+
+
+def main(num_actions: int, repeat: int):
+    messages = make_messages(num_actions)
+    print(f"액션 {num_actions}개 명령 / 상태 보고, {repeat}회 반복")
+    for codec_name in CODECS:
+        try:
+            codec = get_codec(codec_name)
+        except ImportError as e:
+            print(f"  {codec_name:7s}: 건너뜀 ({e})")
+            continue
+
+        for kind, message in messages.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                encoded = codec.encode(message)
+            encode_us = (time.perf_counter() - start) / repeat * 1e6
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                decoded = codec.decode(encoded)
+            decode_us = (time.perf_counter() - start) / repeat * 1e6
+
+            assert decoded == message
+            wire_bytes = len(json.dumps(encoded, separators=(",", ":")).encode("utf-8"))
+            note = " (참고용: 상태는 항상 json)" if kind == "status" and codec_name != "json" else ""
+            print(f"  {codec_name:7s} {kind:7s}: encode {encode_us:6.2f} us, decode {decode_us:6.2f} us, "
+                  f"rosbridge 본문 {wire_bytes:4d} bytes{note}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--actions", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.actions, args.repeat)
@@ -0,0 +1,119 @@
+"""
+구역 엔진(ZoneEngine) 판정 비용 벤치마크.
+--zones 개의 다각형 구역과 --robots 대의 로봇이 --hz 주기로 위치를 보고하는 상황을 --seconds 동안 재현하고,
+텔레메트리 배치(모든 로봇의 위치 1회분)당 판정 시간을 다음 방식과 비교합니다.
+  - loop : 로봇마다, 구역마다 Python으로 ray casting (구역을 서버에서 판정하는 가장 단순한 구현)
+  - zone : 구역마다 geometry.points_in_polygon으로 전체 로봇을 판정 (경계 상자 필터 없음)
+  - engine: ZoneEngine.check (경계 상자 필터 + 후보 쌍만 벡터화 판정 + 진입/이탈 diff)
+세 방식의 판정 결과와, 엔진이 만든 진입/이탈 이벤트가 매 배치의 소속 변화와 일치하는지도 확인합니다.
+
+실행: python -m scripts.bench_zone_engine [--zones 100] [--robots 50] [--hz 10] [--seconds 60]
+"""
+import argparse
+import math
+import random
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from main_server.core_layer.navigation.geometry import points_in_polygon
+from main_server.core_layer.navigation.zone_engine import ZoneEngine
+from main_server.domains.zones.map_zone import MapZone
+
+WIDTH, HEIGHT = 100.0, 60.0
+
+
+def random_zone(zone_id: int, rng: random.Random) -> MapZone:
+    """사무실 지도 위 임의 위치의 별 모양(비볼록) 다각형 구역을 만듭니다."""
+    cx, cy = rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)
+    n = rng.randint(4, 12)
+    polygon = []
+    for i in range(n):
+        angle = 2 * math.pi * i / n
+        radius = rng.uniform(1.0, 4.0) * (0.5 if i % 2 else 1.0)
+        polygon.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
+    zone_type = rng.choice(["RESTRICTED", "SLOW_ZONE", "SLOW_ZONE"])
+    return MapZone(id=zone_id, name=f"zone-{zone_id}", polygon=polygon, type=zone_type)
+
+
+def loop_inside(positions: np.ndarray, polygons: List[List[Tuple[float, float]]]) -> np.ndarray:
+    inside = np.zeros((len(positions), len(polygons)), dtype=bool)
+    for r, (x, y) in enumerate(positions.tolist()):
+        for z, polygon in enumerate(polygons):
+            crossings = 0
+            for i in range(len(polygon)):
+                x1, y1 = polygon[i]
+                x2, y2 = polygon[(i + 1) % len(polygon)]
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    crossings += 1
+            inside[r, z] = crossings % 2 == 1
+    return inside
+
+
+def zone_inside(positions: np.ndarray, polygons: List[np.ndarray]) -> np.ndarray:
+    return np.stack([points_in_polygon(positions, polygon) for polygon in polygons], axis=1)
+
+
+def main(zone_count: int, robots: int, hz: float, seconds: float):
+    rng = random.Random(0)
+    zones = [random_zone(i, rng) for i in range(1, zone_count + 1)]
+    polygons = [list(zone.polygon) for zone in zones]
+    polygon_arrays = [np.asarray(polygon) for polygon in polygons]
+
+    engine = ZoneEngine()
+    engine.set_zones(zones)
+
+    # 로봇은 0.5 m/s 안팎으로 임의 보행합니다.
+    np_rng = np.random.default_rng(0)
+    positions = np.column_stack([np_rng.uniform(0, WIDTH, robots), np_rng.uniform(0, HEIGHT, robots)])
+    heading = np_rng.uniform(0, 2 * math.pi, robots)
+    step = 0.5 / hz
+    batches = int(hz * seconds)
+
+    loop_ms, zone_ms, engine_ms = [], [], []
+    previous = np.zeros((robots, zone_count), dtype=bool)
+    events_total = 0
+    for batch in range(batches):
+        heading += np_rng.normal(0, 0.3, robots)
+        positions[:, 0] = np.clip(positions[:, 0] + step * np.cos(heading), 0, WIDTH)
+        positions[:, 1] = np.clip(positions[:, 1] + step * np.sin(heading), 0, HEIGHT)
+        batch_positions = {robot_id: (x, y) for robot_id, (x, y) in enumerate(positions.tolist(), start=1)}
+
+        start = time.perf_counter()
+        events = engine.check(batch_positions)
+        engine_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        expected = zone_inside(positions, polygon_arrays)
+        zone_ms.append((time.perf_counter() - start) * 1000)
+
+        # 순수 Python 방식은 느리므로 일부 배치에서만 측정합니다.
+        if batch % 10 == 0:
+            start = time.perf_counter()
+            assert (loop_inside(positions, polygons) == expected).all()
+            loop_ms.append((time.perf_counter() - start) * 1000)
+
+        changed = {(robot_id, zone_id) for robot_id, zone_id in zip(*np.nonzero(expected != previous))}
+        assert {(e.robot_id - 1, e.zone_id - 1) for e in events} == changed
+        assert all((e.kind == "enter") == expected[e.robot_id - 1, e.zone_id - 1] for e in events)
+        previous = expected
+        events_total += len(events)
+
+    budget_ms = 1000 / hz
+    print(f"구역 {zone_count}개 × 로봇 {robots}대 × {hz:g} Hz, 배치 {batches}개 (배치당 예산 {budget_ms:.0f} ms)")
+    for name, samples in (("loop", loop_ms), ("zone", zone_ms), ("engine", engine_ms)):
+        p50, p99 = np.percentile(samples, [50, 99])
+        print(f"  {name:6s}: p50 {p50:8.3f} ms, p99 {p99:8.3f} ms, 예산 사용률 {p50 / budget_ms * 100:6.2f} %, "
+              f"처리 가능 {robots / p50 * 1000:>12,.0f} poses/s")
+    print(f"  진입/이탈 이벤트 {events_total}개, 엔진 통계: {engine.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, default=100)
+    parser.add_argument("--robots", type=int, default=50)
+    parser.add_argument("--hz", type=float, default=10.0)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    args = parser.parse_args()
+    main(args.zones, args.robots, args.hz, args.seconds)
@@ -0,0 +1,190 @@
+"""
+AI 추론 결과 스트림 소비자(InferenceStreamConsumer) 점검 스크립트 (프로세스 내 가짜 gRPC 서버 사용).
+가짜 서버는 --rate 개/초로 순번이 붙은 추론 결과를 만들고 최근 --replay 개를 보관하며,
+스트림을 무작위로 끊습니다(UNAVAILABLE). 재구독 요청의 resume_after_sequence 이후 결과는 보관 범위 안에서 다시 보냅니다.
+실행 중간에 서버 재시작도 흉내 냅니다. 재시작하면 스트림 epoch가 바뀌고 순번이 1부터 다시 매겨지며 보관 결과도 사라집니다.
+결과 처리기는 결과 하나에 --handler-ms 만큼 걸려, 처리 속도가 생성 속도보다 느린 상황을 만들 수 있습니다.
+
+다음을 확인합니다.
+  - 연결이 끊겨도 소비자가 다시 연결하며, 같은 결과를 두 번 처리하지 않는다.
+  - 서버가 다시 시작된 뒤의 결과를 (순번이 작아졌다고) 중복으로 버리지 않고 이어서 처리한다.
+  - 생성된 모든 결과는 처리되었거나, 큐가 가득 차 버려졌거나(dropped), 서버가 다시 보내지 못해 누락(missed)으로 집계된다.
+  - 처리기가 느려도(drop_* 정책) 스트림 읽기가 밀리지 않아 서버 → 수신 지연이 작게 유지된다.
+이전 구현(결과마다 처리기를 기다리고, 첫 연결 오류에서 종료)과도 비교합니다.
+
+실행: python -m scripts.check_ai_stream [--seconds 5] [--rate 500] [--handler-ms 1] [--policy drop_oldest]
+"""
+import argparse
+import asyncio
+import collections
+import contextlib
+import io
+import random
+import time
+from typing import List, Tuple
+
+import grpc
+
+from main_server.core_layer.ai_inference.grpc_inference_client import AIInferenceService
+from main_server.core_layer.ai_inference.inference_events import InferenceEvent
+from main_server.core_layer.ai_inference.inference_stream import OVERFLOW_POLICIES, InferenceStreamConsumer
+from main_server.infrastructure.grpc import ai_inference_pb2, ai_inference_pb2_grpc
+
+
+class FlakyStreamServicer(ai_inference_pb2_grpc.AIInferenceServicer):
+    """결과를 계속 만들어 내고, 구독 스트림을 무작위로 끊는 가짜 AI 서버"""
+    def __init__(self, rate: float, replay: int, disconnect_every: float, rng: random.Random):
+        self.rate = rate
+        self.disconnect_every = disconnect_every
+        self.rng = rng
+        self.epoch = 1
+        self.sequence = 0
+        self.produced = 0 # 모든 epoch에서 만든 결과 수
+        self.paused = False
+        self.history: "collections.deque[ai_inference_pb2.InferenceResult]" = collections.deque(maxlen=replay)
+        self.new_result = asyncio.Condition()
+        self.disconnects = 0
+
+    async def produce(self):
+        interval = 1 / self.rate
+        next_at = time.monotonic()
+        while True:
+            next_at += interval
+            await asyncio.sleep(max(next_at - time.monotonic(), 0))
+            if self.paused:
+                next_at = time.monotonic()
+                continue
+            self.sequence += 1
+            self.produced += 1
+            self.history.append(ai_inference_pb2.InferenceResult(
+                robot_id=f"robot-{self.sequence % 5}", sequence=self.sequence, timestamp_ms=int(time.time() * 1000),
+                stream_epoch=self.epoch,
+                object_detection=ai_inference_pb2.ObjectDetectionResponse(object_name="cup", confidence=0.9)))
+            async with self.new_result:
+                self.new_result.notify_all()
+
+    async def restart(self):
+        """서버 재시작: epoch를 바꾸고 순번과 보관 결과를 초기화하며, 열린 스트림을 모두 끊습니다."""
+        self.epoch += 1
+        self.sequence = 0
+        self.history.clear()
+        async with self.new_result:
+            self.new_result.notify_all()
+
+    async def StreamInferenceResults(self, request, context):
+        epoch = self.epoch
+        # 다른 epoch의 순번은 이 서버의 순번과 관계가 없으므로 처음부터 보냅니다.
+        cursor = request.resume_after_sequence if request.stream_epoch == epoch else 0
+        # 연결마다 평균 disconnect_every 초 뒤에 끊습니다.
+        cut_at = time.monotonic() + self.rng.expovariate(1 / self.disconnect_every)
+        while True:
+            if self.epoch != epoch:
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "서버 재시작 (fake)")
+            for result in list(self.history):
+                if result.sequence > cursor:
+                    yield result
+                    cursor = result.sequence
+            if time.monotonic() >= cut_at:
+                self.disconnects += 1
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "연결 끊김 (fake)")
+            async with self.new_result:
+                await self.new_result.wait()
+
+
+async def legacy_stream(service: AIInferenceService, callback, errors: List[str]):
+    """이전 구현: 결과마다 콜백을 기다리고, 연결 오류가 나면 구독을 끝냅니다."""
+    try:
+        async for event in service.stream_inference_results(0):
+            await callback(event)
+    except grpc.aio.AioRpcError as e:
+        errors.append(e.code().name)
+
+
+async def main(args):
+    rng = random.Random(0)
+    random.seed(0)
+    servicer = FlakyStreamServicer(args.rate, args.replay, args.disconnect_every, rng)
+    server = grpc.aio.server()
+    ai_inference_pb2_grpc.add_AIInferenceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    producer = asyncio.create_task(servicer.produce())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        service = AIInferenceService("127.0.0.1", port)
+
+    processed: List[Tuple[int, int]] = []
+    legacy_processed: List[int] = []
+    legacy_errors: List[str] = []
+
+    async def handler(event: InferenceEvent):
+        await asyncio.sleep(args.handler_ms / 1000)
+        processed.append((event.stream_epoch, event.sequence))
+
+    async def legacy_handler(event: InferenceEvent):
+        await asyncio.sleep(args.handler_ms / 1000)
+        legacy_processed.append(event.sequence)
+
+    consumer = InferenceStreamConsumer(service.stream_inference_results, handler, queue_size=args.queue_size,
+                                       overflow_policy=args.policy, reconnect_initial=0.05, reconnect_max=0.5)
+    async def wait_until_caught_up():
+        """소비자가 서버의 마지막 결과까지 받고 큐를 비울 때까지 기다립니다. (재연결 대기 포함)"""
+        give_up_at = time.monotonic() + 30
+        while time.monotonic() < give_up_at:
+            stats = consumer.get_stats()
+            if (stats["stream_epoch"], stats["last_sequence"]) == (servicer.epoch, servicer.sequence) \
+                    and stats["processed"] + stats["dropped"] == stats["received"]:
+                return
+            await asyncio.sleep(0.05)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        tasks = [asyncio.create_task(consumer.run()),
+                 asyncio.create_task(legacy_stream(service, legacy_handler, legacy_errors))]
+        await asyncio.sleep(args.seconds / 2)
+        # 소비자가 따라잡은 상태에서 서버를 재시작합니다. (재시작 전 결과가 누락 없이 집계되도록)
+        servicer.paused = True
+        await wait_until_caught_up()
+        before_restart = consumer.get_stats()
+        await servicer.restart()
+        servicer.paused = False
+        await asyncio.sleep(args.seconds / 2)
+        producer.cancel()
+        await wait_until_caught_up()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, producer, return_exceptions=True)
+    await service.close()
+    await server.stop(None)
+
+    stats = consumer.get_stats()
+    produced = servicer.produced
+    print(f"{args.seconds:g}초, 생성 {produced}개 ({args.rate:g}/s), 처리기 {args.handler_ms} ms/개, "
+          f"정책 {args.policy}, 큐 {args.queue_size}, 서버 강제 끊김 {servicer.disconnects}회, "
+          f"재시작 1회 (재시작 전 순번 {before_restart['last_sequence']}, 후 {servicer.sequence})")
+    print(f"  consumer: 처리 {stats['processed']}, 버림 {stats['dropped']}, 누락 {stats['missed']}, "
+          f"중복 수신 {stats['duplicates']}, 재연결 {stats['connects'] - 1}회, 서버 재시작 감지 {stats['server_restarts']}회, "
+          f"서버→수신 지연 avg {stats['server_lag_ms_avg']} ms / max {stats['server_lag_ms_max']} ms, "
+          f"큐 지연 avg {stats['queue_lag_ms_avg']} ms")
+    print(f"  legacy  : 처리 {len(legacy_processed)} (마지막 순번 {max(legacy_processed, default=0)})"
+          + (f", {legacy_errors[0]} 오류로 구독 종료" if legacy_errors else ""))
+
+    assert len(processed) == len(set(processed)), "같은 결과를 두 번 처리했습니다."
+    assert processed == sorted(processed), "결과 처리 순서가 바뀌었습니다."
+    assert stats["processed"] + stats["dropped"] == stats["received"]
+    assert stats["received"] + stats["missed"] == produced, "처리 / 버림 / 누락으로 집계되지 않은 결과가 있습니다."
+    assert stats["server_restarts"] == 1 and stats["stream_epoch"] == servicer.epoch
+    assert stats["last_sequence"] == servicer.sequence, "재시작 후 마지막 결과까지 받지 못했습니다."
+    print("  OK: 모든 결과가 처리 / 버림 / 누락 중 하나로 집계되었습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=500.0)
+    parser.add_argument("--handler-ms", type=float, default=1.0)
+    parser.add_argument("--policy", default="drop_oldest", choices=OVERFLOW_POLICIES)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--replay", type=int, default=1000)
+    parser.add_argument("--disconnect-every", type=float, default=0.5, help="연결당 평균 유지 시간 (초)")
+    asyncio.run(main(parser.parse_args()))
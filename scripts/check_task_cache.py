@@ -0,0 +1,202 @@
+"""
+작업 ID 조회 캐시(CachedTaskRepository) 일관성 점검 스크립트.
+DB 대신 인메모리 작업 리포지토리와 가짜 FleetManager로 TaskManager를 구동하여,
+작업을 조회(캐시 적재)한 뒤 순차 배정 / 일괄 배정이 일어나면 다음 조회에서
+ASSIGNED 상태가 반환되는지(이전 PENDING 상태가 남지 않는지) 확인합니다.
+sync 모드의 작업 생성이 디스패처의 배차 결과(배정 또는 PENDING)를 반환하는지도 확인합니다.
+캐시 미스 조회가 DB를 읽는 동안 update / update_many가 끝나는 경쟁 상황에서
+이전 PENDING 행이 다시 캐시되지 않는지, LRU 내보냄과 TTL 만료도 함께 확인합니다.
+
+실행: python -m scripts.check_task_cache
+"""
+import asyncio
+import contextlib
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from main_server import config
+from main_server.common.ttl_cache import TTLCache
+from main_server.core_layer.navigation.travel_cost import TravelCostMatrix
+from main_server.core_layer.task_management.task_events import TaskEventHub
+from main_server.core_layer.task_management.task_manager import TaskManager
+from main_server.domains.robots.robot import Robot
+from main_server.domains.tasks.task import Task, TaskStatus, TaskType
+from main_server.domains.tasks.task_repository import ITaskRepository, TaskCursor
+from main_server.infrastructure.database.repositories.cached_task_repository import CachedTaskRepository
+
+
+class InMemoryTaskRepository(ITaskRepository):
+    """DB 역할을 하는 인메모리 리포지토리. 조회할 때마다 새 객체를 돌려주고 조회 횟수를 셉니다."""
+    def __init__(self):
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.reads = 0
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        self.reads += 1
+        row = self.rows.get(task_id)
+        return Task(**row) if row else None
+
+    async def get_all_by_status(self, status: TaskStatus) -> List[Task]:
+        return [Task(**row) for row in self.rows.values() if row["status"] == TaskStatus(status)]
+
+    async def get_all_for_user(self, user_id: int, limit: int = 100,
+                               before: Optional[TaskCursor] = None) -> List[Task]:
+        return [Task(**row) for row in self.rows.values() if row["requester_id"] == user_id][:limit]
+
+    async def stream(self, requester_id: Optional[int] = None, status: Optional[TaskStatus] = None,
+                     before: Optional[TaskCursor] = None, limit: Optional[int] = None) -> AsyncIterator[Task]:
+        for row in list(self.rows.values())[:limit]:
+            yield Task(**row)
+
+    async def create(self, data: Dict[str, Any]) -> Task:
+        task = Task(id=len(self.rows) + 1, **data)
+        self.rows[task.id] = task.model_dump()
+        return task
+
+    async def create_many(self, datas: List[Dict[str, Any]]) -> List[Task]:
+        return [await self.create(data) for data in datas]
+
+    async def update(self, task_id: int, update_data: Dict[str, Any],
+                     current: Optional[Task] = None) -> Optional[Task]:
+        if task_id not in self.rows:
+            return None
+        self.rows[task_id].update(update_data)
+        return Task(**self.rows[task_id])
+
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        for task_id, fields in updates.items():
+            self.rows[task_id].update(fields)
+        return len(updates)
+
+
+class SlowReadTaskRepository(InMemoryTaskRepository):
+    """조회가 행을 읽은 직후 release 될 때까지 멈추는 리포지토리 (조회와 쓰기의 경쟁 재현용)"""
+    def __init__(self):
+        super().__init__()
+        self.read_started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        task = await super().get_by_id(task_id)
+        self.read_started.set()
+        await self.release.wait()
+        return task
+
+
+class FakeFleetManager:
+    """가용 로봇 목록만 관리하는 가짜 FleetManager"""
+    def __init__(self):
+        self.available: List[Robot] = []
+        self.travel_costs = TravelCostMatrix() # 비어 있으면 직선 거리로 배차
+
+    def add_robot_available_listener(self, listener):
+        pass
+
+    def get_available_robots(self) -> List[Robot]:
+        return list(self.available)
+
+    async def find_optimal_robot(self, target_pose) -> Optional[Robot]:
+        return self.available[0] if self.available else None
+
+    async def assign_task_to_robot(self, robot: Robot, task: Task) -> Robot:
+        self.available.remove(robot)
+        return robot
+
+    async def assign_tasks(self, assignments, record_tasks=None):
+        if record_tasks is not None:
+            await record_tasks()
+        for robot, _ in assignments:
+            self.available.remove(robot)
+
+
+async def check_assignment(batch_mode: bool):
+    config.DISPATCH_BATCH_MODE = batch_mode
+    db = InMemoryTaskRepository()
+    repo = CachedTaskRepository(db, maxsize=100, ttl=60)
+    fleet = FakeFleetManager()
+    task_manager = TaskManager(task_repo=repo, fleet_manager=fleet, task_events=TaskEventHub())
+    task_manager.dispatch_mode = "sync"
+    dispatcher = asyncio.create_task(task_manager.run_dispatcher())
+
+    # 1. 가용 로봇이 없으므로 sync 모드 생성도 배차 결과를 기다린 뒤 PENDING을 반환하고, 조회 결과가 캐시됩니다.
+    task = await task_manager.create_new_task(TaskType.ITEM_DELIVERY, requester_id=1,
+                                              details={"source": {"x": 0, "y": 0}, "destination": {"x": 1, "y": 1}})
+    assert task.status == TaskStatus.PENDING, task
+    for _ in range(3):
+        polled = await task_manager.get_task_by_id(task.id)
+        assert polled.status == TaskStatus.PENDING
+    assert db.reads == 0, "create 결과가 캐시되어 DB를 조회하지 않아야 합니다."
+
+    # 2. 로봇이 생겨 배차되면, 다음 조회는 ASSIGNED를 반환해야 합니다.
+    fleet.available.append(Robot(id=7, name="robot-7", pose_x=0, pose_y=0, battery_level=90))
+    dispatched = await task_manager.process_pending_tasks()
+    assert task.id in dispatched
+    polled = await task_manager.get_task_by_id(task.id)
+    assert polled.status == TaskStatus.ASSIGNED and polled.robot_id == 7, polled
+    assert TaskStatus(db.rows[task.id]["status"]) == TaskStatus.ASSIGNED
+
+    # 3. 로봇이 있으면 sync 모드 생성은 배정된 작업을 반환합니다.
+    fleet.available.append(Robot(id=8, name="robot-8", pose_x=0, pose_y=0, battery_level=90))
+    assigned = await task_manager.create_new_task(TaskType.ITEM_DELIVERY, requester_id=1,
+                                                  details={"source": {"x": 0, "y": 0}, "destination": {"x": 2, "y": 2}})
+    assert assigned.status == TaskStatus.ASSIGNED and assigned.robot_id == 8, assigned
+    dispatcher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await dispatcher
+
+    mode = "batch" if batch_mode else "in-order"
+    print(f"  {mode:8s}: 배정 후 조회 상태 {polled.status}, DB 조회 {db.reads}회, 캐시 {repo.get_stats()}")
+
+
+async def check_read_write_race(batch_write: bool):
+    db = SlowReadTaskRepository()
+    repo = CachedTaskRepository(db, maxsize=100, ttl=60)
+    task = await db.create({"task_type": TaskType.ITEM_DELIVERY, "requester_id": 1,
+                            "details": {"source": {"x": 0, "y": 0}, "destination": {"x": 1, "y": 1}}})
+
+    # 캐시 미스 조회가 PENDING 행을 읽은 뒤 멈춘 사이에 배정 쓰기가 끝납니다.
+    reader = asyncio.create_task(repo.get_by_id(task.id))
+    await db.read_started.wait()
+    assigned = {"status": TaskStatus.ASSIGNED, "robot_id": 7}
+    if batch_write:
+        await repo.update_many({task.id: assigned})
+    else:
+        await repo.update(task.id, assigned)
+    db.release.set()
+    stale = await reader
+    assert stale.status == TaskStatus.PENDING  # 쓰기 전에 읽은 값은 그대로 반환됩니다.
+
+    # 다음 조회가 이전 PENDING 행을 캐시에서 돌려주면 안 됩니다.
+    polled = await repo.get_by_id(task.id)
+    assert polled.status == TaskStatus.ASSIGNED, polled
+    assert not repo._reads, "조회가 끝난 키의 세대 번호는 남지 않아야 합니다."
+    write = "update_many" if batch_write else "update"
+    print(f"  race({write}): 경쟁 조회 후 다음 조회 상태 {polled.status}")
+
+
+def check_eviction_and_ttl():
+    now = [0.0]
+    cache: TTLCache[str] = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"       # 1이 최근 사용됨
+    cache.set(3, "c")                # 가장 오래 사용되지 않은 2를 내보냄
+    assert cache.get(2) is None and cache.get(1) == "a" and len(cache) == 2
+    now[0] = 11.0
+    assert cache.get(1) is None      # TTL 만료
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1 and stats["expirations"] == 1
+    print(f"  LRU/TTL : {stats}")
+
+
+async def main():
+    print("작업 캐시 일관성 점검")
+    await check_assignment(batch_mode=False)
+    await check_assignment(batch_mode=True)
+    await check_read_write_race(batch_write=False)
+    await check_read_write_race(batch_write=True)
+    check_eviction_and_ttl()
+    print("OK")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+목적지 간 이동 비용 표(TravelCostMatrix) 점검 및 벤치마크.
+격자 위에 목적지를 배치하고 벽(WALL) / 금지 구역(RESTRICTED) / 감속 구역(SLOW_ZONE)을 무작위로 둔 뒤,
+- Floyd–Warshall 결과가 노드별 Dijkstra 결과와 같은지,
+- 구역을 켜고 끌 때의 부분 갱신 결과가 전체 재계산 결과와 같은지 (동시에 들어온 변경 포함),
+- 같은 입력으로 다시 만들면 캐시 파일을 사용하는지 확인하고, 각 단계의 소요 시간을 출력합니다.
+
+실행: python -m scripts.check_travel_costs [--grid 12] [--zones 20] [--toggles 30]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from main_server.core_layer.navigation.travel_cost import TravelCostMatrix, dijkstra, floyd_warshall
+from main_server.domains.locations.location import Location, LocationType
+from main_server.domains.zones.map_zone import MapZone
+
+
+def make_office(grid: int, zone_count: int, rng: random.Random):
+    spacing = 3.0
+    locations = [
+        Location(id=i * grid + j + 1, name=f"loc-{i}-{j}", type=LocationType.OFFICE,
+                 x=i * spacing + rng.uniform(-0.5, 0.5), y=j * spacing + rng.uniform(-0.5, 0.5),
+                 is_restricted=rng.random() < 0.05)
+        for i in range(grid) for j in range(grid)
+    ]
+    zones = []
+    for zone_id in range(1, zone_count + 1):
+        x, y = rng.uniform(0, grid * spacing), rng.uniform(0, grid * spacing)
+        if rng.random() < 0.5:
+            # 가늘고 긴 벽
+            w, h = (rng.uniform(4, 12), 0.2) if rng.random() < 0.5 else (0.2, rng.uniform(4, 12))
+        else:
+            w, h = rng.uniform(1, 4), rng.uniform(1, 4)
+        zone_type = rng.choice(["WALL", "RESTRICTED", "SLOW_ZONE"])
+        zones.append(MapZone(id=zone_id, name=f"zone-{zone_id}", type=zone_type, active=rng.random() < 0.7,
+                             polygon=[(x, y), (x + w, y), (x + w, y + h), (x, y + h)]))
+    return locations, zones
+
+
+def assert_same(a: np.ndarray, b: np.ndarray, what: str):
+    same = (np.isinf(a) == np.isinf(b)).all() and np.allclose(a[np.isfinite(a)], b[np.isfinite(b)], rtol=1e-4, atol=1e-3)
+    assert same, f"{what}: 결과가 다릅니다."
+
+
+def main(grid: int, zone_count: int, toggles: int):
+    rng = random.Random(0)
+    locations, zones = make_office(grid, zone_count, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "travel_costs.npz")
+        matrix = TravelCostMatrix(cache_path=cache_path)
+
+        start = time.perf_counter()
+        assert not matrix.build(locations, zones)
+        build_ms = (time.perf_counter() - start) * 1e3
+        n = len(matrix)
+        print(f"노드 {n}개, 구역 {zone_count}개 (경로 영향 {len(matrix._zone_masks)}개), "
+              f"비용 표 {matrix.costs.nbytes / 1024:.1f} KiB")
+        print(f"  전체 계산 (기하 + Floyd–Warshall): {build_ms:8.1f} ms")
+
+        sources = rng.sample(range(n), min(5, n))
+        assert_same(matrix.costs[sources].astype(np.float64), dijkstra(matrix._weights, sources), "Dijkstra 비교")
+
+        # 같은 입력이면 캐시 파일을 사용합니다.
+        cached = TravelCostMatrix(cache_path=cache_path)
+        start = time.perf_counter()
+        assert cached.build(locations, zones)
+        print(f"  캐시 파일 사용              : {(time.perf_counter() - start) * 1e3:8.1f} ms")
+        assert_same(cached.costs, matrix.costs, "캐시 비교")
+
+        # 구역을 켜고 끌 때 부분 갱신 결과가 전체 재계산과 같아야 합니다.
+        update_ms = []
+        for _ in range(toggles):
+            zone_id = rng.choice(list(matrix._zone_masks))
+            start = time.perf_counter()
+            matrix.apply_zone_active(zone_id, not matrix._zones[zone_id].active)
+            update_ms.append((time.perf_counter() - start) * 1e3)
+            assert_same(matrix.costs.astype(np.float64), floyd_warshall(matrix._weights), f"구역 {zone_id} 토글")
+        print(f"  구역 토글 부분 갱신 (평균)  : {np.mean(update_ms):8.1f} ms, {matrix.get_stats()}")
+
+        # 관리자 PATCH 여러 건이 동시에 들어와도 모든 변경이 반영되어야 합니다.
+        zone_ids = rng.sample(list(matrix._zone_masks), min(6, len(matrix._zone_masks)))
+        expected = {zone_id: not matrix._zones[zone_id].active for zone_id in zone_ids}
+
+        async def toggle_concurrently():
+            await asyncio.gather(*(matrix.set_zone_active(zone_id, active) for zone_id, active in expected.items()))
+        asyncio.run(toggle_concurrently())
+        assert all(matrix._zones[zone_id].active == active for zone_id, active in expected.items())
+        assert_same(matrix.costs.astype(np.float64), floyd_warshall(matrix._edge_weights()), "동시 구역 토글")
+        print(f"  동시 구역 토글 {len(expected)}건      : 모두 반영됨")
+
+        # 배차 시 조회: 로봇 50대 × 작업 20개
+        robots = np.random.default_rng(0).uniform(0, grid * 3.0, size=(50, 2))
+        targets = matrix.node_xy[:20]
+        start = time.perf_counter()
+        for _ in range(100):
+            matrix.distance_matrix(robots, targets)
+        print(f"  배차 비용 조회 (50×20)      : {(time.perf_counter() - start) * 10:8.3f} ms")
+    print("OK")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--grid", type=int, default=12, help="목적지 격자 한 변의 개수 (노드 수 = grid^2)")
+    parser.add_argument("--zones", type=int, default=20)
+    parser.add_argument("--toggles", type=int, default=30)
+    args = parser.parse_args()
+    main(args.grid, args.zones, args.toggles)
@@ -0,0 +1,170 @@
+"""
+작업 생성 API 지연 시간 부하 테스트.
+DB 대신 쓰기마다 --db-ms 만큼 지연하는 인메모리 리포지토리로 실제 TaskManager / FleetManager를 구동하고,
+--concurrency 개의 요청을 동시에 보내며 TASK_DISPATCH_MODE별 작업 생성의 p50 / p99 지연 시간을 측정합니다.
+  - sync : 대기 큐에 넣고 디스패처(run_dispatcher)의 배차 결과를 기다려 배정된 작업을 반환 (201)
+  - async: 대기 큐에 넣고 디스패처에 배차를 요청한 뒤 PENDING 작업을 바로 반환 (202)
+응답 상태별 개수(201: 배정됨 / 202: PENDING)와 모든 작업이 배정될 때까지의 시간도 함께 출력합니다.
+
+실행: python -m scripts.load_test_task_creation [--requests 500] [--concurrency 50] [--db-ms 2]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from main_server.core_layer.fleet_management.fleet_manager import FleetManager
+from main_server.core_layer.task_management.task_events import TaskEventHub
+from main_server.core_layer.task_management.task_manager import TaskManager
+from main_server.domains.robots.robot import Robot, RobotStatus
+from main_server.domains.robots.robot_repository import IRobotRepository
+from main_server.domains.tasks.task import Task, TaskStatus, TaskType
+from main_server.infrastructure.communication.ros_bridge import MockRobotCommunicator
+from main_server.infrastructure.database.telemetry_writer import TelemetryWriter
+from main_server.web.connection_manager import ConnectionManager
+from main_server.web.fleet_stream import FleetStatusStream
+from scripts.check_task_cache import InMemoryTaskRepository
+
+
+class SlowTaskRepository(InMemoryTaskRepository):
+    """쓰기마다 DB 왕복 지연을 흉내 내는 인메모리 작업 리포지토리 (round_trips: 쓰기 왕복 횟수)"""
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    async def create(self, data: Dict[str, Any]) -> Task:
+        await self._round_trip()
+        return await super().create(data)
+
+    async def update(self, task_id: int, update_data: Dict[str, Any],
+                     current: Optional[Task] = None) -> Optional[Task]:
+        await self._round_trip()
+        return await super().update(task_id, update_data, current=current)
+
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        await self._round_trip()
+        return await super().update_many(updates)
+
+
+class SlowRobotRepository(IRobotRepository):
+    """쓰기마다 DB 왕복 지연을 흉내 내는 인메모리 로봇 리포지토리 (round_trips: 쓰기 왕복 횟수)"""
+    def __init__(self, robots: List[Robot], latency: float):
+        self.robots = {robot.id: robot for robot in robots}
+        self.latency = latency
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    async def get_by_id(self, robot_id: int) -> Optional[Robot]:
+        return self.robots.get(robot_id)
+
+    async def get_all(self) -> List[Robot]:
+        return list(self.robots.values())
+
+    async def find_by_status(self, status: RobotStatus) -> List[Robot]:
+        return [robot for robot in self.robots.values() if robot.status == status]
+
+    async def create(self, name: str, battery_level: float) -> Robot:
+        raise NotImplementedError
+
+    async def update(self, robot_id: int, update_data: dict,
+                     current: Optional[Robot] = None) -> Optional[Robot]:
+        await self._round_trip()
+        robot = self.robots[robot_id].model_copy(update=update_data)
+        self.robots[robot_id] = robot
+        return robot
+
+    async def update_many(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        await self._round_trip()
+        for robot_id, fields in updates.items():
+            self.robots[robot_id] = self.robots[robot_id].model_copy(update=fields)
+        return len(updates)
+
+    async def save_telemetry_batch(self, telemetry: Dict[int, Dict[str, Any]]) -> int:
+        return len(telemetry)
+
+    async def delete(self, robot_id: int) -> bool:
+        return self.robots.pop(robot_id, None) is not None
+
+
+async def run(mode: str, requests: int, concurrency: int, latency: float) -> Dict[str, float]:
+    robots = [
+        Robot(id=i, name=f"robot-{i}", battery_level=90.0, pose_x=float(i % 20), pose_y=float(i // 20))
+        for i in range(1, requests + 1)
+    ]
+    robot_repo = SlowRobotRepository(robots, latency)
+    fleet_manager = FleetManager(
+        robot_repo=robot_repo,
+        robot_communicator=MockRobotCommunicator(),
+        ai_service=None,
+        status_stream=FleetStatusStream(ConnectionManager()),
+        telemetry_writer=TelemetryWriter(robot_repo),
+        task_events=TaskEventHub(),
+    )
+    await fleet_manager.load_fleet_state()
+    task_manager = TaskManager(task_repo=SlowTaskRepository(latency), fleet_manager=fleet_manager,
+                               task_events=TaskEventHub())
+    task_manager.dispatch_mode = mode
+    dispatcher = asyncio.create_task(task_manager.run_dispatcher())
+
+    latencies: List[float] = []
+    responses = {201: 0, 202: 0}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create_one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            task = await task_manager.create_new_task(TaskType.ITEM_DELIVERY, requester_id=1,
+                                                      details={"source": {"x": 0, "y": 0},
+                                                               "destination": {"x": i % 20, "y": i // 20}})
+            latencies.append(time.perf_counter() - start)
+            # employee_routes.create_new_task와 같은 기준으로 응답 코드를 셉니다.
+            responses[202 if task.status == TaskStatus.PENDING else 201] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(create_one(i) for i in range(requests)))
+    # 디스패처가 남은 대기 작업을 모두 배정할 때까지 기다립니다.
+    while len(task_manager.pending_queue) or len(fleet_manager.get_available_robots()) > 0:
+        await asyncio.sleep(latency or 0.001)
+    total = time.perf_counter() - start
+
+    dispatcher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await dispatcher
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies) * 1e3,
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3,
+        "total": total * 1e3,
+        "responses": responses,
+    }
+
+
+async def main(requests: int, concurrency: int, db_ms: float):
+    print(f"요청 {requests}개, 동시성 {concurrency}, DB 왕복 {db_ms} ms, 로봇 {requests}대")
+    for mode in ("sync", "async"):
+        # 배차 과정의 print 출력은 측정에서 제외합니다.
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = await run(mode, requests, concurrency, db_ms / 1000)
+        print(f"  {mode:5s}: 생성 p50 {result['p50']:7.2f} ms, p99 {result['p99']:7.2f} ms, "
+              f"전체 배정 완료 {result['total']:8.1f} ms, 응답 {result['responses']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-ms", type=float, default=2.0, help="인메모리 DB 쓰기 지연 (ms)")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.db_ms))
@@ -154,3 +154,10 @@ ALTER TABLE `System_Logs` ADD FOREIGN KEY (`robot_id`) REFERENCES `Robots` (`rob
 ALTER TABLE `Robot_Telemetry_Logs` ADD FOREIGN KEY (`robot_id`) REFERENCES `Robots` (`robot_id`);
 
 ALTER TABLE `Notification_Logs` ADD FOREIGN KEY (`user_id`) REFERENCES `Users` (`user_id`);
+
+-- 작업 이력 keyset 페이지네이션 ((created_at, task_id) 내림차순) 용 복합 인덱스
+CREATE INDEX `idx_tasks_created` ON `Tasks` (`created_at`, `task_id`);
+
+CREATE INDEX `idx_tasks_requester_created` ON `Tasks` (`requester_id`, `created_at`, `task_id`);
+
+CREATE INDEX `idx_tasks_status_created` ON `Tasks` (`status`, `created_at`, `task_id`);